@@ -0,0 +1,31 @@
+import os
+import sys
+import argparse
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.balance import run_balance
+
+def bench_scaling(num_games, max_turns, max_workers):
+    workers = 1
+    baseline = None
+    while workers <= max_workers:
+        results = run_balance(num_games, max_turns=max_turns, seed=0, workers=workers)
+        rate = results['games'] / results['elapsed']
+        baseline = baseline or rate
+        print(f"{workers:>3} workers: {rate:8.1f} games/sec "
+              f"(speedup {rate / baseline:.2f}x, efficiency {rate / baseline / workers:.0%})")
+        workers *= 2
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Monte Carlo balance runs across worker counts")
+    parser.add_argument('--games', type=int, default=500)
+    parser.add_argument('--turns', type=int, default=200)
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+    bench_scaling(args.games, args.turns, args.max_workers)
+
+if __name__ == "__main__":
+    main()
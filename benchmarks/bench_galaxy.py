@@ -0,0 +1,41 @@
+import os
+import sys
+import time
+import argparse
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.galaxy import GalaxyGenerator
+from src.universe import UniverseGenerator
+
+def bench_galaxy(num_planets, seed=42):
+    start = time.perf_counter()
+    galaxy = GalaxyGenerator(seed).generate(num_planets)
+    elapsed = time.perf_counter() - start
+    lanes = len(galaxy.lane_sources)
+    print(f"{num_planets:>8} planets: {elapsed:7.2f}s ({num_planets / elapsed:>10.0f} planets/sec), "
+          f"{lanes} lanes ({2 * lanes / num_planets:.1f} per planet)")
+
+def bench_universe(num_planets, seed=42):
+    start = time.perf_counter()
+    universe = UniverseGenerator(num_planets=num_planets, seed=seed)
+    elapsed = time.perf_counter() - start
+    print(f"{num_planets:>8} planet universe (objects, network, routes): {elapsed:7.2f}s "
+          f"({len(universe.planets) / elapsed:>10.0f} planets/sec)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark procedural galaxy generation")
+    parser.add_argument('--max-planets', type=int, default=1000000)
+    args = parser.parse_args()
+
+    for num_planets in [10000, 100000, 1000000]:
+        if num_planets <= args.max_planets:
+            bench_galaxy(num_planets)
+    for num_planets in [1000, 10000]:
+        if num_planets <= args.max_planets:
+            bench_universe(num_planets)
+
+if __name__ == "__main__":
+    main()
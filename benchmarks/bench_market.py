@@ -0,0 +1,83 @@
+import os
+import sys
+import time
+import random
+from types import SimpleNamespace
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.economy import EconomySimulator
+from src.commodities import CommodityRegistry, RARITIES
+
+def make_registry(num_commodities, num_categories=10):
+    # Synthetic catalogue shaped like data/commodities.json
+    catalogue = {f"category_{c}": [] for c in range(num_categories)}
+    for i in range(num_commodities):
+        catalogue[f"category_{i % num_categories}"].append({
+            'name': f"commodity_{i}",
+            'base_price': random.uniform(50, 500),
+            'volume_per_unit': random.uniform(0.2, 5.0),
+            'rarity': random.choice(RARITIES),
+            'regions': random.sample(["Mining Planets", "Trading Hubs", "Research Stations", "Oceanic Worlds"], 2),
+            'price_volatility': random.uniform(0.05, 0.2)
+        })
+    return CommodityRegistry(catalogue)
+
+def make_planets(num_planets, resource_names):
+    # Lightweight stand-ins: the market only needs name, economy_level and resources
+    return [
+        SimpleNamespace(
+            name=f"Planet {i}",
+            economy_level=random.uniform(0.3, 1.0),
+            resources={r: random.uniform(0.1, 1.0) for r in random.sample(resource_names, 4)}
+        )
+        for i in range(num_planets)
+    ]
+
+def bench_market(num_planets, num_commodities, ticks=20):
+    registry = make_registry(num_commodities)
+    planets = make_planets(num_planets, registry.categories)
+
+    start = time.perf_counter()
+    economy = EconomySimulator(planets, registry=registry)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(ticks):
+        economy.update_market()
+    tick_time = (time.perf_counter() - start) / ticks
+
+    start = time.perf_counter()
+    for planet in planets[:1000]:
+        economy.calculate_price("commodity_0", planet)
+    lookup_time = (time.perf_counter() - start) / min(1000, len(planets))
+
+    print(f"{num_planets:>7} planets x {num_commodities:>4} commodities: "
+          f"build {build_time * 1000:8.1f} ms, tick {tick_time * 1000:8.2f} ms, "
+          f"lookup {lookup_time * 1e6:6.2f} us")
+
+def bench_registry(num_commodities, lookups=100000):
+    start = time.perf_counter()
+    registry = make_registry(num_commodities)
+    build_time = time.perf_counter() - start
+
+    names = [f"commodity_{random.randrange(num_commodities)}" for _ in range(lookups)]
+    start = time.perf_counter()
+    for name in names:
+        registry.volume(name)
+        registry.category(name)
+    lookup_time = (time.perf_counter() - start) / lookups
+
+    print(f"{num_commodities:>7} commodity registry: build {build_time * 1000:8.1f} ms, "
+          f"lookup {lookup_time * 1e6:6.2f} us")
+
+def main():
+    for num_planets, num_commodities in [(10, 6), (1000, 100), (5000, 200), (10000, 300)]:
+        bench_market(num_planets, num_commodities)
+    for num_commodities in [100, 10000, 100000]:
+        bench_registry(num_commodities)
+
+if __name__ == "__main__":
+    main()
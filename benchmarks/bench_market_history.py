@@ -0,0 +1,59 @@
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.economy import EconomySimulator
+from src.market_history import MarketHistory
+from src.universe import UniverseGenerator
+
+def bench_market_history(num_planets, ticks, window=100):
+    universe = UniverseGenerator(num_planets=num_planets, seed=42)
+    economy = EconomySimulator(universe.planets)
+
+    with tempfile.TemporaryDirectory() as directory:
+        history = MarketHistory(os.path.join(directory, 'history.dat'), economy.planet_names, economy.commodity_names)
+
+        record_time = 0.0
+        for turn in range(ticks):
+            economy.update_market()
+            start = time.perf_counter()
+            history.record(turn, economy)
+            record_time += time.perf_counter() - start
+        history.close()
+        size = os.path.getsize(history.path)
+
+        # Reopen and read windows from the end of the history
+        start = time.perf_counter()
+        history = MarketHistory(history.path, [], [])
+        records = history.window(len(history) - window)
+        mean_price = float(records['prices'].mean())
+        window_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        turns, prices, _ = history.series(economy.commodity_names[0], economy.planet_names[0])
+        full_series = float(prices.mean())
+        series_time = time.perf_counter() - start
+        history.close()
+
+    print(f"{num_planets:>6} planets x {ticks:>6} ticks ({size / 1e6:7.1f} MB): "
+          f"record {record_time / ticks * 1000:6.2f} ms/tick, "
+          f"last {window} ticks {window_time * 1000:7.1f} ms, "
+          f"one series over all ticks {series_time * 1000:7.1f} ms")
+    return mean_price, full_series
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the memory-mapped market history")
+    parser.add_argument('--planets', type=int, default=1000)
+    parser.add_argument('--ticks', type=int, default=2000)
+    args = parser.parse_args()
+
+    bench_market_history(args.planets, args.ticks)
+
+if __name__ == "__main__":
+    main()
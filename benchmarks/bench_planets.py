@@ -0,0 +1,59 @@
+import os
+import sys
+import time
+import argparse
+import tracemalloc
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.galaxy import GalaxyGenerator
+from src.universe import planets_from_galaxy
+
+class DictPlanet:
+    # The previous Planet: one instance __dict__ plus nested dicts and an eager history string
+    def __init__(self, planet):
+        self.name = planet.name
+        self.type = planet.type
+        self.economy_level = planet.economy_level
+        self.resources = planet.resources
+        self.status = planet.status
+        self.characteristics = planet.characteristics
+        self.demographics = planet.demographics
+        self.planet_class = planet.planet_class
+        self.moons = planet.moons
+        self.geology = planet.geology
+        self.climate = planet.climate
+        self.history = planet.history
+        self.coordinates = planet.coordinates
+
+def measure(build):
+    tracemalloc.start()
+    start = time.perf_counter()
+    planets = build()
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return planets, size, elapsed
+
+def bench_planets(num_planets, seed=42):
+    galaxy = GalaxyGenerator(seed).generate(num_planets)
+    planets, packed_size, packed_time = measure(lambda: planets_from_galaxy(galaxy))
+    _, dict_size, dict_time = measure(lambda: [DictPlanet(planet) for planet in planets])
+
+    print(f"{num_planets:>8} planets: packed {packed_size / num_planets:6.0f} B/planet ({packed_time:.2f}s), "
+          f"dict {dict_size / num_planets:6.0f} B/planet ({dict_time:.2f}s), "
+          f"{dict_size / packed_size:.1f}x smaller")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Planet memory footprint")
+    parser.add_argument('--max-planets', type=int, default=10000)
+    args = parser.parse_args()
+
+    for num_planets in [1000, 10000, 100000]:
+        if num_planets <= args.max_planets:
+            bench_planets(num_planets)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import os
+import sys
+import time
+import random
+
+import networkx as nx
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.routes import RouteTable
+
+class Node:
+    # Minimal planet stand-in: the route table only needs a name
+    def __init__(self, name):
+        self.name = name
+
+def make_network(num_planets, degree=6):
+    planets = [Node(f"Planet {i}") for i in range(num_planets)]
+    graph = nx.Graph()
+    graph.add_nodes_from(planets)
+    # Ring for connectivity plus random lanes
+    for i in range(num_planets):
+        graph.add_edge(planets[i], planets[(i + 1) % num_planets], distance=random.uniform(1, 10))
+        for _ in range(degree // 2 - 1):
+            graph.add_edge(planets[i], random.choice(planets), distance=random.uniform(1, 10))
+    return planets, graph
+
+def bench_routes(num_planets, queries=10000):
+    planets, graph = make_network(num_planets)
+
+    start = time.perf_counter()
+    routes = RouteTable(planets, graph.edges(data='distance'))
+    build_time = time.perf_counter() - start
+
+    # Queries from a handful of hubs, like a ship moving around a region
+    hubs = random.sample(planets, min(20, num_planets))
+    pairs = [(random.choice(planets), random.choice(hubs)) for _ in range(queries)]
+
+    start = time.perf_counter()
+    for a, b in pairs:
+        routes.distance(a, b)
+    first_pass = (time.perf_counter() - start) / queries
+
+    start = time.perf_counter()
+    for a, b in pairs:
+        routes.distance(a, b)
+    cached_pass = (time.perf_counter() - start) / queries
+
+    start = time.perf_counter()
+    routes.add_planet(Node("Frontier"), {planets[0]: 5.0})
+    add_time = time.perf_counter() - start
+
+    mode = "eager" if routes.eager else "lazy"
+    print(f"{num_planets:>6} planets ({mode}): build {build_time * 1000:8.1f} ms, "
+          f"query {first_pass * 1e6:8.1f} us first / {cached_pass * 1e6:5.2f} us cached, "
+          f"add planet {add_time * 1000:6.2f} ms")
+
+def main():
+    for num_planets in [10, 100, 500, 2000, 10000]:
+        bench_routes(num_planets)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.engine import GameEngine
+from src.economy import EconomySimulator
+from src.universe import UniverseGenerator
+from src import savegame
+from src.journal import ActionJournal
+
+def make_engine(num_planets, seed=42):
+    engine = GameEngine()
+    engine.universe = UniverseGenerator(num_planets=num_planets, seed=seed)
+    engine.economy = EconomySimulator(engine.universe.planets)
+    engine.start()
+    return engine
+
+def bench_savegame(num_planets, compress):
+    engine = make_engine(num_planets)
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, 'bench.sav')
+
+        start = time.perf_counter()
+        savegame.save_game(engine, filename, compress=compress)
+        save_time = time.perf_counter() - start
+        size = os.path.getsize(filename)
+
+        start = time.perf_counter()
+        savegame.load_game(GameEngine(), filename)
+        load_time = time.perf_counter() - start
+
+    label = "zlib" if compress else "raw"
+    print(f"{num_planets:>8} planets ({label:>4}): save {save_time * 1000:7.1f} ms, "
+          f"load {load_time * 1000:7.1f} ms, {size / 1e6:7.2f} MB ({size / num_planets:.0f} B/planet)")
+
+def bench_autosave(num_planets, actions=1000):
+    # Journaled actions against a full snapshot of the same game
+    engine = make_engine(num_planets)
+    with tempfile.TemporaryDirectory() as directory:
+        journal = ActionJournal(os.path.join(directory, 'autosave.sav'))
+        start = time.perf_counter()
+        journal.attach(engine)
+        snapshot_time = time.perf_counter() - start
+
+        commodity = engine.economy.commodity_names[0]
+        start = time.perf_counter()
+        for _ in range(actions // 2):
+            engine.buy(commodity, 1)
+            engine.sell(commodity, 1)
+        action_time = (time.perf_counter() - start) / actions
+        journal.close()
+
+    print(f"{num_planets:>8} planets autosave: snapshot {snapshot_time * 1000:7.1f} ms, "
+          f"journaled trade {action_time * 1e6:7.1f} us")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark binary save/load")
+    parser.add_argument('--max-planets', type=int, default=100000)
+    args = parser.parse_args()
+
+    for num_planets in [1000, 10000, 100000]:
+        if num_planets <= args.max_planets:
+            for compress in (False, True):
+                bench_savegame(num_planets, compress)
+            bench_autosave(num_planets)
+
+if __name__ == "__main__":
+    main()
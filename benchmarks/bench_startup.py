@@ -0,0 +1,73 @@
+import os
+import sys
+import time
+import argparse
+import subprocess
+import tempfile
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+MAIN = os.path.join(project_root, 'src', 'main.py')
+FIRST_PROMPT = "Enter your choice"
+
+def sandbox(directory, **env):
+    # Run the CLI in a scratch directory that also receives its autosave and price history
+    return {'cwd': directory, 'env': dict(os.environ, CARGO_HAULER_SAVES=directory, **env)}
+
+def import_times(directory, top=15):
+    """Cumulative import time per top-level package when the CLI starts and quits."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', MAIN],
+        input="11\n", capture_output=True, text=True, **sandbox(directory)
+    )
+    totals = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        # Only top-level entries: nested imports are already in their parent's cumulative time
+        if name.startswith('  ') or name.strip().startswith('_'):
+            continue
+        package = name.strip().split('.')[0]
+        totals[package] = totals.get(package, 0) + int(cumulative)
+
+    print("Cumulative import time by module:")
+    for package, micros in sorted(totals.items(), key=lambda item: item[1], reverse=True)[:top]:
+        print(f"  {package:<20} {micros / 1000:8.1f} ms")
+    print(f"  {'total':<20} {sum(totals.values()) / 1000:8.1f} ms")
+
+def time_to_first_prompt(directory):
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, MAIN],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+        text=True, **sandbox(directory, COLUMNS='120')
+    )
+    output = ""
+    while FIRST_PROMPT not in output:
+        char = process.stdout.read(1)
+        if not char:
+            break
+        output += char
+    elapsed = time.perf_counter() - start
+    process.communicate("11\n")
+    return elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CLI startup")
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--budget', type=float, default=0.5, help="Target time to first prompt in seconds")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        import_times(directory)
+        timings = sorted(time_to_first_prompt(directory) for _ in range(args.runs))
+    median = timings[len(timings) // 2]
+    verdict = "within" if median <= args.budget else "OVER"
+    print(f"Time to first prompt: median {median * 1000:.0f} ms, best {timings[0] * 1000:.0f} ms "
+          f"({verdict} the {args.budget * 1000:.0f} ms budget)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import os
+import sys
+import time
+import argparse
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.engine import GameEngine
+
+def stack_depth():
+    frame = sys._getframe()
+    depth = 0
+    while frame is not None:
+        depth += 1
+        frame = frame.f_back
+    return depth
+
+def bench_turns(num_turns):
+    engine = GameEngine()
+    engine.start()
+    # Unlimited fuel so the ship never gets stranded
+    engine.player.fuel_tank_capacity = engine.player.fuel_level = float('inf')
+
+    planets = engine.universe.planets
+    depths = []
+
+    def shuttle():
+        depths.append(stack_depth())
+        destination = planets[(planets.index(engine.current_planet) + 1) % len(planets)]
+        engine.travel(destination)
+
+    start = time.perf_counter()
+    while engine.turn < num_turns:
+        if not engine.scheduler.run_turn(shuttle):
+            break
+    elapsed = time.perf_counter() - start
+
+    stats = engine.scheduler.stats()
+    print(f"Turns played: {stats['turns']} in {elapsed:.2f}s ({stats['turns'] / elapsed:.0f} turns/sec)")
+    print(f"Stack depth in action phase: min {min(depths)}, max {max(depths)}")
+    print(f"Turn processing: mean {stats['mean_turn_us']:.1f} us, "
+          f"recent mean {stats['recent_mean_turn_us']:.1f} us, max {stats['max_turn_us']:.1f} us")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark headless turn processing")
+    parser.add_argument('--turns', type=int, default=100000)
+    args = parser.parse_args()
+    bench_turns(args.turns)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+import sys
+import os
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.rng import RandomContext
+from src.simulation import POLICIES, run_game
+
+def is_bankrupt(engine):
+    """Can't afford a single unit of anything where the ship is and has nothing to sell."""
+    economy = engine.economy
+    cheapest = economy.row_prices(economy.planet_row(engine.current_planet)).min()
+    return engine.player.credits < cheapest and not engine.player.inventory
+
+def play_games(policy_name, seeds, max_turns, difficulty):
+    """
+    Play one batch of seeded games (runs inside a worker process).
+
+    Returns:
+        dict: Per-game outcome arrays for the batch
+    """
+    count = len(seeds)
+    credits = np.zeros((count, max_turns + 1))
+    levels = np.zeros(count, dtype=np.int32)
+    turns = np.zeros(count, dtype=np.int32)
+    bankrupt = np.zeros((count, max_turns + 1), dtype=bool)
+    stranded = np.zeros(count, dtype=bool)
+
+    for game, seed in enumerate(seeds):
+        history = credits[game]
+        history[0] = 10000
+        broke = bankrupt[game]
+
+        def sample(engine):
+            history[engine.turn] = engine.player.credits
+            broke[engine.turn] = is_bankrupt(engine)
+
+        engine = run_game(POLICIES[policy_name](), max_turns, difficulty, seed=seed, on_turn=sample)
+        # Games that end early keep their final state for the remaining turns
+        history[engine.turn + 1:] = engine.player.credits
+        broke[engine.turn + 1:] = broke[engine.turn]
+
+        levels[game] = engine.player.level
+        turns[game] = engine.turn
+        stranded[game] = engine.turn < max_turns and not engine.game_over
+
+    return {'credits': credits, 'levels': levels, 'turns': turns, 'bankrupt': bankrupt, 'stranded': stranded}
+
+def run_balance(num_games, policy_name='greedy', max_turns=200, difficulty=2, seed=0, workers=None, batch_size=None):
+    """
+    Play `num_games` independent seeded games across a process pool.
+
+    Every game gets its own seed spawned from `seed`, so results don't depend
+    on how games are spread over workers and a run can be repeated exactly.
+    Games are sent to workers in batches to keep inter-process traffic low.
+
+    Args:
+        num_games (int): Number of games
+        policy_name (str): Key into simulation.POLICIES
+        max_turns (int): Turn limit per game
+        difficulty (int): Universe difficulty
+        seed (int): Root seed for the whole run
+        workers (int): Worker processes (default: CPU count)
+        batch_size (int): Games per task (default: spread evenly, 4 tasks per worker)
+
+    Returns:
+        dict: Outcome arrays for all games plus timing
+    """
+    workers = workers or os.cpu_count() or 1
+    seeds = [child.seed for child in RandomContext(seed).spawn(num_games)]
+    batch_size = batch_size or max(1, num_games // (workers * 4))
+    batches = [seeds[i:i + batch_size] for i in range(0, num_games, batch_size)]
+
+    start = time.perf_counter()
+    if workers == 1:
+        parts = [play_games(policy_name, batch, max_turns, difficulty) for batch in batches]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(play_games, [policy_name] * len(batches), batches,
+                                  [max_turns] * len(batches), [difficulty] * len(batches)))
+    elapsed = time.perf_counter() - start
+
+    results = {key: np.concatenate([part[key] for part in parts]) for key in parts[0]}
+    results.update({'games': num_games, 'workers': workers, 'elapsed': elapsed})
+    return results
+
+def results_table(results, every=10):
+    """
+    Summary table: credit distribution at every `every`-th turn.
+
+    Returns:
+        pandas.DataFrame: One row per sampled turn
+    """
+    import pandas as pd
+    credits = results['credits']
+    sampled_turns = np.arange(0, credits.shape[1], every)
+    sampled = credits[:, sampled_turns]
+    # Bankruptcy is judged per turn as in `summary`, which reads the final turn
+    return pd.DataFrame({
+        'turn': sampled_turns,
+        'mean_credits': sampled.mean(axis=0),
+        'p10_credits': np.percentile(sampled, 10, axis=0),
+        'median_credits': np.median(sampled, axis=0),
+        'p90_credits': np.percentile(sampled, 90, axis=0),
+        'bankrupt_rate': results['bankrupt'][:, sampled_turns].mean(axis=0),
+        # Games that stopped early (stranded) repeat their last state; this is the share still being played
+        'playing_rate': (results['turns'][:, None] >= sampled_turns).mean(axis=0)
+    })
+
+def summary(results):
+    levels, counts = np.unique(results['levels'], return_counts=True)
+    return {
+        'games': results['games'],
+        'games_per_sec': results['games'] / results['elapsed'] if results['elapsed'] > 0 else 0.0,
+        'mean_turns': float(results['turns'].mean()),
+        'bankruptcy_rate': float(results['bankrupt'][:, -1].mean()),
+        'stranded_rate': float(results['stranded'].mean()),
+        'mean_final_credits': float(results['credits'][:, -1].mean()),
+        'level_distribution': {int(level): int(count) for level, count in zip(levels, counts)}
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo balance runs over many seeded games")
+    parser.add_argument('--games', type=int, default=1000)
+    parser.add_argument('--turns', type=int, default=200)
+    parser.add_argument('--difficulty', type=int, default=2)
+    parser.add_argument('--policy', choices=sorted(POLICIES), default='greedy')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--every', type=int, default=10, help="Turn interval of the credits table")
+    parser.add_argument('--output', help="Write the credits table to this CSV file")
+    args = parser.parse_args()
+
+    results = run_balance(args.games, args.policy, args.turns, args.difficulty, args.seed, args.workers)
+    stats = summary(results)
+    table = results_table(results, args.every)
+
+    print(f"Played {stats['games']} games on {results['workers']} workers in {results['elapsed']:.2f}s "
+          f"({stats['games_per_sec']:.1f} games/sec)")
+    print(f"Mean turns per game: {stats['mean_turns']:.1f}")
+    print(f"Bankruptcy rate: {stats['bankruptcy_rate']:.1%}, stranded rate: {stats['stranded_rate']:.1%}")
+    print(f"Mean final credits: {stats['mean_final_credits']:.1f}")
+    print(f"Level reached: {stats['level_distribution']}")
+    print(table.to_string(index=False, float_format=lambda value: f"{value:.1f}"))
+    if args.output:
+        table.to_csv(args.output, index=False)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+import numpy as np
+
+from src.commodities import CommodityRegistry
+
+class CargoHold:
+    """
+    The ship's cargo hold, one lot per commodity, in parallel arrays.
+
+    Lots occupy slots [0, len(hold)) of `ids` (commodity ids from the
+    registry), `quantities` and `costs` (average price paid per unit).
+    `slot_of[id]` locates a commodity's lot (-1 when there is none), and
+    removing a lot moves the last one into its slot. Adding, removing and
+    looking up cargo are therefore O(1), however many lots the hold
+    carries. Space is measured in volume: a unit takes its commodity's
+    `volume_per_unit`. `used` is updated with every change and checked
+    against `capacity`.
+
+    Invalid operations raise ValueError and leave the hold as it was. The
+    batch operations check the whole batch before changing anything, so
+    they apply completely or not at all.
+
+    For reading, the hold behaves like the old inventory dict:
+    `hold[name]` gives {'quantity', 'buy_price', 'volume_per_unit'}.
+    """
+
+    def __init__(self, capacity=100, registry=None, size=8):
+        self.registry = registry if registry is not None else CommodityRegistry.load()
+        self.capacity = capacity
+        self.used = 0.0
+        self.count = 0
+        self.ids = np.zeros(size, dtype=np.int32)
+        self.quantities = np.zeros(size, dtype=np.int64)
+        self.costs = np.zeros(size, dtype=np.float64)
+        self.slot_of = np.full(len(self.registry.names), -1, dtype=np.int32)
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, name):
+        return self._slot(name) >= 0
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __eq__(self, other):
+        if isinstance(other, CargoHold):
+            other = other.state()
+        return self.state() == other
+
+    def __getitem__(self, name):
+        slot = self._slot(name)
+        if slot < 0:
+            raise KeyError(name)
+        return self._lot(slot)
+
+    def get(self, name, default=None):
+        slot = self._slot(name)
+        return self._lot(slot) if slot >= 0 else default
+
+    def keys(self):
+        return [self.registry.names[commodity_id] for commodity_id in self.ids[:self.count].tolist()]
+
+    def items(self):
+        return [(self.registry.names[self.ids[slot]], self._lot(slot)) for slot in range(self.count)]
+
+    @property
+    def free(self):
+        return self.capacity - self.used
+
+    def _slot(self, name):
+        commodity_id = self.registry.index.get(name)
+        return -1 if commodity_id is None else int(self.slot_of[commodity_id])
+
+    def _lot(self, slot):
+        commodity_id = int(self.ids[slot])
+        return {
+            'quantity': int(self.quantities[slot]),
+            'buy_price': float(self.costs[slot]),
+            'volume_per_unit': float(self.registry.volumes[commodity_id])
+        }
+
+    def quantity(self, name):
+        slot = self._slot(name)
+        return int(self.quantities[slot]) if slot >= 0 else 0
+
+    def volume(self, lots):
+        """Cargo volume of (commodity, quantity, ...) lots."""
+        return sum(quantity * float(self.registry.volumes[self._id(name)]) for name, quantity, *_ in lots)
+
+    def _id(self, name):
+        commodity_id = self.registry.index.get(name)
+        if commodity_id is None:
+            raise ValueError(f"Unknown commodity: {name}")
+        return commodity_id
+
+    def _merge(self, lots, with_price):
+        # Batch lots per commodity id: total quantity and, when buying, total cost
+        merged = {}
+        for lot in lots:
+            name, quantity = lot[0], int(lot[1])
+            if quantity <= 0:
+                raise ValueError(f"Invalid quantity of {name}: {quantity}")
+            total = merged.setdefault(self._id(name), [0, 0.0])
+            total[0] += quantity
+            if with_price:
+                total[1] += quantity * float(lot[2])
+        ids = np.fromiter(merged, dtype=np.int32, count=len(merged))
+        quantities = np.array([total[0] for total in merged.values()], dtype=np.int64)
+        values = np.array([total[1] for total in merged.values()], dtype=np.float64)
+        return ids, quantities, values
+
+    def add(self, name, quantity, price_per_unit):
+        self.add_many([(name, quantity, price_per_unit)])
+
+    def add_many(self, lots):
+        """
+        Load several lots at once.
+
+        Args:
+            lots (iterable): (commodity, quantity, price per unit) tuples
+
+        Raises:
+            ValueError: Unknown commodity, non-positive quantity or not enough space
+        """
+        ids, quantities, values = self._merge(lots, with_price=True)
+        volume = float(quantities @ self.registry.volumes[ids])
+        if self.used + volume > self.capacity + 1e-9:
+            raise ValueError("Not enough cargo space")
+
+        slots = self.slot_of[ids]
+        new = slots < 0
+        if new.any():
+            first = self.count
+            self._reserve(first + int(new.sum()))
+            slots[new] = np.arange(first, first + int(new.sum()), dtype=np.int32)
+            self.ids[slots[new]] = ids[new]
+            self.slot_of[ids[new]] = slots[new]
+            self.count += int(new.sum())
+
+        # Average cost over what was held and what is added
+        held = self.quantities[slots]
+        self.costs[slots] = (held * self.costs[slots] + values) / (held + quantities)
+        self.quantities[slots] = held + quantities
+        self.used = round(self.used + volume, 2)
+
+    def remove(self, name, quantity):
+        """Unload units of one commodity; returns their average cost per unit."""
+        return float(self.remove_many([(name, quantity)])[0])
+
+    def remove_many(self, lots):
+        """
+        Unload several lots at once.
+
+        Args:
+            lots (iterable): (commodity, quantity) tuples
+
+        Returns:
+            numpy.ndarray: Average cost per unit of each commodity, in order of first appearance
+
+        Raises:
+            ValueError: Unknown commodity, non-positive quantity or more than the hold carries
+        """
+        ids, quantities, _ = self._merge(lots, with_price=False)
+        slots = self.slot_of[ids]
+        missing = (slots < 0) | (self.quantities[np.maximum(slots, 0)] < quantities)
+        if missing.any():
+            raise ValueError(f"Not enough {self.registry.names[ids[missing.argmax()]]} in cargo")
+
+        costs = self.costs[slots].copy()
+        self.quantities[slots] -= quantities
+        self.used = round(self.used - float(quantities @ self.registry.volumes[ids]), 2)
+        # Descending, so every slot filled from the end holds a lot that is kept
+        for slot in sorted(slots[self.quantities[slots] == 0].tolist(), reverse=True):
+            self._delete(slot)
+        if not self.count:
+            self.used = 0.0
+        return costs
+
+    def _delete(self, slot):
+        last = self.count - 1
+        self.slot_of[self.ids[slot]] = -1
+        if slot != last:
+            self.ids[slot] = self.ids[last]
+            self.quantities[slot] = self.quantities[last]
+            self.costs[slot] = self.costs[last]
+            self.slot_of[self.ids[slot]] = slot
+        self.quantities[last] = 0
+        self.count = last
+
+    def _reserve(self, size):
+        if size > len(self.ids):
+            size = max(size, 2 * len(self.ids))
+            for name in ('ids', 'quantities', 'costs'):
+                array = getattr(self, name)
+                grown = np.zeros(size, dtype=array.dtype)
+                grown[:len(array)] = array
+                setattr(self, name, grown)
+
+    def clear(self):
+        self.slot_of[self.ids[:self.count]] = -1
+        self.quantities[:self.count] = 0
+        self.count = 0
+        self.used = 0.0
+
+    def state(self):
+        """Lots as the JSON inventory dict saves use (commodity -> lot)."""
+        return dict(self.items())
+
+    def restore(self, inventory):
+        """Replace the cargo with a saved inventory dict; commodities no longer in the catalogue are dropped."""
+        self.clear()
+        lots = [
+            (name, lot['quantity'], lot['buy_price']) for name, lot in inventory.items()
+            if name in self.registry.index and lot['quantity'] > 0
+        ]
+        if lots:
+            # One lot per commodity, so the saved cost per unit is stored as is rather than re-averaged
+            ids = np.array([self.registry.index[name] for name, _, _ in lots], dtype=np.int32)
+            quantities = np.array([int(quantity) for _, quantity, _ in lots], dtype=np.int64)
+            self._reserve(len(ids))
+            self.count = len(ids)
+            self.ids[:self.count] = ids
+            self.quantities[:self.count] = quantities
+            self.costs[:self.count] = [float(price) for _, _, price in lots]
+            self.slot_of[ids] = np.arange(self.count, dtype=np.int32)
+            # A save may hold more than the capacity (e.g. a catalogue volume changed); keep it all
+            self.used = round(float(quantities @ self.registry.volumes[ids]), 2)
@@ -0,0 +1,137 @@
+import json
+import os
+
+import numpy as np
+
+RARITIES = ["common", "uncommon", "rare", "very_rare"]
+
+# Catalogue regions are written per world kind ("Mining Planets", "Mining
+# Worlds"); this maps them onto the planet types the universe generates.
+REGION_PLANET_TYPES = {
+    "Mining Planets": "Mining",
+    "Mining Worlds": "Mining",
+    "Industrial Planets": "Industrial",
+    "Industrial Worlds": "Industrial",
+    "Agricultural Planets": "Agricultural",
+    "Oceanic Worlds": "Oceanic",
+    "High-Tech Planets": "High-Tech",
+    "High-Tech Worlds": "High-Tech",
+    "Research Stations": "Research Colony",
+    "Trading Hubs": "Trading Hub",
+    "Frontier Worlds": "Frontier"
+}
+
+DEFAULT_CATALOGUE = os.path.join(os.path.dirname(__file__), '../data/commodities.json')
+
+class CommodityRegistry:
+    """
+    The commodity catalogue from data/commodities.json, indexed for lookups.
+
+    Every commodity gets an id (its position in `names`, which is also its
+    market column). Per-commodity numbers live in parallel NumPy arrays
+    (`base_prices`, `volatility`, `volumes`, `category_ids`, `rarity_ids`) and
+    the name, category, rarity, region and planet type indexes are dicts, so
+    every lookup is O(1) however large the catalogue gets.
+    """
+
+    _loaded = {}  # catalogue path -> registry, so each file is parsed once
+
+    def __init__(self, catalogue):
+        self.names = []
+        self.index = {}
+        self.categories = []
+        self.descriptions = []
+        self.regions = []
+        category_ids, rarity_ids, base_prices, volatility, volumes = [], [], [], [], []
+
+        self.by_category = {}
+        self.by_rarity = {}
+        self.by_region = {}
+        self.by_planet_type = {}
+        for category, items in catalogue.items():
+            self.categories.append(category)
+            self.by_category[category] = []
+            for item in items:
+                commodity_id = len(self.names)
+                self.names.append(item['name'])
+                self.index[item['name']] = commodity_id
+                self.descriptions.append(item.get('description', ''))
+                self.regions.append(item.get('regions', []))
+
+                category_ids.append(len(self.categories) - 1)
+                rarity_ids.append(RARITIES.index(item.get('rarity', 'common')))
+                base_prices.append(item['base_price'])
+                volatility.append(item['price_volatility'])
+                volumes.append(item.get('volume_per_unit', 1.0))
+
+                self.by_category[category].append(commodity_id)
+                self.by_rarity.setdefault(item.get('rarity', 'common'), []).append(commodity_id)
+                planet_types = set()
+                for region in item.get('regions', []):
+                    self.by_region.setdefault(region, []).append(commodity_id)
+                    if region in REGION_PLANET_TYPES:
+                        planet_types.add(REGION_PLANET_TYPES[region])
+                for planet_type in planet_types:
+                    self.by_planet_type.setdefault(planet_type, []).append(commodity_id)
+
+        self.category_ids = np.array(category_ids, dtype=np.int32)
+        self.rarity_ids = np.array(rarity_ids, dtype=np.int32)
+        self.base_prices = np.array(base_prices, dtype=np.float64)
+        self.volatility = np.array(volatility, dtype=np.float64)
+        self.volumes = np.array(volumes, dtype=np.float64)
+
+    @classmethod
+    def load(cls, path=DEFAULT_CATALOGUE):
+        path = os.path.abspath(path)
+        if path not in cls._loaded:
+            with open(path, 'r') as file:
+                cls._loaded[path] = cls(json.load(file))
+        return cls._loaded[path]
+
+    def __len__(self):
+        return len(self.names)
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def id(self, name):
+        return self.index[name]
+
+    def category(self, name):
+        return self.categories[self.category_ids[self.index[name]]]
+
+    def rarity(self, name):
+        return RARITIES[self.rarity_ids[self.index[name]]]
+
+    def volume(self, name):
+        return float(self.volumes[self.index[name]])
+
+    def describe(self, name):
+        """Catalogue entry for one commodity, as a dict."""
+        commodity_id = self.index[name]
+        return {
+            'name': name,
+            'category': self.categories[self.category_ids[commodity_id]],
+            'base_price': float(self.base_prices[commodity_id]),
+            'volume_per_unit': float(self.volumes[commodity_id]),
+            'rarity': RARITIES[self.rarity_ids[commodity_id]],
+            'description': self.descriptions[commodity_id],
+            'regions': self.regions[commodity_id],
+            'price_volatility': float(self.volatility[commodity_id])
+        }
+
+    def in_category(self, category):
+        return [self.names[i] for i in self.by_category.get(category, ())]
+
+    def with_rarity(self, rarity):
+        return [self.names[i] for i in self.by_rarity.get(rarity, ())]
+
+    def in_region(self, region):
+        return [self.names[i] for i in self.by_region.get(region, ())]
+
+    def native_to(self, planet_type):
+        """Commodities whose catalogue regions include worlds of this planet type."""
+        return [self.names[i] for i in self.by_planet_type.get(planet_type, ())]
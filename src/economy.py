@@ -1,83 +1,577 @@
-import random
-import json
-import pandas as pd
-import os
+import heapq
+
+import numpy as np
+
+from src.commodities import CommodityRegistry
+from src.galaxy import RESOURCE_TYPES
+from src.universe import Planet, planets_to_table
+
+# Supply and demand, per tick. Every planet imports a trickle of each
+# commodity and produces those in its resource categories (scaled by the
+# resource value); consumption takes a share of the stock that grows with
+# the planet's economy level. Stock therefore settles where supply meets
+# consumption: high on producer worlds, low on rich consumer worlds.
+BASE_SUPPLY = 5.0
+PRODUCTION = 15.0
+CONSUMPTION_RATE = 0.08
+MAX_STOCK = 100000
+
+# Prices scale with (REFERENCE_STOCK / stock) ** ELASTICITY, within the factor bounds
+REFERENCE_STOCK = 125.0
+ELASTICITY = 0.5
+MIN_STOCK_FACTOR = 0.25
+MAX_STOCK_FACTOR = 4.0
+
+def stock_factor(stock):
+    """Price multiplier for a stock level (scalar or array): scarce goods cost more."""
+    return np.clip((REFERENCE_STOCK / np.maximum(stock, 1)) ** ELASTICITY, MIN_STOCK_FACTOR, MAX_STOCK_FACTOR)
+
+class MarketShocks:
+    """
+    Temporary price modifiers on parts of the market (crashes, booms).
+
+    A shock multiplies prices by `strength` when it starts and fades linearly
+    back to no effect over `duration` ticks, when it expires. It covers a set
+    of planet rows (None: every planet) and commodity columns (None: every
+    commodity). Stored prices are never touched: shocks are indexed by planet
+    row, plus a list of galaxy-wide ones, and applied when a price is read, so
+    a read only looks at the shocks covering its planet and starting, fading
+    or ending a shock reprices nothing. Expiry pops a heap ordered by end tick.
+    """
+
+    def __init__(self):
+        self.tick = 0
+        self.active = {}        # shock id -> shock
+        self.by_planet = {}     # planet row -> {shock id}
+        self.everywhere = set() # ids of shocks covering every planet
+        self.expiry = []        # heap of (end tick, shock id)
+        self._next_id = 1
+
+    def __len__(self):
+        return len(self.active)
+
+    def add(self, strength, duration, rows=None, columns=None):
+        """
+        Start a shock at the current tick.
+
+        Args:
+            strength (float): Price multiplier when the shock starts
+            duration (int): Ticks until it has faded out
+            rows (iterable): Planet rows it covers, or None for every planet
+            columns (iterable): Commodity columns it covers, or None for every commodity
+
+        Returns:
+            int: Shock id
+        """
+        shock_id = self._next_id
+        self._next_id += 1
+        shock = {
+            'id': shock_id,
+            'strength': float(strength),
+            'start': self.tick,
+            'duration': max(int(duration), 1),
+            'rows': None if rows is None else sorted({int(row) for row in rows}),
+            'columns': None if columns is None else np.unique(np.asarray(columns, dtype=np.intp))
+        }
+        self.active[shock_id] = shock
+        heapq.heappush(self.expiry, (shock['start'] + shock['duration'], shock_id))
+        if shock['rows'] is None:
+            self.everywhere.add(shock_id)
+        else:
+            for row in shock['rows']:
+                self.by_planet.setdefault(row, set()).add(shock_id)
+        return shock_id
+
+    def remove(self, shock_id):
+        shock = self.active.pop(shock_id, None)
+        if shock is None:
+            return
+        if shock['rows'] is None:
+            self.everywhere.discard(shock_id)
+        else:
+            for row in shock['rows']:
+                ids = self.by_planet[row]
+                ids.discard(shock_id)
+                if not ids:
+                    del self.by_planet[row]
+
+    def advance(self):
+        """Move on one tick and drop the shocks that have faded out; returns how many expired."""
+        self.tick += 1
+        expired = 0
+        while self.expiry and self.expiry[0][0] <= self.tick:
+            _, shock_id = heapq.heappop(self.expiry)
+            if shock_id in self.active:
+                self.remove(shock_id)
+                expired += 1
+        return expired
+
+    def multiplier(self, shock):
+        """Current multiplier of one shock."""
+        remaining = 1.0 - (self.tick - shock['start']) / shock['duration']
+        return 1.0 + (shock['strength'] - 1.0) * max(remaining, 0.0)
+
+    def covering(self, row):
+        """Active shocks covering planet `row`."""
+        ids = self.by_planet.get(row, ())
+        if self.everywhere:
+            ids = self.everywhere.union(ids)
+        return [self.active[shock_id] for shock_id in ids]
+
+    def factor(self, row, column):
+        """Combined multiplier for one cell (1.0 when nothing applies)."""
+        value = 1.0
+        for shock in self.covering(row):
+            if shock['columns'] is None or column in shock['columns']:
+                value *= self.multiplier(shock)
+        return value
+
+    def row_factors(self, row, width):
+        """Multipliers for every commodity of planet `row`, or None when no shock covers it."""
+        shocks = self.covering(row)
+        if not shocks:
+            return None
+        factors = np.ones(width)
+        for shock in shocks:
+            columns = slice(None) if shock['columns'] is None else shock['columns']
+            factors[columns] *= self.multiplier(shock)
+        return factors
+
+    def apply(self, prices):
+        """Multiply the shocked cells of a planet x commodity price matrix in place."""
+        for shock_id in self.everywhere:
+            shock = self.active[shock_id]
+            columns = slice(None) if shock['columns'] is None else shock['columns']
+            prices[:, columns] *= self.multiplier(shock)
+        for row, ids in self.by_planet.items():
+            if row >= len(prices):
+                continue
+            for shock_id in ids:
+                shock = self.active[shock_id]
+                columns = slice(None) if shock['columns'] is None else shock['columns']
+                prices[row, columns] *= self.multiplier(shock)
+        return prices
+
+    def state(self):
+        """JSON-serialisable tick and active shocks."""
+        return {
+            'tick': self.tick,
+            'shocks': [
+                dict(shock, columns=None if shock['columns'] is None else shock['columns'].tolist())
+                for shock in self.active.values()
+            ]
+        }
+
+    def restore(self, state):
+        """Replace every shock with the ones saved by `state`."""
+        self.__init__()
+        for shock in sorted(state['shocks'], key=lambda shock: shock['id']):
+            self.tick = shock['start']
+            self._next_id = shock['id']
+            self.add(shock['strength'], shock['duration'], shock['rows'], shock['columns'])
+        self.tick = state['tick']
+
+class MarketSnapshot:
+    """
+    Display view of the market at one `version` of the economy.
+
+    Planet rows are formatted into table cells on first request and kept, and
+    name filters are cached too, so paging through the market screen (or
+    reopening it in the same turn) formats each visible row once and never
+    touches the rows that aren't shown.
+    """
+
+    def __init__(self, version, planet_names, commodity_names, row_prices):
+        self.version = version
+        self.planet_names = list(planet_names)
+        self.commodity_names = commodity_names
+        self.row_prices = row_prices  # planet row -> price array
+        self._cells = {}
+        self._matches = {}
+
+    def __len__(self):
+        return len(self.planet_names)
+
+    def matching(self, text=""):
+        """Rows whose planet name contains `text` (case-insensitive); every row for ''."""
+        text = text.lower()
+        rows = self._matches.get(text)
+        if rows is None:
+            if text:
+                rows = [row for row, name in enumerate(self.planet_names) if text in name.lower()]
+            else:
+                rows = list(range(len(self.planet_names)))
+            self._matches[text] = rows
+        return rows
+
+    def cells(self, row):
+        """Formatted price cells for one planet row."""
+        cells = self._cells.get(row)
+        if cells is None:
+            cells = [f"{price:.1f}" for price in self.row_prices(row).tolist()]
+            self._cells[row] = cells
+        return cells
 
 class EconomySimulator:
-    def __init__(self, planets):
+    """
+    Market engine holding the whole galaxy market as dense planet x commodity arrays.
+
+    Rows follow `planet_index` (planet name -> row), columns follow the
+    commodity registry's ids (`commodity_index`, name -> column). `update_market` moves stock
+    by supply and consumption and reprices every cell in one batched NumPy
+    operation per tick; `calculate_price` is a plain indexed lookup into the
+    current price matrix.
+
+    A price is the cell's fundamental price (base price, economy level,
+    resources and the tick's random variation) times `stock_factor` of its
+    stock. Trades move stock and reprice their cell immediately, and are
+    charged the price at the midpoint of the stock change, so buying and
+    selling the same units back costs the same both ways.
+
+    Market shocks (`shocks`, see MarketShocks) scale the prices of some
+    planets and commodities for a while. They are not written into `prices`:
+    every price read (`calculate_price`, `trade_price`, `row_prices`,
+    `effective_prices`) applies the shocks covering its cells.
+
+    `version` goes up whenever the market changes (ticks, shocks, new
+    planets, loading), so views derived from it can be cached until then.
+    """
+
+    def __init__(self, planets, registry=None, rng=None):
         self.planets = planets
-        self.commodities = self.generate_commodities()
-        self.market_data = {planet.name: {commodity: {'price': self.calculate_price(commodity, planet), 'quantity': random.randint(50, 200)} for commodity in self.commodities} for planet in self.planets}
-
-    def generate_commodities(self):
-        commodity_types = [
-            "raw_materials",
-            "agricultural_goods",
-            "technological_goods",
-            "luxury_goods",
-            "industrial_goods",
-            "fuel"  # Adding fuel as a commodity
-        ]
-
-        commodities = {}
-        for commodity in commodity_types:
-            commodities[commodity] = {
-                'base_price': random.uniform(50, 500),
-                'price_volatility': random.uniform(0.05, 0.2)
-            }
-
-        return commodities
+        self.registry = registry if registry is not None else CommodityRegistry.load()
+        # NumPy Generator (the game's 'market' stream), or a seed for one
+        self.rng = np.random.default_rng(rng)
+
+        # Commodity columns, in catalogue order. Base prices are copied because
+        # loading a save replaces them for this game only.
+        self.commodity_names = self.registry.names
+        self.commodity_index = self.registry.index
+        self.base_prices = self.registry.base_prices.copy()
+        self.volatility = self.registry.volatility
+
+        # Planet rows
+        self.planet_names = []
+        self.planet_index = {}
+        self.economy_levels = np.empty(0, dtype=np.float64)
+        self.resource_multipliers = np.empty((0, len(self.commodity_names)), dtype=np.float64)
+        self.fundamental_prices = np.empty((0, len(self.commodity_names)), dtype=np.float64)
+        self.prices = np.empty((0, len(self.commodity_names)), dtype=np.float64)
+        self.quantities = np.empty((0, len(self.commodity_names)), dtype=np.int64)
+        self.supply = np.empty((0, len(self.commodity_names)), dtype=np.float64)
+        self.consumption_rates = np.empty(0, dtype=np.float64)
+        self.shocks = MarketShocks()
+        self.version = 0
+        self._snapshot = None
+        self.add_planets(planets)
+
+    def add_planets(self, planets):
+        """Register new planet rows in bulk and price them immediately."""
+        new_planets = []
+        seen = set(self.planet_index)
+        for planet in planets:
+            if planet.name not in seen:
+                seen.add(planet.name)
+                new_planets.append(planet)
+        if not new_planets:
+            return
+
+        first_row = len(self.planet_names)
+        for offset, planet in enumerate(new_planets):
+            self.planet_index[planet.name] = first_row + offset
+            self.planet_names.append(planet.name)
+
+        # A planet's resource value for a category prices every commodity in it;
+        # categories the planet has no resource entry for get the default 0.5
+        multipliers = np.full((len(new_planets), len(self.commodity_names)), 0.5, dtype=np.float64)
+        for columns, rows, values in self.resource_cells(new_planets):
+            multipliers[np.ix_(rows, columns)] = values[:, None]
+
+        levels = np.array([planet.economy_level for planet in new_planets], dtype=np.float64)
+        quantities = self.rng.integers(50, 201, size=multipliers.shape)
+        fundamental_prices = self.compute_prices(levels, multipliers)
+
+        self.economy_levels = np.concatenate([self.economy_levels, levels])
+        self.resource_multipliers = np.vstack([self.resource_multipliers, multipliers])
+        self.quantities = np.vstack([self.quantities, quantities])
+        self.fundamental_prices = np.vstack([self.fundamental_prices, fundamental_prices])
+        self.prices = np.vstack([self.prices, self.stock_prices(fundamental_prices, quantities)])
+        self.supply = np.vstack([self.supply, self.supply_rates(new_planets)])
+        self.consumption_rates = np.concatenate([self.consumption_rates, CONSUMPTION_RATE * levels])
+        self.version += 1
+
+    def restore(self, planets, planet_names, commodity_names, base_prices, economy_levels, resource_multipliers, prices, quantities, fundamental_prices=None, shocks=None):
+        """
+        Replace the market with saved arrays.
+
+        Saved commodity columns are matched to the current catalogue by name;
+        commodities added to the catalogue since the save are priced afresh.
+        Supply rates are derived from `planets` (the restored universe's).
+        `shocks` is the saved `MarketShocks.state()`, if any.
+        """
+        columns = [self.commodity_index.get(name) for name in commodity_names]
+        known = [saved for saved, column in enumerate(columns) if column is not None]
+        current = [columns[saved] for saved in known]
+        shape = (len(planet_names), len(self.commodity_names))
+
+        self.planets = planets
+        self.planet_names = list(planet_names)
+        self.planet_index = {name: row for row, name in enumerate(self.planet_names)}
+        self.economy_levels = np.asarray(economy_levels, dtype=np.float64)
+        self.base_prices[current] = base_prices[known]
+        self.resource_multipliers = np.full(shape, 0.5, dtype=np.float64)
+        self.resource_multipliers[:, current] = resource_multipliers[:, known]
+        self.quantities = np.empty(shape, dtype=np.int64)
+        self.quantities[:, current] = quantities[:, known]
+        self.prices = np.empty(shape, dtype=np.float64)
+        self.prices[:, current] = prices[:, known]
+        self.fundamental_prices = np.empty(shape, dtype=np.float64)
+        if fundamental_prices is not None:
+            self.fundamental_prices[:, current] = fundamental_prices[:, known]
+        else:
+            # Prices include their stock factor; saves from before supply and demand
+            # have no fundamental prices, so they are derived from that
+            self.fundamental_prices[:, current] = np.round(self.prices[:, current] / stock_factor(self.quantities[:, current]), 2)
+        new = np.setdiff1d(np.arange(shape[1]), current)
+        if len(new):
+            fresh = self.compute_prices(self.economy_levels, self.resource_multipliers)[:, new]
+            stock = self.rng.integers(50, 201, size=(shape[0], len(new)))
+            self.quantities[:, new] = stock
+            self.fundamental_prices[:, new] = fresh
+            self.prices[:, new] = self.stock_prices(fresh, stock)
+
+        if [planet.name for planet in planets] != self.planet_names:
+            by_name = {planet.name: planet for planet in planets}
+            planets = [by_name[name] for name in self.planet_names]
+        self.supply = self.supply_rates(planets)
+        self.consumption_rates = CONSUMPTION_RATE * self.economy_levels
+
+        self.shocks = MarketShocks()
+        if shocks is not None:
+            # Shocked columns follow their commodities to the current catalogue
+            for shock in shocks['shocks']:
+                if shock['columns'] is not None:
+                    shock['columns'] = [columns[saved] for saved in shock['columns'] if columns[saved] is not None]
+            self.shocks.restore(shocks)
+        self.version += 1
+
+    def add_planet(self, planet):
+        self.add_planets([planet])
+
+    def compute_prices(self, economy_levels, resource_multipliers):
+        # Fundamental prices, broadcast over whole rows:
+        # base * (1 + variation) * economy_level * resource_multiplier
+        variation = self.rng.uniform(-1.0, 1.0, size=resource_multipliers.shape) * self.volatility
+        prices = self.base_prices * (1.0 + variation) * economy_levels[:, None] * resource_multipliers
+        return np.round(prices, 2)
+
+    def stock_prices(self, fundamental_prices, quantities):
+        return np.round(fundamental_prices * stock_factor(quantities), 2)
+
+    def resource_cells(self, planets):
+        """
+        Planet resources grouped by commodity category, for bulk assignment.
+
+        Packed Planet records are read in one pass from their `resources`
+        column (NaN where a planet has no such resource); other planet objects
+        through their `resources` mapping. Resources are matched to the
+        registry's categories by name.
+
+        Returns:
+            list: (commodity columns, planet rows, resource values) per category
+        """
+        if all(isinstance(planet, Planet) for planet in planets):
+            table = planets_to_table(planets)['resources']
+            by_resource = {resource: table[:, position] for position, resource in enumerate(RESOURCE_TYPES)}
+        else:
+            by_resource = {}
+            for row, planet in enumerate(planets):
+                for resource, value in planet.resources.items():
+                    if resource in self.registry.by_category:
+                        by_resource.setdefault(resource, np.full(len(planets), np.nan))[row] = value
+
+        cells = []
+        for category, columns in self.registry.by_category.items():
+            values = by_resource.get(category)
+            if not columns or values is None:
+                continue
+            rows = np.flatnonzero(~np.isnan(values))
+            if len(rows):
+                cells.append((columns, rows, values[rows].astype(np.float64)))
+        return cells
+
+    def supply_rates(self, planets):
+        """Units of each commodity arriving per tick on each planet: imports plus production."""
+        supply = np.full((len(planets), len(self.commodity_names)), BASE_SUPPLY, dtype=np.float64)
+        for columns, rows, values in self.resource_cells(planets):
+            supply[np.ix_(rows, columns)] += PRODUCTION * values[:, None]
+        return supply
+
+    def planet_row(self, planet):
+        row = self.planet_index.get(planet.name)
+        if row is None:
+            # Planets created after the market was built (e.g. frontier jumps)
+            self.add_planet(planet)
+            row = self.planet_index[planet.name]
+        return row
 
     def calculate_price(self, commodity, planet):
         # Ensure the commodity exists in our commodities dictionary
-        if commodity not in self.commodities:
+        column = self.commodity_index.get(commodity)
+        if column is None:
+            raise ValueError(f"Commodity {commodity} not found in market")
+
+        row = self.planet_row(planet)
+        price = float(self.prices[row, column])
+        if self.shocks:
+            price = round(price * self.shocks.factor(row, column), 2)
+        return price
+
+    def _cell(self, commodity, planet):
+        column = self.commodity_index.get(commodity)
+        if column is None:
             raise ValueError(f"Commodity {commodity} not found in market")
+        return self.planet_row(planet), column
 
-        # Safely extract commodity information
-        commodity_info = self.commodities[commodity]
+    def stock(self, commodity, planet):
+        row, column = self._cell(commodity, planet)
+        return int(self.quantities[row, column])
 
-        # Extract base price and volatility
-        base_price = commodity_info['base_price']
-        volatility = commodity_info['price_volatility']
+    def trade_price(self, commodity, planet, quantity):
+        """
+        Average unit price for trading `quantity` units: positive to buy from
+        the market, negative to sell to it. The price is the one at the
+        midpoint of the stock change.
+        """
+        row, column = self._cell(commodity, planet)
+        midpoint = self.quantities[row, column] - quantity / 2
+        price = float(self.fundamental_prices[row, column] * stock_factor(midpoint))
+        if self.shocks:
+            price *= self.shocks.factor(row, column)
+        return round(price, 2)
 
-        # Adjust price based on planet's economy and available resources
-        economy_multiplier = planet.economy_level
+    def average_prices(self, rows, quantities):
+        """
+        `trade_price` for every commodity at once, unrounded (for planning trades).
 
-        # Check if the planet has this commodity in its resources
-        resource_multiplier = planet.resources.get(commodity, 0.5)
+        Args:
+            rows: Planet row, or one planet row per commodity
+            quantities (numpy.ndarray): Units of each commodity; positive to buy, negative to sell
 
-        # Calculate price variation
-        price_variation = random.uniform(-volatility, volatility)
+        Returns:
+            numpy.ndarray: Average unit price of each commodity
+        """
+        columns = np.arange(len(self.commodity_names))
+        rows = np.broadcast_to(np.asarray(rows, dtype=np.intp), columns.shape)
+        prices = self.fundamental_prices[rows, columns] * stock_factor(self.quantities[rows, columns] - quantities / 2)
+        if self.shocks:
+            for row in np.unique(rows).tolist():
+                factors = self.shocks.row_factors(row, len(columns))
+                if factors is not None:
+                    here = rows == row
+                    prices[here] *= factors[here]
+        return prices
 
-        # Calculate final price
-        final_price = base_price * (1 + price_variation) * economy_multiplier * resource_multiplier
+    def apply_trades(self, planet, orders):
+        """
+        `apply_trade` for several commodities at one planet, with a single version bump.
 
-        return round(final_price, 2)
+        Args:
+            planet (Planet): Where the trades happen
+            orders (list): (commodity, quantity) pairs; positive quantities are bought, negative sold
+        """
+        row = self.planet_row(planet)
+        columns = np.array([self._cell(commodity, planet)[1] for commodity, _ in orders], dtype=np.intp)
+        quantities = np.array([quantity for _, quantity in orders], dtype=np.int64)
+        stock = np.clip(self.quantities[row, columns] - quantities, 0, MAX_STOCK)
+        self.quantities[row, columns] = stock
+        self.prices[row, columns] = self.stock_prices(self.fundamental_prices[row, columns], stock)
+        self.version += 1
 
-    def get_market_overview(self):
-        market_data = []
-        for planet in self.planets:
-            planet_prices = {
-                'Planet': planet.name,
-            }
-            for commodity in self.commodities:
-                planet_prices[commodity] = self.calculate_price(commodity, planet)
-            market_data.append(planet_prices)
+    def apply_trade(self, commodity, planet, quantity):
+        """Move `quantity` units out of the planet's stock (negative: into it) and reprice the cell."""
+        row, column = self._cell(commodity, planet)
+        self.quantities[row, column] = min(max(self.quantities[row, column] - quantity, 0), MAX_STOCK)
+        self.prices[row, column] = round(float(self.fundamental_prices[row, column] * stock_factor(self.quantities[row, column])), 2)
+        self.version += 1
+
+    def add_shock(self, strength, duration, planets=None, commodities=None):
+        """
+        Scale prices for a while, fading back to normal.
 
-        return pd.DataFrame(market_data)
+        Args:
+            strength (float): Price multiplier at the start, e.g. 0.5 for a crash
+            duration (int): Market ticks until prices are back to normal
+            planets (iterable): Planet rows affected, or None for the whole galaxy
+            commodities (iterable): Commodity names affected, or None for all of them
+
+        Returns:
+            int: Shock id, for `remove_shock`
+        """
+        columns = None
+        if commodities is not None:
+            columns = [self.commodity_index[name] for name in commodities]
+        shock_id = self.shocks.add(strength, duration, planets, columns)
+        self.version += 1
+        return shock_id
+
+    def remove_shock(self, shock_id):
+        self.shocks.remove(shock_id)
+        self.version += 1
+
+    def price_factors(self, rows):
+        """Shock multipliers for the given planet rows, as a rows x commodities array."""
+        factors = np.ones((len(rows), len(self.commodity_names)))
+        if self.shocks:
+            for position, row in enumerate(rows):
+                row_factors = self.shocks.row_factors(int(row), len(self.commodity_names))
+                if row_factors is not None:
+                    factors[position] = row_factors
+        return factors
+
+    def row_prices(self, row):
+        """Current prices of every commodity on planet `row`, shocks included."""
+        factors = self.shocks.row_factors(row, len(self.commodity_names)) if self.shocks else None
+        if factors is None:
+            return self.prices[row]
+        return np.round(self.prices[row] * factors, 2)
+
+    def effective_prices(self):
+        """The whole price matrix with shocks applied (a copy)."""
+        prices = self.prices.copy()
+        if self.shocks:
+            np.round(self.shocks.apply(prices), 2, out=prices)
+        return prices
+
+    def snapshot(self):
+        """Market view for display, rebuilt only after the market changed."""
+        if self._snapshot is None or self._snapshot.version != self.version:
+            self._snapshot = MarketSnapshot(self.version, self.planet_names, self.commodity_names, self.row_prices)
+        return self._snapshot
+
+    def get_market_overview(self):
+        # pandas is only needed for this table; importing it lazily keeps startup fast
+        import pandas as pd
+        overview = pd.DataFrame(self.effective_prices(), columns=self.commodity_names)
+        overview.insert(0, 'Planet', self.planet_names)
+        return overview
 
     def get_tradable_commodities(self, planet):
-        tradable = []
-        for category, items in planet.market.items():
-            for item, details in items.items():
-                if details['quantity'] > 0:
-                    tradable.append((category, item, details['price']))
-        return tradable
+        row = self.planet_row(planet)
+        in_stock = np.flatnonzero(self.quantities[row] > 0)
+        prices = self.row_prices(row)
+        return [(self.commodity_names[column], float(prices[column])) for column in in_stock]
 
     def update_market(self):
-        for planet in self.planets:
-            for commodity in self.commodities:
-                quantity = self.market_data[planet.name][commodity]['quantity']
-                price = self.calculate_price(commodity, planet)
-                self.market_data[planet.name][commodity]['price'] = price
-                self.market_data[planet.name][commodity]['quantity'] = quantity
\ No newline at end of file
+        # One batched step of every planet x commodity cell per tick: stock
+        # gains supply and loses consumption, then everything is repriced
+        flow = self.consumption_rates[:, None] * self.quantities
+        np.subtract(self.supply, flow, out=flow)
+        np.rint(flow, out=flow)
+        np.add(self.quantities, flow, out=self.quantities, casting='unsafe')
+        np.clip(self.quantities, 0, MAX_STOCK, out=self.quantities)
+        self.fundamental_prices = self.compute_prices(self.economy_levels, self.resource_multipliers)
+        self.prices = self.stock_prices(self.fundamental_prices, self.quantities)
+        # Shocks fade with the tick; they never touch the stored prices
+        self.shocks.advance()
+        self.version += 1
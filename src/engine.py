@@ -0,0 +1,644 @@
+import numpy as np
+
+from src.rng import RandomContext
+from src.universe import UniverseGenerator
+from src.player import Player
+from src.economy import EconomySimulator
+from src.events import EventGenerator
+from src.technologies import TechnologyTree
+from src.storyline import Storyline
+from src.scheduler import TurnScheduler
+from src.journal import journaled
+from src.trade_planner import TradeRoutePlanner
+from src.ledger import BUY
+
+# Commodity the ship burns; bought into the fuel tank rather than the cargo hold
+FUEL = 'Fuel'
+
+class NullConsole:
+    """Drop-in for rich's Console that discards all output (headless games)."""
+
+    def print(self, *args, **kwargs):
+        pass
+
+    def input(self, prompt=""):
+        raise RuntimeError("A headless game cannot prompt for input")
+
+class GameEngine:
+    """
+    Game state plus every action that can change it, without any console I/O.
+
+    Actions return True/False for success and report what happened through
+    `notify`, which does nothing here. The interactive CLI (`CargoHauler` in
+    main.py) subclasses the engine and overrides `notify` to print, while the
+    simulation driver (simulation.py) runs the engine as-is.
+    """
+
+    SHIP_COMPONENTS = [
+        ("Cargo Capacity", 5000),
+        ("Fuel Efficiency", 3000),
+        ("Ship Speed", 2000),
+        ("Life Support", 4000),
+        ("Radiation Shield", 6000),
+        ("Business Class Module", 8000)
+    ]
+
+    def __init__(self, difficulty=2, console=None, seed=None):
+        self.console = console if console is not None else NullConsole()
+        self.difficulty = difficulty
+        # Every random draw in the game comes from a named stream of this context,
+        # so the same seed replays the same game
+        self.rng = RandomContext(seed)
+
+        # Initialize game systems
+        self.universe = UniverseGenerator(difficulty, context=self.rng)
+        self.economy = EconomySimulator(self.universe.planets, rng=self.rng.generator('market'))
+        self.player = Player(self.console, self.rng.stream('passengers'), self.economy.registry)
+        self.event_generator = EventGenerator(self.rng.stream('events'))
+        self.register_event_handlers()
+        self.tech_tree = TechnologyTree()
+        self.storyline = Storyline()
+
+        # Game state
+        self.current_planet = None
+        self.game_over = False
+        self.status_changed = True
+        self.journal = None  # ActionJournal recording applied actions, if autosave is on
+        self.market_history = None  # MarketHistory recording every market tick, if enabled
+        self._route_planner = None
+
+        # Turn flow: lasting events expire and the quest board refreshes when a
+        # turn starts, the market ticks when it ends
+        self.scheduler = TurnScheduler()
+        self.scheduler.on(TurnScheduler.START, self.expire_events)
+        self.scheduler.on(TurnScheduler.START, self.refresh_quests)
+        self.scheduler.on(TurnScheduler.END, self.end_turn)
+
+    @property
+    def turn(self):
+        return self.scheduler.turn
+
+    def notify(self, message):
+        # Narration hook; headless games ignore it
+        pass
+
+    @property
+    def seed(self):
+        return self.rng.seed
+
+    def start(self):
+        self.current_planet = self.rng.stream('engine').choice(self.universe.planets)
+
+    def find_planet(self, name):
+        return next((planet for planet in self.universe.planets if planet.name == name), None)
+
+    # Trading
+
+    def cargo_space_for(self, commodity):
+        # Whole units of a commodity that fit in the free cargo volume
+        volume = self.economy.registry.volume(commodity)
+        return int(self.player.hold.free / volume)
+
+    def max_buy_quantity(self, commodity):
+        """Most units of `commodity` the ship can buy here: cargo space, stock and credits allowing."""
+        return self.affordable_quantity(commodity, self.cargo_space_for(commodity))
+
+    def affordable_quantity(self, commodity, limit):
+        """Most units of `commodity`, up to `limit`, that are in stock here and the player can pay for."""
+        planet = self.current_planet
+        limit = min(limit, self.economy.stock(commodity, planet))
+        # The average price rises with the quantity bought, so search for the largest affordable one
+        low, high = 0, max(limit, 0)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if middle * self.economy.trade_price(commodity, planet, middle) <= self.player.credits:
+                low = middle
+            else:
+                high = middle - 1
+        return low
+
+    @journaled
+    def buy(self, commodity, quantity):
+        if not 0 < quantity <= self.max_buy_quantity(commodity):
+            self.notify("[red]Invalid quantity.[/red]")
+            return False
+
+        price = self.economy.trade_price(commodity, self.current_planet, quantity)
+        if not self.player.add_cargo(commodity, quantity, price, self.current_planet.name, self.turn):
+            self.notify("[red]Purchase failed. Check your cargo space or credits.[/red]")
+            return False
+
+        self.economy.apply_trade(commodity, self.current_planet, quantity)
+        self.notify(f"[green]Bought {quantity} {commodity} for {quantity * price:.1f} credits[/green]")
+        self.status_changed = True
+        return True
+
+    @journaled
+    def sell(self, commodity, quantity):
+        if commodity not in self.player.inventory:
+            self.notify(f"[red]You don't have any {commodity} to sell.[/red]")
+            return False
+
+        available_quantity = self.player.hold.quantity(commodity)
+        if not 0 < quantity <= available_quantity:
+            self.notify("[red]Invalid quantity.[/red]")
+            return False
+
+        price = self.economy.trade_price(commodity, self.current_planet, -quantity)
+        if not self.player.sell_cargo(commodity, quantity, price, self.current_planet.name, self.turn):
+            self.notify("[red]Sale failed.[/red]")
+            return False
+
+        self.economy.apply_trade(commodity, self.current_planet, -quantity)
+        self.notify(f"[green]Sold {quantity} {commodity} for {quantity * price:.1f} credits[/green]")
+        self.status_changed = True
+        return True
+
+    @journaled
+    def trade_basket(self, orders):
+        """
+        Buy and sell several commodities here as one transaction.
+
+        Quantities are netted per commodity and priced like `buy` and `sell`.
+        Credits and cargo space are checked once for the whole basket, with
+        the sales counting towards both, and either every order is filled
+        or none is.
+
+        Args:
+            orders (list): (commodity, quantity) pairs; positive quantities buy, negative sell
+
+        Returns:
+            bool: True if the basket was filled
+        """
+        planet = self.current_planet
+        net = {}
+        try:
+            for commodity, quantity in orders:
+                if commodity not in self.economy.commodity_index:
+                    self.notify(f"[red]Unknown commodity: {commodity}[/red]")
+                    return False
+                net[commodity] = net.get(commodity, 0) + int(quantity)
+        except (ValueError, TypeError):
+            self.notify("[red]Orders are (commodity, quantity) pairs.[/red]")
+            return False
+
+        buys, sells = [], []
+        for commodity, quantity in net.items():
+            stock = self.economy.stock(commodity, planet)
+            if quantity > stock:
+                self.notify(f"[red]Only {stock} {commodity} in stock.[/red]")
+                return False
+            if quantity > 0:
+                buys.append((commodity, quantity, self.economy.trade_price(commodity, planet, quantity)))
+            elif quantity < 0:
+                sells.append((commodity, -quantity, self.economy.trade_price(commodity, planet, quantity)))
+        if not buys and not sells:
+            self.notify("[red]The order is empty.[/red]")
+            return False
+
+        if not self.player.trade_basket(buys, sells, planet.name, self.turn):
+            self.notify("[red]Order rejected. Check your cargo, cargo space and credits.[/red]")
+            return False
+
+        self.economy.apply_trades(planet, [(c, q) for c, q, _ in buys] + [(c, -q) for c, q, _ in sells])
+        spent = sum(quantity * price for _, quantity, price in buys)
+        earned = sum(quantity * price for _, quantity, price in sells)
+        self.notify(f"[green]Order filled: bought {len(buys)} goods for {spent:.1f} credits, "
+                    f"sold {len(sells)} goods for {earned:.1f} credits[/green]")
+        self.status_changed = True
+        return True
+
+    def plan_cargo_fill(self, target=None, sell_cargo=False):
+        """
+        Basket that fills the free cargo space with the best-margin goods.
+
+        Goods are valued at `target`: by default the next trade route stop,
+        or else the best other market for each commodity. Every commodity
+        gets as many units as still sell there for more than they cost here
+        (both prices move with the quantity traded). Then the hold is filled
+        with the commodities that earn the most per unit of volume, as far as
+        the credits go.
+
+        Args:
+            target (Planet): Planet the cargo will be sold at
+            sell_cargo (bool): Sell the current cargo first, freeing its space and credits
+
+        Returns:
+            list: (commodity, quantity) orders for `trade_basket`; sales are negative
+        """
+        economy = self.economy
+        planet = self.current_planet
+        here = economy.planet_row(planet)
+        if target is None:
+            target = self.next_trade_stop()
+        if target is not None:
+            targets = economy.planet_row(target)
+        else:
+            prices = economy.effective_prices()
+            prices[here] = 0
+            targets = prices.argmax(axis=0)
+
+        orders = []
+        space, credits = self.player.hold.free, self.player.credits
+        excluded = np.zeros(len(economy.commodity_names), dtype=bool)
+        if sell_cargo:
+            for commodity, lot in self.player.inventory.items():
+                orders.append((commodity, -lot['quantity']))
+                space += lot['quantity'] * lot['volume_per_unit']
+                credits += lot['quantity'] * economy.trade_price(commodity, planet, -lot['quantity'])
+                # Its price here moves with the sale; don't buy it back
+                excluded[economy.commodity_index[commodity]] = True
+
+        # Binary search per commodity for the last unit that still sells for more than it costs
+        volumes = economy.registry.volumes
+        low = np.zeros(len(volumes), dtype=np.int64)
+        high = np.where(excluded, 0, np.minimum(economy.quantities[here], np.floor(space / volumes))).astype(np.int64)
+        while (low < high).any():
+            searching = low < high
+            middle = (low + high + 1) // 2
+            # The n-th unit trades at the average price of trading 2n - 1 units
+            units = 2 * middle - 1
+            gain = economy.average_prices(targets, -units) - economy.average_prices(here, units)
+            low = np.where(searching & (gain > 0), middle, low)
+            high = np.where(searching & (gain <= 0), middle - 1, high)
+
+        profits = low * (economy.average_prices(targets, -low) - economy.average_prices(here, low))
+        per_volume = np.where(low > 0, profits / np.maximum(low * volumes, 1e-9), 0.0)
+        for column in np.argsort(-per_volume).tolist():
+            if per_volume[column] <= 0:
+                break
+            commodity = economy.commodity_names[column]
+            quantity = min(int(low[column]), int(space / volumes[column] + 1e-9))
+            if quantity > 0:
+                # Fewer units never cost more on average, so this many are affordable
+                quantity = min(quantity, int(credits / economy.trade_price(commodity, planet, quantity)))
+            if quantity > 0:
+                orders.append((commodity, quantity))
+                space -= quantity * volumes[column]
+                credits -= quantity * economy.trade_price(commodity, planet, quantity)
+        return orders
+
+    def max_refuel_quantity(self):
+        """Most units of fuel the ship can buy here: tank space, stock and credits allowing."""
+        if FUEL not in self.economy.commodity_index:
+            return 0
+        return self.affordable_quantity(FUEL, int(self.player.fuel_tank_capacity - self.player.fuel_level))
+
+    @journaled
+    def refuel(self, quantity=None):
+        """Buy fuel from the local market straight into the tank; by default as much as fits and is affordable."""
+        most = self.max_refuel_quantity()
+        if quantity is None:
+            quantity = most
+        if not 0 < quantity <= most:
+            self.notify("[red]Can't refuel here: the tank is full, or there is no fuel you can afford.[/red]")
+            return False
+
+        price = self.economy.trade_price(FUEL, self.current_planet, quantity)
+        cost = quantity * price
+        self.player.credits -= cost
+        self.player.record_trade(FUEL, quantity, price, BUY, planet=self.current_planet.name, turn=self.turn)
+        self.player.fuel_level = round(self.player.fuel_level + quantity, 1)
+        self.economy.apply_trade(FUEL, self.current_planet, quantity)
+        self.notify(f"[green]Refueled {quantity} units for {cost:.1f} credits[/green]")
+        self.status_changed = True
+        return True
+
+    # Travel
+
+    def fuel_needed(self, planet):
+        """Fuel a trip from the current planet to `planet` burns; inf if there is no route."""
+        distance = self.calculate_distance(self.current_planet, planet)
+        # Lasting events at the departure planet (fuel shortages) change the cost
+        fuel_cost = self.event_generator.modifier('fuel_cost', self.universe.routes.row(self.current_planet))
+        return distance * self.player.ship_fuel_efficiency * fuel_cost
+
+    def can_reach(self, planet):
+        """Whether the fuel in the tank covers a trip to `planet`."""
+        return planet != self.current_planet and self.fuel_needed(planet) <= self.player.fuel_level
+
+    @journaled
+    def travel(self, planet):
+        if planet == self.current_planet:
+            self.notify("[bold red]You are already at this planet![/bold red]")
+            return False
+
+        fuel_consumption = self.fuel_needed(planet)
+        if fuel_consumption == float('inf'):
+            self.notify(f"[bold red]No known route to {planet.name}![/bold red]")
+            return False
+
+        if self.player.fuel_level < fuel_consumption:
+            self.notify("[bold red]Not enough fuel to travel![/bold red]")
+            return False
+
+        self.player.fuel_level = round(self.player.fuel_level - fuel_consumption, 1)
+        self.player.total_fuel_used = round(self.player.total_fuel_used + fuel_consumption, 1)
+        self.player.total_trips += 1
+        route = self.universe.routes.route(self.current_planet, planet)
+        self.current_planet = planet
+        if len(route) > 2:
+            self.notify(f"Traveled to {planet.name} via {' → '.join(p.name for p in route[1:-1])} using {fuel_consumption:.1f} units of fuel.")
+        else:
+            self.notify(f"Traveled to {planet.name} using {fuel_consumption:.1f} units of fuel.")
+        self.handle_event(self.event_generator.generate_event())
+        self.check_passenger_delivery()
+        # Arriving somewhere ends the turn; the scheduler runs end_turn next
+        self.scheduler.request_end_turn()
+        return True
+
+    @journaled
+    def quantum_drive(self):
+        return self.travel(self.rng.stream('engine').choice(self.universe.planets))
+
+    @property
+    def route_planner(self):
+        # Rebuilt when a loaded game replaces the universe or market
+        planner = self._route_planner
+        if planner is None or planner.routes is not self.universe.routes or planner.economy is not self.economy:
+            planner = self._route_planner = TradeRoutePlanner(self.universe.routes, self.economy)
+        return planner
+
+    def plan_trade_routes(self, k=5, max_hops=4):
+        """
+        Most profitable trade loops through the current planet for this ship and budget.
+
+        Returns:
+            list: TradeRoute objects, best profit per fuel first
+        """
+        routes = self.route_planner.best_routes(
+            self.current_planet,
+            capacity=self.player.hold.free,
+            credits=self.player.credits,
+            fuel_efficiency=self.player.ship_fuel_efficiency,
+            max_leg_fuel=self.player.fuel_tank_capacity,
+            k=k,
+            max_hops=max_hops
+        )
+        return routes
+
+    @journaled
+    def set_trade_route(self, planets):
+        # Stops of a loop: from the last one the route leads back to the first
+        self.player.trade_route = list(planets)
+        self.notify(f"Trade route set: {' → '.join(planet.name for planet in self.player.trade_route)}")
+        return True
+
+    def next_trade_stop(self):
+        route = self.player.trade_route
+        if self.current_planet not in route:
+            return None
+        return route[(route.index(self.current_planet) + 1) % len(route)]
+
+    @journaled
+    def use_trade_route(self):
+        if not self.player.trade_route:
+            self.notify("[bold red]No trade route set![/bold red]")
+            return False
+
+        next_stop = self.next_trade_stop()
+        if next_stop is None:
+            self.notify("[bold red]You are not at a stop of this trade route![/bold red]")
+            return False
+
+        return self.travel(next_stop)
+
+    @journaled
+    def frontier_jump(self):
+        frontier_planet = self.universe.create_frontier_planet(self.current_planet)
+        return self.travel(frontier_planet)
+
+    def calculate_distance(self, planet1, planet2):
+        # Shortest distance over the trade network, precomputed by the route table
+        return self.universe.routes.distance(planet1, planet2)
+
+    def check_passenger_delivery(self):
+        arrived_passengers = [p for p in self.player.passengers if p['destination'] == self.current_planet.name]
+        for passenger in arrived_passengers:
+            reward = passenger['reward']
+            self.player.credits += reward
+            self.notify(f"Delivered {passenger['type']} to {self.current_planet.name}. Received {reward} credits.")
+            self.player.remove_passenger(passenger)
+
+    def end_turn(self):
+        self.economy.update_market()
+        if self.market_history is not None:
+            self.market_history.record(self.turn, self.economy)
+        self.status_changed = True
+
+    # Events
+
+    def register_event_handlers(self):
+        events = self.event_generator
+        events.on('trade_opportunity', self.on_trade_opportunity)
+        events.on('pirate_encounter', self.on_pirate_encounter)
+        events.on('market_crash', self.on_market_crash, self.on_market_crash_end)
+        events.on('technological_breakthrough', self.on_technological_breakthrough)
+        events.on('fuel_shortage', self.on_fuel_shortage, self.on_fuel_shortage_end)
+        events.on('cargo_loss', self.on_cargo_loss)
+
+    def handle_event(self, event):
+        self.notify(f"[bold yellow]Event:[/bold yellow] {event['description']}")
+        event['planet'] = self.current_planet.name
+        if event['duration']:
+            # Lasting events cover the planets within their radius of here, or everything
+            rows = None
+            if event['radius'] is not None:
+                rows = self.universe.routes.within(self.current_planet, event['radius'])
+            self.event_generator.schedule(event, self.turn, rows)
+        self.event_generator.dispatch(event)
+
+    def expire_events(self):
+        self.event_generator.advance(self.turn)
+
+    # Event outcomes draw from the same stream that picked the event
+
+    def on_trade_opportunity(self, event):
+        rng = self.event_generator.rng
+        commodity = rng.choice(self.economy.commodity_names)
+        price = self.economy.calculate_price(commodity, self.current_planet)
+        quantity = rng.randint(10, 50)
+        if self.player.add_cargo(commodity, quantity, price, self.current_planet.name, self.turn):
+            self.notify(f"You discovered a rare trade opportunity and acquired {quantity} units of {commodity} at {price} credits each.")
+
+    def on_pirate_encounter(self, event):
+        loss = self.event_generator.rng.uniform(0.1, 0.3) * self.player.credits
+        self.player.credits -= loss
+        self.notify(f"Pirates attacked! You lost {loss:.1f} credits.")
+
+    def on_market_crash(self, event):
+        # One category of goods crashes in the event's area, recovering over its duration
+        registry = self.economy.registry
+        category = self.event_generator.rng.choice(registry.categories)
+        event['category'] = category
+        rows = None
+        if event['rows'] is not None:
+            planets = self.universe.routes.planets
+            rows = [self.economy.planet_row(planets[row]) for row in event['rows']]
+        strength = event['effects']['price']
+        self.economy.add_shock(strength, event['duration'], rows, registry.in_category(category))
+        self.notify(f"A market crash near {event['planet']} has cut {category} prices by {1 - strength:.0%}. "
+                    f"They will recover over {event['duration']} turns.")
+
+    def on_market_crash_end(self, event):
+        self.notify(f"{event['category']} prices near {event['planet']} have recovered.")
+
+    def on_technological_breakthrough(self, event):
+        # Grant a free technology upgrade
+        rng = self.event_generator.rng
+        available_upgrades = self.tech_tree.get_available_upgrades()
+        if available_upgrades:
+            category = rng.choice(list(available_upgrades.keys()))
+            upgrade = rng.choice(available_upgrades[category])
+            self.apply_upgrade_effects(upgrade)
+            self.notify(f"You've made a technological breakthrough: {upgrade['name']} has been granted to you for free.")
+        else:
+            self.notify("You've made a technological breakthrough, but no upgrades are available at this time.")
+
+    def on_fuel_shortage(self, event):
+        self.notify(f"Travel from planets near {event['planet']} costs {event['effects']['fuel_cost']:.0%} of the usual fuel "
+                    f"for {event['duration']} turns.")
+
+    def on_fuel_shortage_end(self, event):
+        self.notify(f"The fuel shortage around {event['planet']} is over.")
+
+    def on_cargo_loss(self, event):
+        rng = self.event_generator.rng
+        if self.player.inventory:
+            commodity = rng.choice(self.player.inventory.keys())
+            loss_quantity = rng.randint(1, self.player.hold.quantity(commodity))
+            # Through the hold, so the cargo space is freed too
+            self.player.remove_cargo(commodity, loss_quantity)
+            self.notify(f"You lost {loss_quantity} units of {commodity} due to an accident.")
+        else:
+            self.notify("You narrowly avoided cargo loss as you have no cargo on board.")
+
+    # Ship upgrades
+
+    @journaled
+    def purchase_upgrade(self, upgrade):
+        if self.player.credits < upgrade['cost']:
+            self.notify("Insufficient credits to purchase this upgrade.")
+            return False
+
+        self.player.credits -= upgrade['cost']
+        # Apply upgrade effects
+        self.apply_upgrade_effects(upgrade)
+        self.notify(f"Purchased {upgrade['name']} for {upgrade['cost']:.1f} credits.")
+        self.status_changed = True
+        return True
+
+    def apply_upgrade_effects(self, upgrade):
+        category = upgrade['category']
+        effects = upgrade['effects']
+
+        if category == 'cargo':
+            self.player.cargo_capacity = effects['cargo_capacity']
+            self.notify(f"Cargo capacity increased to {self.player.cargo_capacity}")
+        elif category == 'ship_level':
+            self.player.ship_level += 1
+            self.notify(f"Ship level increased to {self.player.ship_level}")
+        elif category == 'fuel_efficiency':
+            self.player.ship_fuel_efficiency = effects['fuel_efficiency']
+            self.notify(f"Fuel efficiency increased to {self.player.ship_fuel_efficiency}")
+        elif category == 'life_support':
+            self.player.life_support_expansion = effects['life_support_capacity']
+            self.notify(f"Life support capacity increased to {self.player.life_support_expansion}")
+        elif category == 'passenger_pod':
+            self.player.passenger_pod_capacity = effects['passenger_pod_capacity']
+            self.notify(f"Passenger pod capacity increased to {self.player.passenger_pod_capacity}")
+        # Add other categories and effects as needed
+
+    @journaled
+    def install_component(self, component):
+        price = dict(self.SHIP_COMPONENTS)[component]
+        if self.player.credits < price:
+            self.notify("Insufficient credits to purchase this upgrade.")
+            return False
+
+        if component == "Cargo Capacity":
+            self.player.cargo_capacity += 50
+            self.notify(f"Cargo capacity increased to {self.player.cargo_capacity}")
+        elif component == "Fuel Efficiency":
+            self.player.ship_fuel_efficiency += 0.1
+            self.notify(f"Fuel efficiency increased to {self.player.ship_fuel_efficiency}")
+        elif component == "Ship Speed":
+            self.player.ship_speed += 0.1
+            self.notify(f"Ship speed increased to {self.player.ship_speed}")
+        elif component == "Life Support":
+            self.player.life_support_expansion += 10
+            self.notify(f"Life support capacity increased to {self.player.life_support_expansion}")
+        elif component == "Radiation Shield":
+            self.player.radiation_shield = True
+            self.notify("Radiation Shield installed.")
+        elif component == "Business Class Module":
+            self.player.business_class_module = True
+            self.notify("Business Class Module installed.")
+        # Charged once the component is fitted
+        self.player.credits -= price
+        self.status_changed = True
+        return True
+
+    # Quests and passengers
+
+    @journaled
+    def accept_quest(self, quest):
+        # Check if the player has the required upgrades for passenger transport quests
+        if quest['type'] == 'passenger_transport':
+            if self.player.passenger_pod_capacity < quest['conditions']['quantity']:
+                self.notify("[bold red]You do not have enough passenger pod capacity to accept this quest.[/bold red]")
+                return False
+            if self.player.life_support_expansion < quest['conditions']['quantity']:
+                self.notify("[bold red]You do not have enough life support expansion to accept this quest.[/bold red]")
+                return False
+
+        # Take it off the quest board, unless it expired in the meantime
+        if self.universe.quests.accept(quest['id']) is None:
+            self.notify("[bold red]This quest is no longer available.[/bold red]")
+            return False
+
+        self.player.accept_quest(quest)
+        return True
+
+    @journaled
+    def complete_quests(self):
+        completed = [q for q in self.player.active_quests if q['conditions']['destination'] == self.current_planet.name]
+        for quest in completed:
+            self.notify(f"[bold green]Quest completed: {quest['description']}[/bold green]")
+            self.player.complete_quest(quest)
+        return completed
+
+    def max_quests(self):
+        # Determine the number of quests to offer based on the player's level
+        if self.player.level <= 3:
+            return 1
+        elif self.player.level <= 10:
+            return 2
+        return 3
+
+    def available_quests(self):
+        return self.universe.quests.sample(self.max_quests())
+
+    def refresh_quests(self):
+        self.universe.quests.expire(self.turn)
+        self.generate_random_quest()
+
+    def generate_random_quest(self):
+        # Offer new quests on the universe quest board
+        accepted = {quest['template'] for quest in self.player.active_quests}
+        new_quests = self.universe.quests.generate(self.max_quests(), self.turn, exclude=accepted)
+        for quest in new_quests:
+            self.notify(f"\n[bold yellow]New Quest Available:[/bold yellow]")
+            self.notify(f"{quest['description']}")
+            self.notify(f"Backstory: {quest['backstory']}")
+        return new_quests
+
+    @journaled
+    def pick_up_passenger(self, passenger):
+        if self.player.passenger_pod_capacity < len(self.player.passengers) + 1:
+            self.notify("[bold red]Not enough passenger pod capacity![/bold red]")
+            return False
+
+        self.player.add_passenger(passenger)
+        self.notify(f"Picked up {passenger['type']} heading to {passenger['destination']}.")
+        return True
@@ -1,7 +1,56 @@
+import heapq
 import random
 
+class AliasTable:
+    """
+    Weighted sampling in O(1) per draw (Vose's alias method).
+
+    Building the table is O(n). Each column holds its own outcome with
+    probability `probabilities[i]` and `aliases[i]` otherwise, so a sample is
+    one uniform column pick and one biased coin flip.
+    """
+
+    def __init__(self, weights):
+        count = len(weights)
+        total = float(sum(weights))
+        scaled = [weight * count / total for weight in weights]
+        self.probabilities = [1.0] * count
+        self.aliases = list(range(count))
+
+        small = [i for i, value in enumerate(scaled) if value < 1.0]
+        large = [i for i, value in enumerate(scaled) if value >= 1.0]
+        while small and large:
+            low, high = small.pop(), large.pop()
+            self.probabilities[low] = scaled[low]
+            self.aliases[low] = high
+            scaled[high] -= 1.0 - scaled[low]
+            (small if scaled[high] < 1.0 else large).append(high)
+
+    def sample(self, rng):
+        column = int(rng.random() * len(self.probabilities))
+        return column if rng.random() < self.probabilities[column] else self.aliases[column]
+
 class EventGenerator:
-    def __init__(self):
+    """
+    Random events, their handlers and the timeline of events that last.
+
+    Event types are data in `events`: a weight, a description and, for
+    lasting events, a `duration` in turns, a `radius` (travel distance from
+    where the event happened; None for the whole galaxy) and `effects`
+    (effect name -> multiplier). `generate_event` samples a type from a
+    precomputed alias table in O(1). What an event does is not hardcoded
+    here: handlers are registered per type with `on` and run by `dispatch`.
+
+    Lasting events go on the timeline, a heap ordered by the turn they end,
+    and into an index of the planet rows they cover. `advance` pops only the
+    events that end and runs their end handlers, and `modifier` combines the
+    effects of the events covering one planet. The cost per turn follows the
+    events that fire or apply, not how many are running or how many planets
+    the universe has.
+    """
+
+    def __init__(self, rng=None):
+        self.rng = rng if rng is not None else random.Random()
         self.events = {
             'trade_opportunity': {
                 'weight': 0.3,
@@ -13,7 +62,10 @@ class EventGenerator:
             },
             'market_crash': {
                 'weight': 0.1,
-                'description': "Sudden market crash affects commodity prices!"
+                'description': "Sudden market crash affects commodity prices!",
+                'duration': 5,
+                'radius': 20.0,
+                'effects': {'price': 0.5}
             },
             'technological_breakthrough': {
                 'weight': 0.2,
@@ -21,19 +73,122 @@ class EventGenerator:
             },
             'fuel_shortage': {
                 'weight': 0.1,
-                'description': "A fuel shortage affects travel costs!"
+                'description': "A fuel shortage affects travel costs!",
+                'duration': 3,
+                'radius': 15.0,
+                'effects': {'fuel_cost': 1.5}
             },
             'cargo_loss': {
                 'weight': 0.1,
                 'description': "A portion of your cargo is lost due to an accident!"
             }
         }
+        self.handlers = {}      # event type -> [(handler, end handler)]
+        self.timeline = []      # heap of (ends_turn, event id)
+        self.active = {}        # event id -> event
+        self.by_planet = {}     # planet row -> {event id}
+        self.everywhere = set() # ids of active events without an area
+        self._next_id = 1
+        self._build_table()
+
+    def _build_table(self):
+        self.event_types = list(self.events)
+        self.table = AliasTable([self.events[event]['weight'] for event in self.event_types])
+
+    def add_event_type(self, event_type, weight, description, duration=0, radius=None, effects=None):
+        self.events[event_type] = {
+            'weight': weight,
+            'description': description,
+            'duration': duration,
+            'radius': radius,
+            'effects': effects or {}
+        }
+        self._build_table()
+
+    def on(self, event_type, handler, on_end=None):
+        """Run `handler(event)` when an event of this type happens, and `on_end(event)` when a lasting one ends."""
+        self.handlers.setdefault(event_type, []).append((handler, on_end))
 
     def generate_event(self):
-        events = list(self.events.keys())
-        weights = [self.events[event]['weight'] for event in events]
-        selected_event = random.choices(events, weights=weights)[0]
+        selected_event = self.event_types[self.table.sample(self.rng)]
+        details = self.events[selected_event]
         return {
             'type': selected_event,
-            'description': self.events[selected_event]['description']
+            'description': details['description'],
+            'duration': details.get('duration', 0),
+            'radius': details.get('radius'),
+            'effects': dict(details.get('effects', {}))
         }
+
+    def dispatch(self, event):
+        for handler, _ in self.handlers.get(event['type'], ()):
+            if handler is not None:
+                handler(event)
+
+    def schedule(self, event, turn, rows=None):
+        """
+        Put a lasting event on the timeline.
+
+        Args:
+            event (dict): Event from generate_event
+            turn (int): Turn it starts; it ends `event['duration']` turns later
+            rows (iterable): Planet rows it covers, or None for every planet
+        """
+        event['id'] = self._next_id
+        event['ends_turn'] = turn + event['duration']
+        event['rows'] = None if rows is None else [int(row) for row in rows]
+        self._next_id += 1
+
+        self.active[event['id']] = event
+        heapq.heappush(self.timeline, (event['ends_turn'], event['id']))
+        if event['rows'] is None:
+            self.everywhere.add(event['id'])
+        else:
+            for row in event['rows']:
+                self.by_planet.setdefault(row, set()).add(event['id'])
+        return event
+
+    def advance(self, turn):
+        """End every lasting event due by `turn`; returns the events that ended."""
+        ended = []
+        while self.timeline and self.timeline[0][0] <= turn:
+            _, event_id = heapq.heappop(self.timeline)
+            event = self.active.pop(event_id)
+            if event['rows'] is None:
+                self.everywhere.discard(event_id)
+            else:
+                for row in event['rows']:
+                    ids = self.by_planet[row]
+                    ids.discard(event_id)
+                    if not ids:
+                        del self.by_planet[row]
+            for _, on_end in self.handlers.get(event['type'], ()):
+                if on_end is not None:
+                    on_end(event)
+            ended.append(event)
+        return ended
+
+    def events_at(self, row):
+        """Active lasting events covering planet `row`."""
+        ids = self.everywhere | self.by_planet.get(row, set()) if self.everywhere else self.by_planet.get(row, ())
+        return [self.active[event_id] for event_id in ids]
+
+    def modifier(self, effect, row):
+        """Combined multiplier of `effect` at planet `row` (1.0 when nothing applies)."""
+        value = 1.0
+        for event in self.events_at(row):
+            value *= event['effects'].get(effect, 1.0)
+        return value
+
+    def active_events(self):
+        return list(self.active.values())
+
+    def restore(self, events):
+        """Replace the timeline with saved active events (their start handlers are not run again)."""
+        self.timeline = []
+        self.active = {}
+        self.by_planet = {}
+        self.everywhere = set()
+        for event in sorted(events, key=lambda event: event['id']):
+            self._next_id = event['id']
+            self.schedule(dict(event), event['ends_turn'] - event['duration'], event['rows'])
@@ -0,0 +1,197 @@
+import numpy as np
+
+# Names of the original hand-made systems; quests refer to some of them, so the
+# first planets of every galaxy take these names before procedural ones are used.
+CLASSIC_NAMES = [
+    "New Terra", "Proxima", "Arcturus", "Orion Prime",
+    "Sigma Outpost", "Epsilon Station", "Nova Haven",
+    "Quantum Nexus", "Helios Prime", "Crimson Horizon"
+]
+
+NAME_PREFIXES = [
+    "Al", "Ar", "Bel", "Cor", "Dra", "El", "Fen", "Gal", "Hel", "Ir",
+    "Jor", "Kel", "Lum", "Mar", "Nex", "Or", "Pra", "Quo", "Ryn", "Sol",
+    "Tar", "Ul", "Vex", "Wyr", "Xan", "Yor", "Zel", "Ast", "Cel", "Ven"
+]
+NAME_MIDDLES = ["a", "e", "i", "o", "u", "ae", "io", "ar", "en", "or", "ys", "ul"]
+NAME_SUFFIXES = [
+    "ra", "nis", "tor", "lon", "dus", "mir", "vex", "thos", "ria", "gon",
+    "lia", "sar", "tis", "ron", "nova", "dor", "pha", "cus", "mar", "zen"
+]
+NAME_DESIGNATIONS = ["", "", "", " Prime", " Minor", " Major", " II", " III", " IV", " Station", " Outpost", " Reach"]
+
+PLANET_TYPES = [
+    "Desert", "Oceanic", "Industrial", "Agricultural",
+    "High-Tech", "Mining", "Trading Hub", "Research Colony"
+]
+STATUSES = ["Stable", "Unstable", "War-torn"]
+CHARACTERISTICS = ["Friendly", "Hostile", "Neutral"]
+PLANET_CLASSES = ["Terrestrial", "Gas Giant", "Ice World", "Asteroid Belt"]
+GEOLOGIES = ["Rocky", "Volcanic", "Mountainous", "Flat"]
+CLIMATES = ["Temperate", "Arid", "Frozen", "Harsh"]
+RESOURCE_TYPES = [
+    "raw_materials",
+    "agricultural_goods",
+    "technological_goods",
+    "luxury_goods",
+    "industrial_goods"
+]
+
+class Galaxy:
+    """
+    Columnar planet data for one generated galaxy.
+
+    Categorical attributes are stored as small integer codes into the lists
+    above; `resources` is a planets x RESOURCE_TYPES matrix with NaN where a
+    planet has no such resource. Lanes are parallel arrays of planet rows and
+    their travel distance.
+    """
+
+    def __init__(self, seed, names, coordinates, columns, resources, lane_sources, lane_targets, lane_distances):
+        self.seed = seed
+        self.names = names
+        self.coordinates = coordinates
+        self.columns = columns
+        self.resources = resources
+        self.lane_sources = lane_sources
+        self.lane_targets = lane_targets
+        self.lane_distances = lane_distances
+
+    def __len__(self):
+        return len(self.names)
+
+class GalaxyGenerator:
+    """
+    Seeded procedural galaxy generator.
+
+    Planets are scattered uniformly at a constant density, so lane lengths stay
+    in the same range whatever the galaxy size. Lanes join every pair of
+    planets closer than `lane_range`, found through a uniform grid with cells
+    of that size (only the 3x3 surrounding cells are checked), plus a backbone
+    that chains the occupied cells in snake order so the network is always
+    connected. Everything is vectorised, so generation runs in O(n log n).
+    """
+
+    def __init__(self, seed=None, lane_range=8.0, mean_lanes=6.0):
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        self.lane_range = lane_range
+        # Planet density giving `mean_lanes` neighbours inside the lane range on average
+        self.density = mean_lanes / (np.pi * lane_range ** 2)
+
+    def generate(self, num_planets):
+        coordinates = self.generate_coordinates(num_planets)
+        lane_sources, lane_targets, lane_distances = self.generate_lanes(coordinates)
+        return Galaxy(
+            seed=self.seed,
+            names=self.generate_names(num_planets),
+            coordinates=coordinates,
+            columns=self.generate_columns(num_planets),
+            resources=self.generate_resources(num_planets),
+            lane_sources=lane_sources,
+            lane_targets=lane_targets,
+            lane_distances=lane_distances
+        )
+
+    def generate_names(self, num_planets):
+        classic = [str(name) for name in self.rng.permutation(CLASSIC_NAMES)[:num_planets]]
+        count = num_planets - len(classic)
+        prefixes = self.rng.integers(0, len(NAME_PREFIXES), count)
+        middles = self.rng.integers(0, len(NAME_MIDDLES), count)
+        suffixes = self.rng.integers(0, len(NAME_SUFFIXES), count)
+        designations = self.rng.integers(0, len(NAME_DESIGNATIONS), count)
+
+        names = classic
+        seen = set(classic)
+        for i in range(count):
+            name = (NAME_PREFIXES[prefixes[i]] + NAME_MIDDLES[middles[i]]
+                    + NAME_SUFFIXES[suffixes[i]] + NAME_DESIGNATIONS[designations[i]])
+            if name in seen:
+                # Catalogue number keeps repeated names unique
+                name = f"{name} {len(classic) + i}"
+            seen.add(name)
+            names.append(name)
+        return names
+
+    def generate_coordinates(self, num_planets):
+        side = np.sqrt(num_planets / self.density)
+        return self.rng.uniform(0.0, side, size=(num_planets, 2))
+
+    def generate_columns(self, num_planets):
+        rng = self.rng
+        return {
+            'type': rng.integers(0, len(PLANET_TYPES), num_planets, dtype=np.uint8),
+            'status': rng.integers(0, len(STATUSES), num_planets, dtype=np.uint8),
+            'characteristics': rng.integers(0, len(CHARACTERISTICS), num_planets, dtype=np.uint8),
+            'planet_class': rng.integers(0, len(PLANET_CLASSES), num_planets, dtype=np.uint8),
+            'geology': rng.integers(0, len(GEOLOGIES), num_planets, dtype=np.uint8),
+            'climate': rng.integers(0, len(CLIMATES), num_planets, dtype=np.uint8),
+            'moons': rng.integers(0, 6, num_planets, dtype=np.uint8),
+            'economy_level': rng.uniform(0.3, 1.0, num_planets),
+            'population': rng.integers(1000, 10001, num_planets, dtype=np.int32),
+            'cyborgs': rng.integers(1, 101, num_planets, dtype=np.int32),
+            'androids': rng.integers(1, 101, num_planets, dtype=np.int32),
+            'robots': rng.integers(1, 101, num_planets, dtype=np.int32),
+            'history_seed': rng.integers(0, 2 ** 32, num_planets, dtype=np.uint32)
+        }
+
+    def generate_resources(self, num_planets):
+        # Each planet has 3-4 of the resource types, valued 0.1-1.0
+        values = self.rng.uniform(0.1, 1.0, size=(num_planets, len(RESOURCE_TYPES)))
+        counts = self.rng.integers(3, 5, num_planets)
+        ranks = self.rng.random((num_planets, len(RESOURCE_TYPES))).argsort(axis=1).argsort(axis=1)
+        values[ranks >= counts[:, None]] = np.nan
+        return values
+
+    def generate_lanes(self, coordinates):
+        num_planets = len(coordinates)
+        if num_planets < 2:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0)
+
+        # Bucket planets into grid cells of size lane_range
+        cells = np.floor(coordinates / self.lane_range).astype(np.int64)
+        grid_width = int(cells[:, 0].max()) + 1
+        grid_height = int(cells[:, 1].max()) + 1
+        cell_ids = cells[:, 1] * grid_width + cells[:, 0]
+        order = np.argsort(cell_ids, kind='stable')
+        sorted_cells = cell_ids[order]
+        cell_start = np.searchsorted(sorted_cells, np.arange(grid_width * grid_height))
+        cell_count = np.bincount(sorted_cells, minlength=grid_width * grid_height)
+
+        sources, targets = [], []
+        # Half of the 3x3 neighbourhood, so each unordered cell pair is visited once
+        for dx, dy in [(0, 0), (1, 0), (-1, 1), (0, 1), (1, 1)]:
+            neighbour_x = cells[:, 0] + dx
+            neighbour_y = cells[:, 1] + dy
+            valid = (neighbour_x >= 0) & (neighbour_x < grid_width) & (neighbour_y < grid_height)
+            points = np.flatnonzero(valid)
+            neighbour_cells = neighbour_y[points] * grid_width + neighbour_x[points]
+            counts = cell_count[neighbour_cells]
+
+            # Expand every planet against every planet in its neighbour cell
+            src = np.repeat(points, counts)
+            first = np.repeat(cell_start[neighbour_cells], counts)
+            offsets = np.arange(len(src)) - np.repeat(np.cumsum(counts) - counts, counts)
+            dst = order[first + offsets]
+
+            keep = src < dst if (dx, dy) == (0, 0) else np.ones(len(src), dtype=bool)
+            src, dst = src[keep], dst[keep]
+            close = np.hypot(*(coordinates[src] - coordinates[dst]).T) < self.lane_range
+            sources.append(src[close])
+            targets.append(dst[close])
+
+        # Backbone: chain planets through the occupied cells in snake order
+        rows, columns = cells[:, 1], cells[:, 0]
+        snake_columns = np.where(rows % 2 == 0, columns, grid_width - 1 - columns)
+        chain = np.lexsort((coordinates[:, 0], snake_columns, rows))
+        sources.append(chain[:-1])
+        targets.append(chain[1:])
+
+        src = np.concatenate(sources)
+        dst = np.concatenate(targets)
+        low, high = np.minimum(src, dst), np.maximum(src, dst)
+        keys = np.unique(low * num_planets + high)
+        low, high = keys // num_planets, keys % num_planets
+        # Planets sitting almost on top of each other still cost a minimum hop
+        distances = np.maximum(np.hypot(*(coordinates[low] - coordinates[high]).T), 1.0)
+        return low, high, distances
@@ -0,0 +1,193 @@
+import os
+import json
+import functools
+
+from src import savegame
+from src.universe import Planet
+
+def journaled(method):
+    """
+    Record a successful engine action in the engine's journal, if it has one.
+
+    Actions called from inside another journaled action (e.g. `travel` from
+    `frontier_jump`) are part of the outer entry.
+    """
+    @functools.wraps(method)
+    def wrapper(engine, *args):
+        journal = engine.journal
+        if journal is None or journal.recording:
+            return method(engine, *args)
+
+        journal.recording = True
+        before = journal.begin(engine)
+        try:
+            result = method(engine, *args)
+        finally:
+            journal.recording = False
+        if result:
+            journal.record(engine, method.__name__, args, before)
+        return result
+    return wrapper
+
+def encode_value(value):
+    if isinstance(value, Planet):
+        return value.name
+    # NumPy scalars
+    return value.item()
+
+class ActionJournal:
+    """
+    Append-only autosave: a snapshot (a regular binary save) plus a journal of
+    everything applied since.
+
+    Each applied action appends one JSON line holding the action and its
+    arguments, the player fields it changed, the fills it added to the trade
+    ledger, where the ship is, the planets it discovered and the current
+    turn. Turn ends log the turn that follows and turn starts log the quest
+    board. So an autosave costs O(changes) instead of rewriting the world.
+    Every `snapshot_interval` turns the game is snapshotted and the journal
+    starts over. Entries store resulting values
+    rather than deltas (ledger fills with their row numbers), so replaying an
+    entry twice (e.g. after a crash between writing a snapshot and
+    truncating the journal) is harmless.
+
+    Market prices are not journaled: after a recovery the market continues
+    from the snapshot's prices.
+    """
+
+    def __init__(self, path, snapshot_interval=20):
+        self.path = path
+        self.journal_path = path + '.journal'
+        self.snapshot_interval = snapshot_interval
+        self.recording = False
+        self.entries = 0
+        self.file = None
+
+    def attach(self, engine):
+        """Start journaling `engine`, beginning with a fresh snapshot."""
+        engine.journal = self
+        engine.scheduler.on(engine.scheduler.START, lambda: self.on_turn_start(engine))
+        engine.scheduler.on(engine.scheduler.END, lambda: self.on_turn_end(engine))
+        self.snapshot(engine)
+
+    def snapshot(self, engine):
+        temporary = self.path + '.tmp'
+        savegame.save_game(engine, temporary)
+        os.replace(temporary, self.path)
+        # The snapshot covers everything journaled so far
+        if self.file is not None:
+            self.file.close()
+        self.file = open(self.journal_path, 'w')
+        self.entries = 0
+
+    def begin(self, engine):
+        # Only what `record` compares against: scalars are immutable and the cargo
+        # comes as a fresh dict, and the player's lists (route, quests, passengers)
+        # only have items added or removed, so shallow copies are enough
+        state = savegame.player_state(engine.player)
+        return {
+            'player': {name: list(value) if isinstance(value, list) else value for name, value in state.items()},
+            'lanes': len(engine.universe.routes.lanes),
+            'trades': len(engine.player.ledger)
+        }
+
+    def record(self, engine, action, args, before):
+        after = savegame.player_state(engine.player)
+        routes = engine.universe.routes
+        entry = {
+            'action': action,
+            'args': list(args),
+            'turn': engine.turn,
+            'location': engine.current_planet.name,
+            'changes': {name: value for name, value in after.items() if before['player'].get(name) != value}
+        }
+
+        # Planets discovered by the action (frontier jumps) and their lanes
+        discovered = []
+        for sources, targets, distances in routes.lanes[before['lanes']:]:
+            if len(sources):
+                planet = routes.planets[int(sources[0])]
+                links = {routes.planets[int(target)].name: float(distance) for target, distance in zip(targets, distances)}
+                discovered.append({'planet': planet.to_dict(), 'links': links})
+        if discovered:
+            entry['planets'] = discovered
+
+        # Fills the action added to the trade ledger
+        if len(engine.player.ledger) > before['trades']:
+            entry['trades'] = {'from': before['trades'], 'rows': engine.player.ledger.rows(before['trades'])}
+
+        self.write(entry)
+
+    def on_turn_start(self, engine):
+        if engine.turn and engine.turn % self.snapshot_interval == 0:
+            self.snapshot(engine)
+        else:
+            # The quest board was just refreshed; it is small, so it is logged whole
+            self.write({'action': 'turn', 'turn': engine.turn, 'quests': list(engine.universe.quests)})
+
+    def on_turn_end(self, engine):
+        # The turn counter moves on once the END handlers have run
+        self.write({'action': 'end_turn', 'turn': engine.turn + 1})
+
+    def write(self, entry):
+        self.file.write(json.dumps(entry, default=encode_value) + '\n')
+        self.file.flush()
+        self.entries += 1
+
+    def close(self, remove=False):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        if remove:
+            for path in (self.path, self.journal_path):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    @staticmethod
+    def pending(path):
+        """True if `path` has an autosave whose journal was not cleaned up, i.e. a session that didn't exit."""
+        return os.path.exists(path) and os.path.exists(path + '.journal')
+
+    @staticmethod
+    def replay(engine, path):
+        """
+        Apply the journal tail written after the snapshot at `path` (already loaded into `engine`).
+
+        Returns:
+            int: Number of entries replayed
+        """
+        journal_path = path + '.journal'
+        if not os.path.exists(journal_path):
+            return 0
+
+        universe = engine.universe
+        replayed = 0
+        with open(journal_path, 'r') as file:
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # A line cut short by the crash
+                    break
+
+                engine.scheduler.turn = entry['turn']
+                for discovered in entry.get('planets', ()):
+                    links = {universe.routes.planets[universe.routes.index[name]]: distance
+                             for name, distance in discovered['links'].items()}
+                    universe.add_planet(Planet(**discovered['planet']), links)
+                if 'quests' in entry:
+                    universe.quests.restore(entry['quests'])
+                if entry['action'] == 'accept_quest':
+                    universe.quests.accept(entry['args'][0]['id'])
+                if 'changes' in entry:
+                    savegame.apply_player_state(engine.player, entry['changes'], universe)
+                if 'trades' in entry:
+                    # Rows the ledger already has (the entry was replayed before) are skipped
+                    ledger = engine.player.ledger
+                    ledger.extend(entry['trades']['rows'][max(len(ledger) - entry['trades']['from'], 0):])
+                if 'location' in entry:
+                    engine.current_planet = universe.routes.planets[universe.routes.index[entry['location']]]
+                replayed += 1
+
+        engine.status_changed = True
+        return replayed
@@ -0,0 +1,191 @@
+import numpy as np
+
+from src.commodities import CommodityRegistry
+
+BUY = 1
+SELL = -1
+
+class RunningTotals:
+    """Totals per key, with the largest one kept up to date as values are added."""
+
+    def __init__(self):
+        self.totals = {}
+        self.best_key = None
+
+    def add(self, key, value):
+        total = self.totals.get(key, 0.0) + value
+        self.totals[key] = total
+        if self.best_key is None or total > self.totals[self.best_key]:
+            self.best_key = key
+        elif key == self.best_key and value < 0:
+            # The leader lost ground; only then is a rescan needed
+            self.best_key = max(self.totals, key=self.totals.get)
+
+    def best(self):
+        """(key, total) of the largest total, or None when nothing was added."""
+        if self.best_key is None:
+            return None
+        return self.best_key, self.totals[self.best_key]
+
+class TradeLedger:
+    """
+    Append-only record of every fill, in preallocated columns.
+
+    Each fill is one row of `turns`, `planets` (ids into `planet_names`),
+    `commodities` (registry ids), `quantities`, `prices`, `sides` (BUY or
+    SELL) and `pnl` (realized profit of a sale against the average buy
+    price; 0 for purchases). The columns double in size when full, so
+    appending is amortised O(1).
+
+    Aggregates are updated as fills come in: credits spent and earned,
+    realized profit, and realized profit by good, by the planet a sale was
+    made at, and by route. A route runs from the planet the good was last
+    bought at to the planet it was sold at. Statistics are read from these
+    running totals, never by scanning the ledger.
+    """
+
+    COLUMNS = {
+        'turns': np.dtype('<i4'),
+        'planets': np.dtype('<i4'),
+        'commodities': np.dtype('<i4'),
+        'quantities': np.dtype('<i4'),
+        'prices': np.dtype('<f8'),
+        'sides': np.dtype('<i1'),
+        'pnl': np.dtype('<f8')
+    }
+
+    def __init__(self, registry=None, size=256):
+        self.registry = registry if registry is not None else CommodityRegistry.load()
+        self.count = 0
+        for name, dtype in self.COLUMNS.items():
+            setattr(self, name, np.zeros(size, dtype=dtype))
+        self.planet_names = []
+        self.planet_index = {}
+
+        self.spent = 0.0
+        self.earned = 0.0
+        self.realized = 0.0
+        self.by_good = RunningTotals()
+        self.by_planet = RunningTotals()
+        self.by_route = RunningTotals()
+        self.bought_at = {}  # commodity id -> planet id of its last purchase
+
+    def __len__(self):
+        return self.count
+
+    def planet_id(self, name):
+        planet = self.planet_index.get(name)
+        if planet is None:
+            planet = len(self.planet_names)
+            self.planet_index[name] = planet
+            self.planet_names.append(name)
+        return planet
+
+    def record(self, turn, planet, commodity, quantity, price, side, pnl=0.0):
+        """
+        Append one fill.
+
+        Args:
+            turn (int): Turn of the trade
+            planet (str): Name of the planet traded at
+            commodity (str): Commodity name
+            quantity (int): Units traded
+            price (float): Price per unit
+            side (int): BUY or SELL
+            pnl (float): Realized profit (sales)
+        """
+        if self.count == len(self.turns):
+            for name in self.COLUMNS:
+                array = getattr(self, name)
+                grown = np.zeros(2 * len(array), dtype=array.dtype)
+                grown[:len(array)] = array
+                setattr(self, name, grown)
+
+        row = self.count
+        planet_id = self.planet_id(planet)
+        commodity_id = self.registry.index[commodity]
+        self.turns[row] = turn
+        self.planets[row] = planet_id
+        self.commodities[row] = commodity_id
+        self.quantities[row] = quantity
+        self.prices[row] = price
+        self.sides[row] = side
+        self.pnl[row] = pnl
+        self.count += 1
+
+        value = quantity * price
+        if side == BUY:
+            self.spent += value
+            self.bought_at[commodity_id] = planet_id
+        else:
+            self.earned += value
+            self.realized += pnl
+            self.by_good.add(commodity_id, pnl)
+            self.by_planet.add(planet_id, pnl)
+            source = self.bought_at.get(commodity_id)
+            if source is not None:
+                self.by_route.add((source, planet_id), pnl)
+
+    def best_good(self):
+        """(commodity, realized profit) of the most profitable good, or None."""
+        best = self.by_good.best()
+        return None if best is None else (self.registry.names[best[0]], best[1])
+
+    def best_planet(self):
+        best = self.by_planet.best()
+        return None if best is None else (self.planet_names[best[0]], best[1])
+
+    def best_route(self):
+        """("From → To", realized profit) of the most profitable route, or None."""
+        best = self.by_route.best()
+        if best is None:
+            return None
+        (source, target), profit = best
+        return f"{self.planet_names[source]} → {self.planet_names[target]}", profit
+
+    def rows(self, start=0, stop=None):
+        """Fills [start, stop) as dicts, oldest first."""
+        stop = self.count if stop is None else min(stop, self.count)
+        return [
+            {
+                'id': row + 1,
+                'turn': int(self.turns[row]),
+                'planet': self.planet_names[self.planets[row]],
+                'good': self.registry.names[self.commodities[row]],
+                'side': 'buy' if self.sides[row] == BUY else 'sell',
+                'quantity': int(self.quantities[row]),
+                'price_per_unit': float(self.prices[row]),
+                'total': round(float(self.quantities[row] * self.prices[row]), 2),
+                'pnl': float(self.pnl[row])
+            }
+            for row in range(max(start, 0), stop)
+        ]
+
+    def recent(self, count=10):
+        """The last `count` fills, oldest first."""
+        return self.rows(self.count - count)
+
+    def extend(self, rows):
+        """Append fills given as `rows` dicts (e.g. from a journal)."""
+        for row in rows:
+            self.record(row['turn'], row['planet'], row['good'], row['quantity'], row['price_per_unit'],
+                        BUY if row['side'] == 'buy' else SELL, row['pnl'])
+
+    def arrays(self):
+        """The filled part of every column, for saving."""
+        return {name: getattr(self, name)[:self.count] for name in self.COLUMNS}
+
+    def restore(self, arrays, planet_names, commodity_names):
+        """
+        Replace the ledger with saved columns, rebuilding the aggregates.
+
+        Commodity ids are matched to the current catalogue by name; fills of
+        commodities no longer in the catalogue are dropped.
+        """
+        self.__init__(self.registry, size=max(256, len(arrays['turns'])))
+        for row in range(len(arrays['turns'])):
+            commodity = commodity_names[arrays['commodities'][row]]
+            if commodity in self.registry.index:
+                self.record(int(arrays['turns'][row]), planet_names[arrays['planets'][row]], commodity,
+                            int(arrays['quantities'][row]), float(arrays['prices'][row]),
+                            int(arrays['sides'][row]), float(arrays['pnl'][row]))
@@ -1,47 +1,45 @@
 import sys
 import os
-import pygame
-import random
 import traceback
 from rich.console import Console
 from rich.table import Table
-from rich.progress import Progress
-import time
-import json  # Ensure json is imported
 
 # Add the project root to the Python path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, project_root)
 
-from src.universe import UniverseGenerator, Planet  # Import Planet class
-from src.player import Player
-from src.economy import EconomySimulator
-from src.events import EventGenerator
-from src.technologies import TechnologyTree
-from src.storyline import Storyline
-
-class CargoHauler:
-    def __init__(self, difficulty=2):
-        pygame.init()
-        self.console = Console()
-        self.difficulty = difficulty
-
-        # Initialize game systems
-        self.universe = UniverseGenerator(difficulty)
-        self.player = Player(self.console)
-        self.economy = EconomySimulator(self.universe.planets)
-        self.event_generator = EventGenerator()
-        self.tech_tree = TechnologyTree()
-        self.storyline = Storyline()
-
-        # Game state
-        self.current_planet = None
-        self.game_over = False
-        self.status_changed = True
+# Save games, the autosave journal and the price history; CARGO_HAULER_SAVES puts them elsewhere
+SAVE_DIR = os.environ.get('CARGO_HAULER_SAVES', os.path.join(project_root, 'saves'))
+
+from src.engine import GameEngine
+from src import savegame
+from src.journal import ActionJournal
+from src.market_history import MarketHistory
+from src.presenter import TablePresenter
+from src.typewriter import Typewriter
+
+class CargoHauler(GameEngine):
+    """Interactive Rich front end; all game rules live in GameEngine."""
+
+    def __init__(self, difficulty=2, seed=None, typing_delay=0.03):
+        super().__init__(difficulty, console=Console(), seed=seed)
+        # Story text is typed out only on an interactive terminal; typing_delay=0 turns it off
+        self.typewriter = Typewriter(self.console, delay=typing_delay)
+
+    def notify(self, message):
+        self.console.print(message)
+
+    SAVEGAME = os.path.join(SAVE_DIR, 'savegame.sav')
+    AUTOSAVE = os.path.join(SAVE_DIR, 'autosave.sav')
+    MARKET_HISTORY = os.path.join(SAVE_DIR, 'market_history.dat')
 
     def start_game(self):
         self.console.print("[bold green]Welcome to Cargo Hauler![/bold green]")
-        self.current_planet = random.choice(self.universe.planets)
+        self.start()
+        os.makedirs(SAVE_DIR, exist_ok=True)
+        # A new game starts a new price history; a recovered one carries on with its own
+        self.open_market_history(reset=not self.resume_autosave())
+        ActionJournal(self.AUTOSAVE).attach(self)
         try:
             self.main_game_loop()
         except Exception as e:
@@ -51,9 +49,9 @@ class CargoHauler:
     def main_game_loop(self):
         while not self.game_over:
             try:
-                self.display_status()
-                self.generate_random_quest()  # Ensure quests are generated at the start of each turn
-                self.player_turn()
+                # One scheduler phase per iteration; travel ends the turn by
+                # requesting it rather than re-entering player_turn
+                self.scheduler.step(self.player_action)
             except KeyboardInterrupt:
                 self.console.print("\n[yellow]Game interrupted. Exiting...[/yellow]")
                 break
@@ -61,8 +59,42 @@ class CargoHauler:
                 self.console.print(f"[red]Error in game loop: {e}[/red]")
                 break
 
+        # A clean exit drops the autosave; after a crash it is offered on the next start
+        self.journal.close(remove=self.game_over)
+        self.market_history.close()
         self.console.print("[bold yellow]Thanks for playing Cargo Hauler![/bold yellow]")
 
+    def resume_autosave(self):
+        if not ActionJournal.pending(self.AUTOSAVE):
+            return False
+        answer = self.console.input("[yellow]The last session did not exit cleanly. Resume it? (y/n): [/yellow]").lower()
+        if answer not in ['y', 'yes']:
+            return False
+        try:
+            savegame.load_game(self, self.AUTOSAVE)
+            replayed = ActionJournal.replay(self, self.AUTOSAVE)
+            self.console.print(f"[green]Recovered the last session ({replayed} journaled actions replayed).[/green]")
+            return True
+        except (OSError, savegame.SaveFormatError) as e:
+            self.console.print(f"[red]Could not recover the last session: {e}[/red]")
+            return False
+
+    def open_market_history(self, reset=False):
+        """(Re)open the price history for the current market; `reset` starts it afresh."""
+        if self.market_history is not None:
+            self.market_history.close()
+        names = (self.economy.planet_names, self.economy.commodity_names)
+        history = MarketHistory(self.MARKET_HISTORY, *names, reset=reset)
+        if not history.matches(*names):
+            # Left behind by a different game
+            history.close()
+            history = MarketHistory(self.MARKET_HISTORY, *names, reset=True)
+        self.market_history = history
+
+    def player_action(self):
+        self.display_status()
+        self.player_turn()
+
     def display_status(self):
         if self.status_changed:
             try:
@@ -72,7 +104,7 @@ class CargoHauler:
 
                 table.add_row("Current Planet", self.current_planet.name)
                 table.add_row("Credits", f"{self.player.credits:.1f}")
-                table.add_row("Cargo Space", f"{self.player.cargo_used}/{self.player.cargo_capacity}")
+                table.add_row("Cargo Space", f"{self.player.cargo_used:g}/{self.player.cargo_capacity}")
                 table.add_row("Fuel Level", f"{self.player.fuel_level:.1f}/{self.player.fuel_tank_capacity}")
 
                 self.console.print(table)
@@ -121,9 +153,9 @@ class CargoHauler:
                 elif choice == 8:
                     self.customize_ship()
                 elif choice == 9:
-                    self.save_game('savegame.json')
+                    self.save_game(self.SAVEGAME)
                 elif choice == 10:
-                    self.load_game('savegame.json')
+                    self.load_game(self.SAVEGAME)
                 elif choice == 11:
                     self.game_over = True
                 else:
@@ -137,30 +169,24 @@ class CargoHauler:
         self.check_market_prices()
         self.trade_goods()
 
-    def check_market_prices(self):
-        market_overview = self.economy.get_market_overview()
-        table = Table(title="Market Prices Overview")
-        table.add_column("Planet", style="cyan")
-        for commodity in self.economy.commodities:
-            table.add_column(commodity, style="green")
-
-        for index, row in market_overview.iterrows():
-            row_style = "blue" if row['Planet'] == self.current_planet.name else "default"
-            table.add_row(row['Planet'], *[f"{row[commodity]:.1f}" for commodity in self.economy.commodities], style=row_style)
-
-        self.console.print(table)
+    def check_market_prices(self, page_size=20):
+        # Cached until the market changes; only the rows on the current page are rendered
+        snapshot = self.economy.snapshot()
+        columns = [("Planet", {"style": "cyan"})] + [(commodity, {"style": "green"}) for commodity in snapshot.commodity_names]
+        TablePresenter(
+            self.console, "Market Prices Overview", columns, len(snapshot),
+            lambda row: [snapshot.planet_names[row], *snapshot.cells(row)],
+            search=snapshot.matching, page_size=page_size, highlight=self.economy.planet_row(self.current_planet)
+        ).show()
 
     def trade_goods(self):
         try:
             self.console.print(f"[bold]Trading at {self.current_planet.name}[/bold]")
 
-            # Ensure commodities exist before trying to access them
-            if not hasattr(self.economy, 'commodities') or not self.economy.commodities:
-                self.console.print("[red]No commodities available for trading.[/red]")
-                return
-
-            # Get available commodities from the economy
-            available_commodities = list(self.economy.commodities.keys())
+            # Get available commodities from the commodity registry
+            registry = self.economy.registry
+            available_commodities = registry.names
+            local_commodities = set(registry.native_to(self.current_planet.type))
 
             if not available_commodities:
                 self.console.print("[red]No commodities available for trading.[/red]")
@@ -177,12 +203,25 @@ class CargoHauler:
                         'name': commodity,
                         'price': price
                     }
-                    self.console.print(f"{i}. {commodity}: {price:.1f} credits")
+                    local = " [cyan](local)[/cyan]" if commodity in local_commodities else ""
+                    stock = self.economy.stock(commodity, self.current_planet)
+                    self.console.print(f"{i}. {commodity} [dim]({registry.category(commodity)}, {registry.rarity(commodity)}, "
+                                       f"{registry.volume(commodity):.1f} vol/unit)[/dim]: {price:.1f} credits, {stock} in stock{local}")
                 except Exception as price_error:
                     self.console.print(f"[red]Error calculating price for {commodity}: {price_error}[/red]")
 
             # Prompt for commodity selection
-            commodity_choice = self.console.input("[yellow]Enter the number of the commodity to trade (or 0 to cancel): [/yellow]")
+            commodity_choice = self.console.input("[yellow]Enter the number of the commodity to trade, (O)rder several at once, "
+                                                  "(F)ill the cargo hold, (R)efuel, or 0 to cancel: [/yellow]").strip().lower()
+            if commodity_choice in ['o', 'order']:
+                self.order_basket(commodity_prices)
+                return
+            if commodity_choice in ['f', 'fill']:
+                self.fill_cargo()
+                return
+            if commodity_choice in ['r', 'refuel']:
+                self.refuel()
+                return
 
             try:
                 commodity_index = int(commodity_choice)
@@ -203,28 +242,12 @@ class CargoHauler:
 
                 if trade_type in ['b', 'buy']:
                     # Buying logic
-                    max_quantity = min(
-                        self.player.cargo_capacity - self.player.cargo_used,
-                        int(self.player.credits / price)
-                    )
+                    max_quantity = self.max_buy_quantity(selected_commodity)
 
                     quantity_str = self.console.input(f"[yellow]How many {selected_commodity} do you want to buy? (Max: {max_quantity}): [/yellow]")
 
                     try:
-                        quantity = int(quantity_str)
-
-                        if 0 < quantity <= max_quantity:
-                            total_cost = quantity * price
-
-                            # Perform the purchase
-                            if self.player.add_cargo(selected_commodity, quantity, price):
-                                self.console.print(f"[green]Bought {quantity} {selected_commodity} for {total_cost:.1f} credits[/green]")
-                                self.status_changed = True
-                            else:
-                                self.console.print("[red]Purchase failed. Check your cargo space or credits.[/red]")
-                        else:
-                            self.console.print("[red]Invalid quantity.[/red]")
-
+                        self.buy(selected_commodity, int(quantity_str))
                     except ValueError:
                         self.console.print("[red]Please enter a valid number.[/red]")
 
@@ -240,20 +263,7 @@ class CargoHauler:
                     quantity_str = self.console.input(f"[yellow]How many {selected_commodity} do you want to sell? (Max: {available_quantity}): [/yellow]")
 
                     try:
-                        quantity = int(quantity_str)
-
-                        if 0 < quantity <= available_quantity:
-                            total_revenue = quantity * price
-
-                            # Perform the sale
-                            if self.player.sell_cargo(selected_commodity, quantity, price):
-                                self.console.print(f"[green]Sold {quantity} {selected_commodity} for {total_revenue:.1f} credits[/green]")
-                                self.status_changed = True
-                            else:
-                                self.console.print("[red]Sale failed.[/red]")
-                        else:
-                            self.console.print("[red]Invalid quantity.[/red]")
-
+                        self.sell(selected_commodity, int(quantity_str))
                     except ValueError:
                         self.console.print("[red]Please enter a valid number.[/red]")
 
@@ -268,18 +278,62 @@ class CargoHauler:
             import traceback
             traceback.print_exc()
 
+    def order_basket(self, commodity_prices):
+        orders_str = self.console.input("[yellow]Enter orders as 'b <number> <quantity>' to buy or 's <number> <quantity>' to sell, "
+                                        "separated by commas: [/yellow]")
+        orders = []
+        for order in orders_str.split(','):
+            if not order.strip():
+                continue
+            try:
+                side, number, quantity = order.split()
+                commodity = commodity_prices[int(number)]['name']
+                quantity = int(quantity)
+            except (ValueError, KeyError):
+                self.console.print(f"[red]Invalid order: {order.strip()}[/red]")
+                return
+            if side.lower() not in ['b', 's']:
+                self.console.print(f"[red]Invalid order: {order.strip()}[/red]")
+                return
+            orders.append((commodity, quantity if side.lower() == 'b' else -quantity))
+        self.trade_basket(orders)
+
+    def fill_cargo(self):
+        sell_cargo = False
+        if self.player.inventory:
+            sell_cargo = self.console.input("[yellow]Sell your current cargo first? (y/n): [/yellow]").lower() in ['y', 'yes']
+        orders = self.plan_cargo_fill(sell_cargo=sell_cargo)
+        if not orders:
+            self.console.print("[yellow]Nothing here is worth carrying.[/yellow]")
+            return
+
+        next_stop = self.next_trade_stop()
+        market = next_stop.name if next_stop is not None else "the best market for each good"
+        table = Table(title=f"Cargo Order (valued at {market})")
+        table.add_column("Commodity", style="cyan")
+        table.add_column("Order", style="magenta")
+        table.add_column("Quantity", style="green")
+        table.add_column("Avg Price", style="yellow")
+        for commodity, quantity in orders:
+            price = self.economy.trade_price(commodity, self.current_planet, quantity)
+            table.add_row(commodity, "Buy" if quantity > 0 else "Sell", str(abs(quantity)), f"{price:.1f}")
+        self.console.print(table)
+
+        if self.console.input("[yellow]Place this order? (y/n): [/yellow]").lower() in ['y', 'yes']:
+            self.trade_basket(orders)
+
     def travel_menu(self):
         try:
             self.console.print("\nChoose a travel option:")
             travel_options = [
                 "Select Destination",
                 "Quantum Drive",
-                "Set Up Trade Route",
+                "Plan Trade Route",
                 "Frontier Jump"
             ]
             if self.player.trade_route:
-                start_planet, target_planet = self.player.trade_route
-                travel_options.append(f"Use Trade Route ({start_planet.name} → {target_planet.name})")
+                stops = " → ".join(planet.name for planet in self.player.trade_route + self.player.trade_route[:1])
+                travel_options.append(f"Use Trade Route ({stops})")
 
             for i, option in enumerate(travel_options, 1):
                 self.console.print(f"{i}. {option}")
@@ -293,7 +347,7 @@ class CargoHauler:
                 elif travel_choice == 2:
                     self.quantum_drive()
                 elif travel_choice == 3:
-                    self.set_up_trade_route()
+                    self.plan_trade_route()
                 elif travel_choice == 4:
                     self.frontier_jump()
                 elif travel_choice == 5 and self.player.trade_route:
@@ -305,195 +359,67 @@ class CargoHauler:
         except Exception as e:
             self.console.print(f"[red]Error in travel menu: {e}[/red]")
 
-    def select_destination(self):
-        self.console.print("\nSelect a destination:")
-        for i, planet in enumerate(self.universe.planets, 1):
-            self.console.print(f"{i}. {planet.name}")
-
-        choice = self.console.input("[bold yellow]Enter the number of the planet: [/bold yellow]")
-        try:
-            choice = int(choice)
-            if 1 <= choice <= len(self.universe.planets):
-                new_planet = self.universe.planets[choice - 1]
-                if new_planet != self.current_planet:
-                    self.travel_to_planet(new_planet)
-                else:
-                    self.console.print("[bold red]You are already at this planet![/bold red]")
-            else:
-                self.console.print("[bold red]Invalid choice![/bold red]")
-        except ValueError:
-            self.console.print("[bold red]Please enter a number![/bold red]")
-
-    def quantum_drive(self):
-        new_planet = random.choice(self.universe.planets)
-        if new_planet != self.current_planet:
-            self.travel_to_planet(new_planet)
-        else:
-            self.console.print("[bold red]You are already at this planet![/bold red]")
+    def select_destination(self, page_size=20):
+        routes = self.universe.routes
+        planets = routes.planets
+        # One distance row for the whole list; each page only formats its own planets
+        distances = routes.distances_from(self.current_planet)
+
+        def row(index):
+            distance = distances[index]
+            return [str(index + 1), planets[index].name, planets[index].type,
+                    f"{distance:.1f}" if distance != float('inf') else "unreachable"]
+
+        columns = [("#", {"style": "cyan"}), ("Planet", {"style": "green"}), ("Type", {}), ("Distance", {"justify": "right"})]
+        choice = TablePresenter(
+            self.console, "Select a destination", columns, len(planets), row,
+            key=lambda index: planets[index].name, page_size=page_size, fixed=2,
+            highlight=routes.row(self.current_planet)
+        ).show(select="number of the planet to travel to")
+        if choice is not None:
+            self.travel(planets[choice])
+
+    def plan_trade_route(self):
+        routes = self.plan_trade_routes()
+        if not routes:
+            self.console.print("[bold red]No profitable trade loops from here with your current ship and credits.[/bold red]")
+            return
 
-    def set_up_trade_route(self):
-        self.console.print("\nSet up a trade route:")
-        self.console.print("Select a starting planet:")
-        for i, planet in enumerate(self.universe.planets, 1):
-            self.console.print(f"{i}. {planet.name}")
+        table = Table(title=f"Best Trade Loops from {self.current_planet.name}")
+        table.add_column("#", style="cyan")
+        table.add_column("Route", style="green")
+        table.add_column("Profit", justify="right")
+        table.add_column("Fuel", justify="right")
+        table.add_column("Profit/Fuel", justify="right", style="bold")
+        for i, route in enumerate(routes, 1):
+            stops = " → ".join(planet.name for planet in route.planets + route.planets[:1])
+            table.add_row(str(i), stops, f"{route.profit:.1f}", f"{route.fuel:.1f}", f"{route.profit_per_fuel:.1f}")
+        self.console.print(table)
 
-        start_choice = self.console.input("[bold yellow]Enter the number of the starting planet: [/bold yellow]")
+        choice = self.console.input("[bold yellow]Enter the number of the route to follow (or 0 to cancel): [/bold yellow]")
         try:
-            start_choice = int(start_choice)
-            if 1 <= start_choice <= len(self.universe.planets):
-                start_planet = self.universe.planets[start_choice - 1]
-                self.console.print("Select a target planet:")
-                for i, planet in enumerate(self.universe.planets, 1):
-                    self.console.print(f"{i}. {planet.name}")
-
-                target_choice = self.console.input("[bold yellow]Enter the number of the target planet: [/bold yellow]")
-                try:
-                    target_choice = int(target_choice)
-                    if 1 <= target_choice <= len(self.universe.planets):
-                        target_planet = self.universe.planets[target_choice - 1]
-                        self.player.trade_route = [start_planet, target_planet]
-                        self.console.print(f"Trade route set from {start_planet.name} to {target_planet.name}")
-                    else:
-                        self.console.print("[bold red]Invalid choice![/bold red]")
-                except ValueError:
-                    self.console.print("[bold red]Please enter a number![/bold red]")
-            else:
+            choice = int(choice)
+            if choice == 0:
+                return
+            if not 1 <= choice <= len(routes):
                 self.console.print("[bold red]Invalid choice![/bold red]")
+                return
         except ValueError:
             self.console.print("[bold red]Please enter a number![/bold red]")
-
-    def use_trade_route(self):
-        if not self.player.trade_route:
-            self.console.print("[bold red]No trade route set![/bold red]")
-            return
-
-        start_planet, target_planet = self.player.trade_route
-        if self.current_planet != start_planet:
-            self.console.print("[bold red]You are not at the start planet of this trade route![/bold red]")
             return
 
-        if target_planet == self.current_planet:
-            self.console.print("[bold red]You are already at this planet![/bold red]")
-            return
-
-        self.travel_to_planet(target_planet)
-
-    def frontier_jump(self):
-        frontier_planet_names = [
-            "Frontier Asteroid Belt",
-            "Frontier Base",
-            "Frontier Outpost",
-            "Frontier Colony"
-        ]
-        frontier_planet_name = random.choice(frontier_planet_names)
-        frontier_planet = Planet(
-            name=frontier_planet_name,
-            planet_type="Frontier",
-            economy_level=random.uniform(0.3, 1.0),
-            resources=self.universe.generate_resources(),
-            status="Stable",
-            characteristics="Neutral",
-            demographics={
-                "Population": random.randint(1000, 10000),
-                "Cyborgs": random.randint(1, 100),
-                "Androids": random.randint(1, 100),
-                "Robots": random.randint(1, 100)
-            },
-            planet_class="Asteroid Belt",
-            moons=0,
-            geology="Rocky",
-            climate="Harsh",
-            history=self.universe.generate_history(frontier_planet_name, "Frontier", "Stable", "Neutral", {"Population": random.randint(1000, 10000), "Cyborgs": random.randint(1, 100), "Androids": random.randint(1, 100), "Robots": random.randint(1, 100)}, "Asteroid Belt", 0, "Rocky", "Harsh")
-        )
-        self.universe.planets.append(frontier_planet)
-        self.travel_to_planet(frontier_planet)
-
-    def travel_to_planet(self, planet):
-        distance = self.calculate_distance(self.current_planet, planet)
-        fuel_consumption = distance * self.player.ship_fuel_efficiency
-        if self.player.fuel_level >= fuel_consumption:
-            self.player.fuel_level = round(self.player.fuel_level - fuel_consumption, 1)
-            self.player.total_fuel_used = round(self.player.total_fuel_used + fuel_consumption, 1)
-            self.player.total_trips += 1
-            self.current_planet = planet
-            self.console.print(f"Traveled to {planet.name} using {fuel_consumption:.1f} units of fuel.")
-            self.generate_random_quest()  # Generate new quests when traveling
-            self.handle_event(self.event_generator.generate_event())
-            self.end_turn()
-
-            # Check for passenger delivery
-            self.check_passenger_delivery()
-        else:
-            self.console.print("[bold red]Not enough fuel to travel![/bold red]")
-
-    def check_passenger_delivery(self):
-        arrived_passengers = [p for p in self.player.passengers if p['destination'] == self.current_planet.name]
-        for passenger in arrived_passengers:
-            reward = passenger['reward']
-            self.player.credits += reward
-            self.console.print(f"Delivered {passenger['type']} to {self.current_planet.name}. Received {reward} credits.")
-            self.player.remove_passenger(passenger)
-
-    def handle_event(self, event):
-        event_type = event['type']
-        description = event['description']
-        self.console.print(f"[bold yellow]Event:[/bold yellow] {description}")
-
-        if event_type == 'trade_opportunity':
-            # Implement trade opportunity logic
-            commodity = random.choice(list(self.economy.commodities.keys()))
-            price = self.economy.calculate_price(commodity, self.current_planet)
-            quantity = random.randint(10, 50)
-            self.player.add_cargo(commodity, quantity, price)
-            self.console.print(f"You discovered a rare trade opportunity and acquired {quantity} units of {commodity} at {price} credits each.")
-
-        elif event_type == 'pirate_encounter':
-            # Implement pirate encounter logic
-            loss = random.uniform(0.1, 0.3) * self.player.credits
-            self.player.credits -= loss
-            self.console.print(f"Pirates attacked! You lost {loss:.1f} credits.")
-
-        elif event_type == 'market_crash':
-            # Implement market crash logic
-            for commodity in self.economy.commodities:
-                self.economy.commodities[commodity]['base_price'] *= 0.5
-            self.console.print("A sudden market crash has reduced commodity prices by 50%.")
-
-        elif event_type == 'technological_breakthrough':
-            # Implement technological breakthrough logic
-            # For example, grant a free technology upgrade
-            available_upgrades = self.tech_tree.get_available_upgrades()
-            if available_upgrades:
-                category = random.choice(list(available_upgrades.keys()))
-                upgrade = random.choice(available_upgrades[category])
-                self.apply_upgrade_effects(upgrade)
-                self.console.print(f"You've made a technological breakthrough: {upgrade['name']} has been granted to you for free.")
+        route = routes[choice - 1]
+        self.set_trade_route(route.planets)
+        for leg in route.legs:
+            if leg['commodity'] is None:
+                self.console.print(f"  {leg['source'].name} → {leg['target'].name}: fly empty")
             else:
-                self.console.print("You've made a technological breakthrough, but no upgrades are available at this time.")
-
-        elif event_type == 'fuel_shortage':
-            # Implement fuel shortage logic
-            self.player.fuel_level *= 0.5
-            self.console.print("A fuel shortage has reduced your fuel level by 50%.")
-
-        elif event_type == 'cargo_loss':
-            # Implement cargo loss logic
-            if self.player.inventory:
-                commodity = random.choice(list(self.player.inventory.keys()))
-                loss_quantity = random.randint(1, self.player.inventory[commodity]['quantity'])
-                self.player.inventory[commodity]['quantity'] -= loss_quantity
-                self.console.print(f"You lost {loss_quantity} units of {commodity} due to an accident.")
-            else:
-                self.console.print("You narrowly avoided cargo loss as you have no cargo on board.")    
-    
-    def calculate_distance(self, planet1, planet2):
-        # Placeholder for actual distance calculation logic
-        return random.uniform(1, 10)
+                self.console.print(f"  {leg['source'].name} → {leg['target'].name}: buy {leg['units']} {leg['commodity']} "
+                                   f"(+{leg['profit']:.1f} credits)")
 
     def end_turn(self):
+        super().end_turn()
         self.console.print("\n[bold yellow]End of turn.[/bold yellow]")
-        self.status_changed = True
-        self.player_turn()
 
     def upgrade_ship(self):
         available_upgrades = self.tech_tree.get_available_upgrades()
@@ -516,42 +442,12 @@ class CargoHauler:
         try:
             upgrade_index = int(upgrade_choice)
             if 1 <= upgrade_index <= len(upgrade_options):
-                selected_upgrade = upgrade_options[upgrade_index - 1]
-                if self.player.credits >= selected_upgrade['cost']:
-                    self.player.credits -= selected_upgrade['cost']
-                    # Apply upgrade effects
-                    self.apply_upgrade_effects(selected_upgrade)
-                    self.console.print(f"Purchased {selected_upgrade['name']} for {selected_upgrade['cost']:.1f} credits.")
-                    self.status_changed = True
-                else:
-                    self.console.print("Insufficient credits to purchase this upgrade.")
+                self.purchase_upgrade(upgrade_options[upgrade_index - 1])
             else:
                 self.console.print("[bold red]Invalid choice![/bold red]")
         except ValueError:
             self.console.print("[bold red]Please enter a number![/bold red]")
 
-    def apply_upgrade_effects(self, upgrade):
-        category = upgrade['category']
-        upgrade_name = upgrade['name']
-        effects = upgrade['effects']
-
-        if category == 'cargo':
-            self.player.cargo_capacity = effects['cargo_capacity']
-            self.console.print(f"Cargo capacity increased to {self.player.cargo_capacity}")
-        elif category == 'ship_level':
-            self.player.ship_level += 1
-            self.console.print(f"Ship level increased to {self.player.ship_level}")
-        elif category == 'fuel_efficiency':
-            self.player.ship_fuel_efficiency = effects['fuel_efficiency']
-            self.console.print(f"Fuel efficiency increased to {self.player.ship_fuel_efficiency}")
-        elif category == 'life_support':
-            self.player.life_support_expansion = effects['life_support_capacity']
-            self.console.print(f"Life support capacity increased to {self.player.life_support_expansion}")
-        elif category == 'passenger_pod':
-            self.player.passenger_pod_capacity = effects['passenger_pod_capacity']
-            self.console.print(f"Passenger pod capacity increased to {self.player.passenger_pod_capacity}")
-        # Add other categories and effects as needed
-
     def view_technologies(self):
         self.console.print("Current Technologies:")
         for category, techs in self.tech_tree.technologies.items():
@@ -564,51 +460,77 @@ class CargoHauler:
         if not storyline:
             self.console.print("No storyline available yet.")
             return
-        self.console.print("Storyline:")
-        for entry in storyline:
-            self.display_storyline_entry(entry)
+        self.console.print("Storyline:" + (" [dim](Enter to skip)[/dim]" if self.typewriter.enabled else ""))
+        self.typewriter.type_all(storyline)
 
     def get_storyline(self):
         return self.storyline.get_story_up_to_level(self.player.level)
 
-    def display_storyline_entry(self, entry):
-        self.console.print(f"[bold yellow]Press any key to continue...[/bold yellow]")
-        for char in entry:
-            self.console.print(char, end='')
-            time.sleep(0.05)  # Adjust the speed as needed
-        self.console.input()
-
-    def view_trade_statistics(self):
+    def view_trade_statistics(self, page_size=10):
+        # The totals are kept up to date as trades happen and the history reads one page,
+        # so the screen costs the same however many trades were made
+        ledger = self.player.ledger
         self.console.print("Trade Statistics:")
+        self.console.print(f"Trades: {len(ledger)}")
         self.console.print(f"Total Profit: {self.player.total_profit:.1f} credits")
         self.console.print(f"Total Loss: {self.player.total_loss:.1f} credits")
         self.console.print(f"Total Spent: {self.player.total_spent:.1f} credits")
-        self.console.print(f"Most Profitable Good: {self.player.most_profitable_good}")
+        self.console.print(f"Total Earned: {ledger.earned:.1f} credits")
+        if self.player.most_profitable_good:
+            self.console.print(f"Most Profitable Good: {self.player.most_profitable_good['good']} "
+                               f"({self.player.most_profitable_good['profit']:.1f} credits)")
+        else:
+            self.console.print("Most Profitable Good: None")
         self.console.print(f"Most Profitable Trade Route: {self.player.most_profitable_route}")
+        best_planet = ledger.best_planet()
+        if best_planet is not None and best_planet[1] > 0:
+            self.console.print(f"Most Profitable Market: {best_planet[0]} ({best_planet[1]:.1f} credits)")
         self.console.print(f"Total Fuel Used: {self.player.total_fuel_used:.1f} units")
         if self.player.total_trips > 0:
             self.console.print(f"Average Fuel Consumption per Trip: {self.player.total_fuel_used / self.player.total_trips:.1f} units")
         else:
             self.console.print(f"Average Fuel Consumption per Trip: 0.0 units")
 
-        # Display a table of trade history
-        table = Table(title="Trade History")
-        table.add_column("Transaction ID", style="cyan")
-        table.add_column("Good", style="magenta")
-        table.add_column("Quantity", style="green")
-        table.add_column("Price per Unit", style="yellow")
-        table.add_column("Total", style="bold")
-
-        for transaction in self.player.trade_history:
-            table.add_row(
+        # Trade history, paged: only the fills on the page shown are read from the ledger
+        def row(index):
+            transaction = ledger.rows(index, index + 1)[0]
+            return [
                 str(transaction['id']),
+                str(transaction['turn']),
+                transaction['planet'],
                 transaction['good'],
+                transaction['side'].capitalize(),
                 str(transaction['quantity']),
-                str(transaction['price_per_unit']),
-                str(transaction['total'])
-            )
+                f"{transaction['price_per_unit']:.1f}",
+                f"{transaction['total']:.1f}",
+                f"{transaction['pnl']:.1f}" if transaction['side'] == 'sell' else ""
+            ]
 
-        self.console.print(table)
+        def key(index):
+            return f"{ledger.planet_names[ledger.planets[index]]} {ledger.registry.names[ledger.commodities[index]]}"
+
+        columns = [
+            ("Transaction ID", {"style": "cyan"}), ("Turn", {"style": "cyan"}), ("Planet", {"style": "blue"}),
+            ("Good", {"style": "magenta"}), ("Side", {}), ("Quantity", {"style": "green"}),
+            ("Price per Unit", {"style": "yellow"}), ("Total", {"style": "bold"}), ("Profit", {"style": "bold"})
+        ]
+        # Newest trades first: open on the last page
+        presenter = TablePresenter(self.console, "Trade History", columns, len(ledger), row, key=key, page_size=page_size)
+        presenter.show(page=max(len(ledger) - 1, 0) // page_size)
+        self.chart_price_history()
+
+    def chart_price_history(self):
+        history = self.market_history
+        if history is None or len(history) < 2 or self.current_planet.name not in history.planet_index:
+            return
+        commodity = self.console.input(f"[yellow]Chart price history at {self.current_planet.name} for which commodity? (name, or Enter to skip): [/yellow]").strip()
+        if not commodity:
+            return
+        if commodity not in history.commodity_index:
+            self.console.print(f"[red]Unknown commodity: {commodity}[/red]")
+            return
+        from src.visualization import visualize_market_trends
+        visualize_market_trends(history.trend_frame([commodity], self.current_planet.name))
 
     def scan_spaceport(self):
         self.console.print("Spaceport Information:")
@@ -619,7 +541,7 @@ class CargoHauler:
 
         table.add_row("Name", current_planet.name)
         table.add_row("Type", current_planet.type)
-        table.add_row("Fuel Price", f"{self.economy.calculate_price('fuel', current_planet):.1f} credits")
+        table.add_row("Fuel Price", f"{self.economy.calculate_price('Fuel', current_planet):.1f} credits")
         resources_display = ", ".join([f"{r}: {v:.1f}" for r, v in current_planet.resources.items() if r != 'fuel'])
         table.add_row("Resources", resources_display)
         table.add_row("Status", current_planet.status)
@@ -633,21 +555,9 @@ class CargoHauler:
         self.console.print(table)
 
         # Check for quest completion
-        for quest in self.player.active_quests:
-            if quest['conditions']['destination'] == current_planet.name:
-                self.console.print(f"[bold green]Quest completed: {quest['description']}[/bold green]")
-                self.player.complete_quest(quest)
-
-        # Determine the number of quests to display based on the player's level
-        if self.player.level <= 3:
-            max_quests = 1
-        elif self.player.level <= 10:
-            max_quests = 2
-        else:
-            max_quests = 3
+        self.complete_quests()
 
-        # Ensure we only sample as many quests as are available
-        available_quests = random.sample(self.universe.quests, min(max_quests, len(self.universe.quests)))
+        available_quests = self.available_quests()
 
         # Add quest system
         self.console.print("\nAvailable Quests:")
@@ -665,11 +575,7 @@ class CargoHauler:
             try:
                 quest_index = int(quest_choice)
                 if 1 <= quest_index <= len(available_quests):
-                    selected_quest = available_quests[quest_index - 1]
-                    self.player.accept_quest(selected_quest)
-                    self.universe.quests.remove(selected_quest)
-                    # Clear available quests after accepting a quest
-                    self.universe.quests = []
+                    self.accept_quest(available_quests[quest_index - 1])
                 else:
                     self.console.print("[bold red]Invalid choice![/bold red]")
             except ValueError:
@@ -678,14 +584,7 @@ class CargoHauler:
     def customize_ship(self):
         self.console.print("Ship Customization:")
         self.console.print("Allocate resources to different ship components:")
-        components = [
-            ("Cargo Capacity", 5000),
-            ("Fuel Efficiency", 3000),
-            ("Ship Speed", 2000),
-            ("Life Support", 4000),
-            ("Radiation Shield", 6000),
-            ("Business Class Module", 8000)
-        ]
+        components = self.SHIP_COMPONENTS
         for i, (component, price) in enumerate(components, 1):
             self.console.print(f"{i}. {component} (Cost: {price:.1f} credits)")
 
@@ -694,91 +593,29 @@ class CargoHauler:
         try:
             choice = int(choice)
             if 1 <= choice <= len(components):
-                component, price = components[choice - 1]
-                if self.player.credits >= price:
-                    self.player.credits -= price
-                    if component == "Cargo Capacity":
-                        self.player.cargo_capacity += 50
-                        self.console.print(f"Cargo capacity increased to {self.player.cargo_capacity}")
-                    elif component == "Fuel Efficiency":
-                        self.player.ship_fuel_efficiency += 0.1
-                        self.console.print(f"Fuel efficiency increased to {self.player.ship_fuel_efficiency}")
-                    elif component == "Ship Speed":
-                        self.player.ship_speed += 0.1
-                        self.console.print(f"Ship speed increased to {self.player.ship_speed}")
-                    elif component == "Life Support":
-                        self.player.life_support_expansion += 10
-                        self.console.print(f"Life support capacity increased to {self.player.life_support_expansion}")
-                    elif component == "Radiation Shield":
-                        self.player.radiation_shield = True
-                        self.console.print("Radiation Shield installed.")
-                    elif component == "Business Class Module":
-                        self.player.business_class_module = True
-                        self.console.print("Business Class Module installed.")
-                else:
-                    self.console.print("Insufficient credits to purchase this upgrade.")
+                self.install_component(components[choice - 1][0])
             else:
                 self.console.print("[bold red]Invalid choice![/bold red]")
         except ValueError:
             self.console.print("[bold red]Please enter a number![/bold red]")
 
     def save_game(self, filename):
-        game_state = {
-            'player': self.player.__dict__,
-            'universe': {
-                'planets': [planet.__dict__ for planet in self.universe.planets],
-                'quests': self.universe.quests
-            },
-            'current_planet': self.current_planet.name,
-            'game_over': self.game_over,
-            'status_changed': self.status_changed
-        }
-        with open(filename, 'w') as file:
-            json.dump(game_state, file)
-        self.console.print(f"Game saved to {filename}")
+        try:
+            savegame.save_game(self, filename)
+            self.console.print(f"Game saved to {filename}")
+        except OSError as e:
+            self.console.print(f"[red]Could not save game: {e}[/red]")
 
     def load_game(self, filename):
-        with open(filename, 'r') as file:
-            game_state = json.load(file)
-            self.player = Player(self.console)
-            self.player.__dict__.update(game_state['player'])
-            self.universe.planets = [Planet(**planet) for planet in game_state['universe']['planets']]
-            self.universe.quests = game_state['universe']['quests']
-            self.current_planet = next(planet for planet in self.universe.planets if planet.name == game_state['current_planet'])
-            self.game_over = game_state['game_over']
-            self.status_changed = game_state['status_changed']
-        self.console.print(f"Game loaded from {filename}")
-
-    def accept_quest(self, quest):
-        # Check if the player has the required upgrades for passenger transport quests
-        if quest['type'] == 'passenger_transport':
-            if self.player.passenger_pod_capacity < quest['conditions']['quantity']:
-                self.console.print("[bold red]You do not have enough passenger pod capacity to accept this quest.[/bold red]")
-                return
-            if self.player.life_support_expansion < quest['conditions']['quantity']:
-                self.console.print("[bold red]You do not have enough life support expansion to accept this quest.[/bold red]")
-                return
-
-        # Accept the quest
-        self.console.print(f"Quest accepted: {quest['description']}")
-        self.player.accept_quest(quest)
-
-    def generate_random_quest(self):
-        # Determine the number of quests to generate based on the player's level
-        if self.player.level <= 3:
-            num_quests = 1
-        elif self.player.level <= 10:
-            num_quests = 2
-        else:
-            num_quests = 3
-
-        # Generate random quests and add them to the universe quests list
-        random_quests = random.sample(self.universe.quests, min(num_quests, len(self.universe.quests)))
-        for quest in random_quests:
-            self.console.print(f"\n[bold yellow]New Quest Available:[/bold yellow]")
-            self.console.print(f"{quest['description']}")
-            self.console.print(f"Backstory: {quest['backstory']}")
-            self.universe.quests.append(quest)
+        try:
+            savegame.load_game(self, filename)
+            ActionJournal.replay(self, filename)
+            # Autosave and the price history continue from the loaded game
+            self.journal.snapshot(self)
+            self.open_market_history(reset=True)
+            self.console.print(f"Game loaded from {filename}")
+        except (OSError, savegame.SaveFormatError) as e:
+            self.console.print(f"[red]Could not load game: {e}[/red]")
 
 def main():
     try:
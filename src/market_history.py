@@ -0,0 +1,151 @@
+import os
+import json
+
+import numpy as np
+
+MAGIC = b'CHMARKET'
+HEADER_SIZE = 16  # MAGIC, then the tick count as uint64
+
+class MarketHistory:
+    """
+    Append-only, memory-mapped record of the market after every tick.
+
+    The file is a flat array of fixed-width records, one per tick: the turn
+    and the planet x commodity price (float32) and stock (int32) matrices.
+    Record width is fixed when the file is created, with room for
+    `planet_headroom` planets beyond the current market; planets added after
+    that are not recorded. The file grows `chunk_ticks` records at a time and
+    is memory-mapped, so appending is a copy into the map and `window` returns
+    views into the file without reading the rest of the history. A 16-byte
+    header holds the tick count; planet and commodity names live in a small
+    JSON file next to it. An existing file is reopened, unless `reset` asks
+    for a new history; `record` refuses a market whose planet rows or
+    commodity columns are not the ones the file was written for.
+    """
+
+    def __init__(self, path, planet_names, commodity_names, planet_headroom=64, chunk_ticks=1024, reset=False):
+        self.path = path
+        self.names_path = path + '.json'
+        self.chunk_ticks = chunk_ticks
+
+        if not reset and os.path.exists(path) and os.path.exists(self.names_path):
+            with open(self.names_path, 'r') as file:
+                names = json.load(file)
+            self.planet_names = names['planets']
+            self.commodity_names = names['commodities']
+            self.planet_capacity = names['planet_capacity']
+        else:
+            self.planet_names = list(planet_names)
+            self.commodity_names = list(commodity_names)
+            self.planet_capacity = len(self.planet_names) + planet_headroom
+            with open(path, 'wb') as file:
+                file.write(MAGIC + bytes(HEADER_SIZE - len(MAGIC)))
+            self.write_names()
+
+        with open(path, 'rb') as file:
+            if file.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} is not a market history file")
+
+        self.planet_index = {name: row for row, name in enumerate(self.planet_names)}
+        self.commodity_index = {name: column for column, name in enumerate(self.commodity_names)}
+        shape = (self.planet_capacity, len(self.commodity_names))
+        self.dtype = np.dtype([('turn', '<i4'), ('prices', '<f4', shape), ('quantities', '<i4', shape)])
+        self.header = np.memmap(path, dtype='<u8', mode='r+', offset=len(MAGIC), shape=(1,))
+        self.records = None
+        self._checked_names = None  # the economy planet name list last found to match
+        self.map_file()
+
+    @property
+    def ticks(self):
+        return int(self.header[0])
+
+    def map_file(self):
+        capacity = (os.path.getsize(self.path) - HEADER_SIZE) // self.dtype.itemsize
+        if capacity <= self.ticks:
+            # Grow the file by a chunk and map the larger file
+            capacity = self.ticks + self.chunk_ticks
+            with open(self.path, 'r+b') as file:
+                file.truncate(HEADER_SIZE + capacity * self.dtype.itemsize)
+        self.records = np.memmap(self.path, dtype=self.dtype, mode='r+', offset=HEADER_SIZE, shape=(capacity,))
+
+    def write_names(self):
+        with open(self.names_path, 'w') as file:
+            json.dump({
+                'planets': self.planet_names,
+                'commodities': self.commodity_names,
+                'planet_capacity': self.planet_capacity
+            }, file)
+
+    def __len__(self):
+        return self.ticks
+
+    def matches(self, planet_names, commodity_names):
+        """Whether this is the history of a market with these planet rows and commodity columns."""
+        rows = min(len(planet_names), len(self.planet_names))
+        return list(commodity_names) == self.commodity_names and list(planet_names[:rows]) == self.planet_names[:rows]
+
+    def record(self, turn, economy):
+        """
+        Append the economy's current prices and stock as one tick.
+
+        Raises:
+            ValueError: The economy is not the market this file records (e.g. another game was loaded)
+        """
+        # Loading a game replaces the economy's name list, so it is only compared when it changes
+        if economy.planet_names is not self._checked_names:
+            if not self.matches(economy.planet_names, economy.commodity_names):
+                raise ValueError(f"{self.path} records a different market")
+            self._checked_names = economy.planet_names
+
+        new_planets = economy.planet_names[len(self.planet_names):self.planet_capacity]
+        if new_planets:
+            for name in new_planets:
+                self.planet_index[name] = len(self.planet_names)
+                self.planet_names.append(name)
+            self.write_names()
+
+        if self.ticks >= len(self.records):
+            self.records.flush()
+            self.map_file()
+
+        rows = min(len(economy.planet_names), self.planet_capacity)
+        record = self.records[self.ticks]
+        record['turn'] = turn
+        record['prices'][:rows] = economy.prices[:rows]
+        if economy.shocks:
+            # Record the prices traders saw: scale only the shocked cells
+            economy.shocks.apply(record['prices'][:rows])
+        record['quantities'][:rows] = economy.quantities[:rows]
+        self.header[0] += 1
+
+    def window(self, start=0, stop=None):
+        """Records for ticks [start, stop) as a view into the file (no copy)."""
+        stop = self.ticks if stop is None else min(stop, self.ticks)
+        return self.records[start:stop]
+
+    def series(self, commodity, planet, start=0, stop=None):
+        """
+        Price and stock of one commodity on one planet over a window of ticks.
+
+        Returns:
+            tuple: (turns, prices, quantities) arrays, views into the file
+        """
+        records = self.window(start, stop)
+        row = self.planet_index[planet]
+        column = self.commodity_index[commodity]
+        return records['turn'], records['prices'][:, row, column], records['quantities'][:, row, column]
+
+    def trend_frame(self, commodities, planet, start=0, stop=None):
+        """Long-format time/price/commodity frame, as visualize_market_trends expects."""
+        import pandas as pd
+        frames = []
+        for commodity in commodities:
+            turns, prices, _ = self.series(commodity, planet, start, stop)
+            frames.append(pd.DataFrame({'time': turns, 'price': prices, 'commodity': commodity}))
+        return pd.concat(frames, ignore_index=True)
+
+    def close(self):
+        if self.records is not None:
+            self.records.flush()
+            self.header.flush()
+            self.records = None
@@ -1,17 +1,18 @@
 import random
-from rich.console import Console
 from rich.table import Table
-import time
-import json
+
+from src.cargo import CargoHold
+from src.ledger import BUY, SELL, TradeLedger
 
 class Player:
-    def __init__(self, console):
+    def __init__(self, console, rng=None, registry=None):
         # Existing attributes
         self.console = console
+        self.rng = rng if rng is not None else random.Random()
         self.credits = 10000
-        self.inventory = {}
+        self.hold = CargoHold(capacity=100, registry=registry)
         self.trade_route = []
-        self.trade_history = []
+        self.ledger = TradeLedger(registry=self.hold.registry)
         self.total_profit = 0
         self.total_loss = 0
         self.total_spent = 0
@@ -19,13 +20,12 @@ class Player:
         self.most_profitable_route = None
         self.life_support_expansion = 0
         self.passenger_pod_capacity = 0
-        self.cargo_capacity = 100
-        self.cargo_used = 0
         self.level = 1
         self.experience = 0
         self.active_quests = []
         self.ship_level = 1
         self.ship_fuel_efficiency = 1.0
+        self.ship_speed = 1.0
         self.fuel_tank_capacity = 100
         self.fuel_level = 100
         self.total_fuel_used = 0
@@ -34,6 +34,24 @@ class Player:
         self.business_class_module = False
         self.passengers = []
 
+    # The cargo hold tracks the cargo and the volume it takes
+
+    @property
+    def inventory(self):
+        return self.hold
+
+    @property
+    def cargo_capacity(self):
+        return self.hold.capacity
+
+    @cargo_capacity.setter
+    def cargo_capacity(self, capacity):
+        self.hold.capacity = capacity
+
+    @property
+    def cargo_used(self):
+        return self.hold.used
+
     def add_passenger(self, passenger):
         if len(self.passengers) < self.passenger_pod_capacity:
             self.passengers.append(passenger)
@@ -65,17 +83,35 @@ class Player:
 
         self.console.print(table)
 
+    def record_trade(self, good, quantity, price_per_unit, side, profit=0.0, planet=None, turn=0):
+        # Every fill goes into the ledger; the statistics follow its running totals
+        self.ledger.record(turn, planet, good, quantity, price_per_unit, side, profit)
+        if side == BUY:
+            self.total_spent = self.ledger.spent
+        else:
+            self.update_trade_statistics(good, profit)
+
     def update_trade_statistics(self, good, profit):
         if profit > 0:
             self.total_profit += profit
-            if self.most_profitable_good is None or profit > self.most_profitable_good['profit']:
-                self.most_profitable_good = {
-                    'good': good,
-                    'profit': profit
-                }
         else:
             self.total_loss += abs(profit)
 
+        # Realized profit per good and per route, from the ledger
+        best_good = self.ledger.best_good()
+        if best_good is not None and best_good[1] > 0:
+            self.most_profitable_good = {
+                'good': best_good[0],
+                'profit': best_good[1]
+            }
+        else:
+            self.most_profitable_good = None
+        best_route = self.ledger.best_route()
+        if best_route is not None and best_route[1] > 0:
+            self.most_profitable_route = f"{best_route[0]} ({best_route[1]:.1f} credits)"
+        else:
+            self.most_profitable_route = None
+
     def view_trade_statistics(self):
         table = Table(title="Trade Statistics")
         table.add_column("Metric", style="cyan")
@@ -101,7 +137,7 @@ class Player:
 
         self.console.print(table)
 
-    def add_cargo(self, good, quantity, price_per_unit):
+    def add_cargo(self, good, quantity, price_per_unit, planet=None, turn=0):
         """
         Add cargo to the player's inventory
 
@@ -109,67 +145,46 @@ class Player:
             good (str): Name of the commodity
             quantity (int): Number of units to add
             price_per_unit (float): Price per unit
+            planet (str): Planet bought at, for the trade ledger
+            turn (int): Turn of the purchase, for the trade ledger
 
         Returns:
             bool: True if successful, False otherwise
         """
         # Validate inputs
-        if not isinstance(good, str):
-            print(f"[ERROR] Invalid good type: {type(good)}")
+        if not isinstance(good, str) or good not in self.hold.registry.index:
+            self.console.print(f"[red]Invalid good: {good}[/red]")
             return False
 
         try:
             quantity = int(quantity)
             price_per_unit = float(price_per_unit)
         except (ValueError, TypeError):
-            print(f"[ERROR] Invalid quantity or price: {quantity}, {price_per_unit}")
+            self.console.print(f"[red]Invalid quantity or price: {quantity}, {price_per_unit}[/red]")
+            return False
+
+        if quantity <= 0:
+            self.console.print(f"[red]Invalid quantity: {quantity}[/red]")
             return False
 
-        # Check cargo space
-        if self.cargo_used + quantity > self.cargo_capacity:
-            print("[ERROR] Not enough cargo space")
+        # Check cargo space (by volume)
+        if self.hold.volume([(good, quantity)]) > self.hold.free:
+            self.console.print("[red]Not enough cargo space[/red]")
             return False
 
         # Check credits
         total_cost = quantity * price_per_unit
         if total_cost > self.credits:
-            print("[ERROR] Not enough credits")
+            self.console.print("[red]Not enough credits[/red]")
             return False
 
-        # Add or update cargo
-        if good in self.inventory:
-            # Update existing cargo entry
-            existing_entry = self.inventory[good]
-
-            # Ensure the entry is a dictionary
-            if not isinstance(existing_entry, dict):
-                existing_entry = {
-                    'quantity': 0,
-                    'buy_price': price_per_unit
-                }
-
-            # Update quantity and recalculate average buy price
-            total_quantity = existing_entry.get('quantity', 0) + quantity
-            total_value = (existing_entry.get('quantity', 0) * existing_entry.get('buy_price', price_per_unit)) + (quantity * price_per_unit)
-
-            self.inventory[good] = {
-                'quantity': total_quantity,
-                'buy_price': total_value / total_quantity
-            }
-        else:
-            # Create new cargo entry
-            self.inventory[good] = {
-                'quantity': quantity,
-                'buy_price': price_per_unit
-            }
-
-        # Update player's state
-        self.cargo_used += quantity
+        self.hold.add(good, quantity, price_per_unit)
         self.credits -= total_cost
+        self.record_trade(good, quantity, price_per_unit, BUY, planet=planet, turn=turn)
 
         return True
 
-    def sell_cargo(self, good, quantity, price_per_unit):
+    def sell_cargo(self, good, quantity, price_per_unit, planet=None, turn=0):
         """
         Sell cargo from the player's inventory
 
@@ -177,62 +192,115 @@ class Player:
             good (str): Name of the commodity
             quantity (int): Number of units to sell
             price_per_unit (float): Price per unit
+            planet (str): Planet sold at, for the trade ledger
+            turn (int): Turn of the sale, for the trade ledger
 
         Returns:
             bool: True if successful, False otherwise
         """
         # Validate inputs
-        if good not in self.inventory:
-            print(f"[ERROR] No {good} in cargo")
+        if good not in self.hold:
+            self.console.print(f"[red]No {good} in cargo[/red]")
             return False
 
         try:
             quantity = int(quantity)
             price_per_unit = float(price_per_unit)
         except (ValueError, TypeError):
-            print(f"[ERROR] Invalid quantity or price: {quantity}, {price_per_unit}")
+            self.console.print(f"[red]Invalid quantity or price: {quantity}, {price_per_unit}[/red]")
             return False
 
         # Check available quantity
-        cargo_entry = self.inventory[good]
-
-        # Ensure cargo_entry is a dictionary
-        if not isinstance(cargo_entry, dict):
-            print(f"[ERROR] Invalid cargo entry for {good}")
-            return False
-
-        available_quantity = cargo_entry.get('quantity', 0)
-
-        if quantity > available_quantity:
-            print(f"[ERROR] Not enough {good} to sell")
+        if not 0 < quantity <= self.hold.quantity(good):
+            self.console.print(f"[red]Not enough {good} to sell[/red]")
             return False
 
-        # Calculate profit
-        buy_price = self.inventory[good]['buy_price']
+        # Unload, then calculate profit against the average buy price
+        buy_price = self.hold.remove(good, quantity)
         profit = (price_per_unit - buy_price) * quantity
 
         # Gain experience
         self.gain_experience(profit)
 
         # Update trade statistics
-        self.update_trade_statistics(good, profit)
+        self.record_trade(good, quantity, price_per_unit, SELL, profit, planet, turn)
+
+        self.credits += quantity * price_per_unit
+
+        return True
+
+    def trade_basket(self, buys, sells, planet=None, turn=0):
+        """
+        Buy and sell several goods as one transaction
+
+        Space and credits are checked once for the whole basket, counting what
+        the sales free up, and nothing changes unless all of it goes through.
+
+        Args:
+            buys (list): (good, quantity, price per unit) tuples
+            sells (list): (good, quantity, price per unit) tuples
+            planet (str): Planet traded at, for the trade ledger
+            turn (int): Turn of the trades, for the trade ledger
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            buys = [(good, int(quantity), float(price)) for good, quantity, price in buys]
+            sells = [(good, int(quantity), float(price)) for good, quantity, price in sells]
+            freed = self.hold.volume(sells)
+            needed = self.hold.volume(buys)
+        except (ValueError, TypeError) as error:
+            self.console.print(f"[red]Invalid order: {error}[/red]")
+            return False
 
-        # Calculate total revenue
-        total_revenue = quantity * price_per_unit
+        if len({good for good, _, _ in sells}) < len(sells):
+            self.console.print("[red]Sell each good once per order[/red]")
+            return False
+        for good, quantity, _ in sells:
+            if not 0 < quantity <= self.hold.quantity(good):
+                self.console.print(f"[red]Not enough {good} to sell[/red]")
+                return False
+        if any(quantity <= 0 for _, quantity, _ in buys):
+            self.console.print("[red]Invalid quantity in order[/red]")
+            return False
 
-        # Update cargo
-        cargo_entry['quantity'] -= quantity
+        if round(self.cargo_used - freed, 2) + needed > self.cargo_capacity + 1e-9:
+            self.console.print("[red]Not enough cargo space[/red]")
+            return False
 
-        # Remove entry if quantity becomes zero
-        if cargo_entry['quantity'] == 0:
-            del self.inventory[good]
+        revenue = sum(quantity * price for _, quantity, price in sells)
+        total_cost = sum(quantity * price for _, quantity, price in buys)
+        if total_cost > self.credits + revenue:
+            self.console.print("[red]Not enough credits[/red]")
+            return False
 
-        # Update player's state
-        self.cargo_used -= quantity
-        self.credits += total_revenue
+        if sells:
+            buy_prices = self.hold.remove_many([(good, quantity) for good, quantity, _ in sells]).tolist()
+            for (good, quantity, price), buy_price in zip(sells, buy_prices):
+                profit = (price - buy_price) * quantity
+                self.gain_experience(profit)
+                self.record_trade(good, quantity, price, SELL, profit, planet, turn)
+        if buys:
+            self.hold.add_many(buys)
+            for good, quantity, price in buys:
+                self.record_trade(good, quantity, price, BUY, planet=planet, turn=turn)
+        self.credits += revenue - total_cost
 
         return True
 
+    def remove_cargo(self, good, quantity):
+        """
+        Remove cargo without selling it, e.g. lost in an accident
+
+        Returns:
+            bool: True if the hold had that much of the good, False otherwise
+        """
+        if not 0 < quantity <= self.hold.quantity(good):
+            return False
+        self.hold.remove(good, quantity)
+        return True
+
     def gain_experience(self, amount):
         self.experience += amount
         self.check_level_up()
@@ -274,163 +342,3 @@ class Player:
             self.console.print(f"\n{category}:")
             for tech_name, tech_info in techs.items():
                 self.console.print(f"- {tech_name} (Level {tech_info['level']})")
-
-    def view_storyline(self):
-        storyline = self.get_storyline()
-        if not storyline:
-            self.console.print("No storyline available yet.")
-            return
-        self.console.print("Storyline:")
-        for entry in storyline:
-            self.display_storyline_entry(entry)
-
-    def get_storyline(self):
-        return self.storyline.get_story_up_to_level(self.level)
-
-    def display_storyline_entry(self, entry):
-        self.console.print(f"[bold yellow]Press any key to continue...[/bold yellow]")
-        for char in entry:
-            self.console.print(char, end='')
-            time.sleep(0.05)  # Adjust the speed as needed
-        self.console.input()
-
-    def view_trade_statistics1(self):
-        self.console.print("Trade Statistics:")
-        self.console.print(f"Total Profit: {self.total_profit:.1f} credits")
-        self.console.print(f"Total Loss: {self.total_loss:.1f} credits")
-        self.console.print(f"Total Spent: {self.total_spent:.1f} credits")
-        self.console.print(f"Most Profitable Good: {self.most_profitable_good}")
-        self.console.print(f"Most Profitable Trade Route: {self.most_profitable_route}")
-        self.console.print(f"Total Fuel Used: {self.total_fuel_used:.1f} units")
-        if self.total_trips > 0:
-            self.console.print(f"Average Fuel Consumption per Trip: {self.total_fuel_used / self.total_trips:.1f} units")
-        else:
-            self.console.print(f"Average Fuel Consumption per Trip: 0.0 units")
-
-        # Display a table of trade history
-        table = Table(title="Trade History")
-        table.add_column("Transaction ID", style="cyan")
-        table.add_column("Good", style="magenta")
-        table.add_column("Quantity", style="green")
-        table.add_column("Price per Unit", style="yellow")
-        table.add_column("Total", style="bold")
-
-        for transaction in self.trade_history:
-            table.add_row(
-                str(transaction['id']),
-                transaction['good'],
-                str(transaction['quantity']),
-                str(transaction['price_per_unit']),
-                str(transaction['total'])
-            )
-
-        self.console.print(table)
-
-    def scan_spaceport(self):
-        self.console.print("Spaceport Information:")
-        current_planet = self.current_planet
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("Attribute", style="cyan")
-        table.add_column("Value", style="magenta")
-
-        table.add_row("Name", current_planet.name)
-        table.add_row("Type", current_planet.type)
-        table.add_row("Fuel Price", f"{self.economy.calculate_price('fuel', current_planet):.1f} credits")
-        resources_display = ", ".join([f"{r}: {v:.1f}" for r, v in current_planet.resources.items() if r != 'fuel'])
-        table.add_row("Resources", resources_display)
-        table.add_row("Status", current_planet.status)
-        table.add_row("Characteristics", current_planet.characteristics)
-        demographics_display = f"Population: {current_planet.demographics['Population']}, Cyborgs: {current_planet.demographics['Cyborgs']}, Androids: {current_planet.demographics['Androids']}, Robots: {current_planet.demographics['Robots']}"
-        table.add_row("Demographics", demographics_display)
-        description_display = f"Class: {current_planet.planet_class}, Moons: {current_planet.moons}, Geology: {current_planet.geology}, Climate: {current_planet.climate}"
-        table.add_row("Description and Environment", description_display)
-        table.add_row("History", current_planet.history)
-
-        self.console.print(table)
-
-        # Check for quest completion
-        for quest in self.player.active_quests:
-            if quest['conditions']['destination'] == current_planet.name:
-                self.console.print(f"[bold green]Quest completed: {quest['description']}[/bold green]")
-                self.player.complete_quest(quest)
-
-        # Determine the number of quests to display based on the player's level
-        if self.player.level <= 3:
-            max_quests = 1
-        elif self.player.level <= 10:
-            max_quests = 2
-        else:
-            max_quests = 3
-
-        # Ensure we only sample as many quests as are available
-        available_quests = random.sample(self.universe.quests, min(max_quests, len(self.universe.quests)))
-
-        # Add quest system
-        self.console.print("\nAvailable Quests:")
-        if not available_quests:
-            self.console.print("No quests available at this time.")
-        else:
-            for i, quest in enumerate(available_quests, 1):
-                self.console.print(f"{i}. {quest['description']}")
-                self.console.print(f"   Backstory: {quest['backstory']}")
-
-            quest_choice = self.console.input("[bold yellow]Enter the number of the quest to accept (or 'cancel'): [/bold yellow]")
-            if quest_choice.lower() == 'cancel':
-                return
-
-            try:
-                quest_index = int(quest_choice)
-                if 1 <= quest_index <= len(available_quests):
-                    selected_quest = available_quests[quest_index - 1]
-                    self.player.accept_quest(selected_quest)
-                    self.universe.quests.remove(selected_quest)
-                    # Clear available quests after accepting a quest
-                    self.universe.quests = []
-                else:
-                    self.console.print("[bold red]Invalid choice![/bold red]")
-            except ValueError:
-                self.console.print("[bold red]Please enter a number![/bold red]")
-
-        # Display available passengers
-        self.console.print("\nAvailable Passengers:")
-        passengers = self.generate_available_passengers(current_planet)
-        if not passengers:
-            self.console.print("No passengers available at this time.")
-        else:
-            for i, passenger in enumerate(passengers, 1):
-                self.console.print(f"{i}. {passenger['type']} - Destination: {passenger['destination']}, Reward: {passenger['reward']} credits")
-
-            passenger_choice = self.console.input("[bold yellow]Enter the number of the passenger to pick up (or 'cancel'): [/bold yellow]")
-            if passenger_choice.lower() == 'cancel':
-                return
-
-            try:
-                passenger_index = int(passenger_choice)
-                if 1 <= passenger_index <= len(passengers):
-                    selected_passenger = passengers[passenger_index - 1]
-                    if self.player.passenger_pod_capacity >= len(self.player.passengers) + 1:
-                        self.player.add_passenger(selected_passenger)
-                        self.console.print(f"Picked up {selected_passenger['type']} heading to {selected_passenger['destination']}.")
-                    else:
-                        self.console.print("[bold red]Not enough passenger pod capacity![/bold red]")
-                else:
-                    self.console.print("[bold red]Invalid choice![/bold red]")
-            except ValueError:
-                self.console.print("[bold red]Please enter a number![/bold red]")
-
-    def generate_available_passengers(self, planet):
-        # Logic to generate available passengers based on planet and player's ship upgrades
-        passenger_types = ["Colonist", "Tourist", "Scientist"]
-        destinations = [p.name for p in self.universe.planets if p != planet]
-        passengers = []
-        for _ in range(random.randint(1, 5)):
-            passenger = {
-                "name": f"Passenger_{len(passengers)+1}",
-                "type": random.choice(passenger_types),
-                "destination": random.choice(destinations),
-                "reward": random.randint(100, 500)
-            }
-            passengers.append(passenger)
-        return passengers
-    
-    
@@ -0,0 +1,134 @@
+from rich.table import Table
+
+class TablePresenter:
+    """
+    Paged Rich table over rows that are produced on demand.
+
+    Nothing is formatted up front. `row(index)` is called only for the rows
+    on the page being shown, so a screen costs the page size whatever the
+    number of rows. The reader pages with n/p or jumps with "g <page>".
+    "/text" filters the rows, "c <columns>" picks which columns to show,
+    and, when the screen is selectable, a row number picks that row.
+
+    Args:
+        console: Rich console to print to and prompt on
+        title (str): Table title
+        columns (list): (header, add_column keyword arguments) per column
+        count (int): Number of rows
+        row (callable): Row index -> list of cell strings, one per column
+        key (callable): Row index -> text that filters match (case-insensitive)
+        search (callable): Filter text -> matching row indices; replaces `key`
+        page_size (int): Rows per page
+        fixed (int): Leading columns that are always shown (e.g. the name)
+        highlight (int): Row index to highlight; the screen opens on its page
+    """
+
+    def __init__(self, console, title, columns, count, row, key=None, search=None, page_size=20, fixed=1, highlight=None):
+        self.console = console
+        self.title = title
+        self.columns = columns
+        self.count = count
+        self.row = row
+        self.key = key
+        self.search = search
+        self.page_size = page_size
+        self.fixed = fixed
+        self.highlight = highlight
+        self.visible = list(range(len(columns)))
+        self._matches = {}
+
+    def matching(self, text):
+        """Row indices matching the filter `text` (all rows for ''), cached per text."""
+        if not text:
+            return range(self.count)
+        if self.search is not None:
+            return self.search(text)
+        rows = self._matches.get(text.lower())
+        if rows is None:
+            needle = text.lower()
+            rows = [index for index in range(self.count) if needle in self.key(index).lower()]
+            self._matches[needle] = rows
+        return rows
+
+    def select_columns(self, names):
+        """Show the fixed columns plus those whose header contains one of `names` (all for none)."""
+        names = [name.strip().lower() for name in names if name.strip()]
+        if not names:
+            self.visible = list(range(len(self.columns)))
+            return
+        self.visible = list(range(self.fixed)) + [
+            position for position in range(self.fixed, len(self.columns))
+            if any(name in self.columns[position][0].lower() for name in names)
+        ]
+
+    def render(self, rows, page, pages, name_filter=""):
+        """The Rich table for one page of `rows` (only that page's rows are generated)."""
+        title = self.title
+        if pages > 1:
+            title += f" (page {page + 1}/{pages})"
+        if name_filter:
+            title += f" - matching '{name_filter}'"
+
+        table = Table(title=title)
+        for position in self.visible:
+            header, options = self.columns[position]
+            table.add_column(header, **options)
+        for index in rows[page * self.page_size:(page + 1) * self.page_size]:
+            cells = self.row(index)
+            style = "blue" if index == self.highlight else None
+            table.add_row(*[cells[position] for position in self.visible], style=style)
+        return table
+
+    def show(self, page=None, select=None):
+        """
+        Print the table and let the reader page, filter and pick columns.
+
+        Args:
+            page (int): Page to open on; defaults to the highlighted row's page, or the first
+            select (str): Prompt for picking a row by its number, or None for a read-only screen
+
+        Returns:
+            int: Index of the row picked, or None
+        """
+        name_filter = ""
+        rows = self.matching(name_filter)
+        if page is None:
+            page = self.highlight // self.page_size if self.highlight is not None and self.highlight < self.count else 0
+
+        while True:
+            pages = max(1, (len(rows) + self.page_size - 1) // self.page_size)
+            page = min(max(page, 0), pages - 1)
+            self.console.print(self.render(rows, page, pages, name_filter))
+
+            if pages == 1 and not name_filter and select is None and len(self.columns) == len(self.visible):
+                return None
+            options = []
+            if pages > 1:
+                options.append("(N)ext/(P)revious page, G <page>")
+            options.append("/text to filter")
+            if len(self.columns) > self.fixed + 1:
+                options.append("C <columns> to choose columns")
+            if select is not None:
+                options.append(select)
+            command = self.console.input(f"[yellow]{', '.join(options)}, Enter to {'cancel' if select else 'continue'}: [/yellow]").strip()
+
+            lowered = command.lower()
+            if lowered in ['n', 'next']:
+                page += 1
+            elif lowered in ['p', 'previous']:
+                page -= 1
+            elif lowered.startswith('g ') and lowered[2:].strip().isdigit():
+                page = int(lowered[2:]) - 1
+            elif command.startswith('/'):
+                name_filter = command[1:].strip()
+                rows = self.matching(name_filter)
+                page = 0
+            elif lowered == 'c' or lowered.startswith('c '):
+                self.select_columns(command[1:].split(','))
+            elif select is not None and command.isdigit():
+                index = int(command) - 1
+                if 0 <= index < self.count:
+                    return index
+                self.console.print("[bold red]Invalid choice![/bold red]")
+            else:
+                return None
@@ -0,0 +1,118 @@
+import random
+from collections import OrderedDict
+
+class QuestPool:
+    """
+    Bounded pool of quest offers generated from the quest templates.
+
+    Offers are copies of a template with an `id` and an `expires_turn`. They
+    are indexed by id, kept in a dense id list for O(1)-per-item sampling
+    (removal swaps the last id into the freed slot) and bucketed by expiry
+    turn so expiring a turn only touches the quests that expire then. A
+    template is never on offer twice at the same time, and once `capacity`
+    offers exist the oldest one is dropped to make room.
+    """
+
+    def __init__(self, templates, capacity=20, lifetime=10, rng=None):
+        self.templates = templates
+        self.rng = rng if rng is not None else random.Random()
+        self.capacity = capacity
+        self.lifetime = lifetime
+
+        self.offers = OrderedDict()  # id -> quest, oldest first
+        self._ids = []               # dense list of ids for sampling
+        self._positions = {}         # id -> index in _ids
+        self._expiry = {}            # expires_turn -> [ids]
+        self._offered_templates = {} # template index -> id
+        self._last_expired_turn = -1
+        self._next_id = 1
+
+    def __len__(self):
+        return len(self.offers)
+
+    def __iter__(self):
+        return iter(list(self.offers.values()))
+
+    def __contains__(self, quest_id):
+        return quest_id in self.offers
+
+    def get(self, quest_id):
+        return self.offers.get(quest_id)
+
+    def add(self, template_index, turn):
+        if template_index in self._offered_templates:
+            return None
+        if len(self.offers) >= self.capacity:
+            self.remove(next(iter(self.offers)))
+
+        quest = dict(self.templates[template_index])
+        quest['id'] = self._next_id
+        quest['template'] = template_index
+        quest['expires_turn'] = turn + self.lifetime
+        self._next_id += 1
+
+        self.offers[quest['id']] = quest
+        self._positions[quest['id']] = len(self._ids)
+        self._ids.append(quest['id'])
+        self._expiry.setdefault(quest['expires_turn'], []).append(quest['id'])
+        self._offered_templates[template_index] = quest['id']
+        return quest
+
+    def generate(self, count, turn, exclude=()):
+        """
+        Offer up to `count` new quests from templates not currently on offer.
+
+        Args:
+            count (int): Maximum number of new offers
+            turn (int): Current turn, used for the expiry date
+            exclude (set): Template indices to skip, e.g. quests already accepted
+        """
+        free_templates = [i for i in range(len(self.templates)) if i not in self._offered_templates and i not in exclude]
+        chosen = self.rng.sample(free_templates, min(count, len(free_templates)))
+        return [self.add(template_index, turn) for template_index in chosen]
+
+    def sample(self, count):
+        ids = self.rng.sample(self._ids, min(count, len(self._ids)))
+        return [self.offers[quest_id] for quest_id in ids]
+
+    def remove(self, quest_id):
+        quest = self.offers.pop(quest_id, None)
+        if quest is None:
+            return None
+
+        # Swap-remove from the dense id list
+        position = self._positions.pop(quest_id)
+        last_id = self._ids.pop()
+        if last_id != quest_id:
+            self._ids[position] = last_id
+            self._positions[last_id] = position
+
+        del self._offered_templates[quest['template']]
+        # The expiry bucket entry is left in place and skipped when the bucket expires
+        return quest
+
+    def accept(self, quest_id):
+        """Take a quest off the board; returns None if it is no longer on offer."""
+        return self.remove(quest_id)
+
+    def expire(self, turn):
+        expired = []
+        for expiry_turn in range(self._last_expired_turn + 1, turn + 1):
+            for quest_id in self._expiry.pop(expiry_turn, ()):
+                quest = self.remove(quest_id)
+                if quest is not None:
+                    expired.append(quest)
+        self._last_expired_turn = max(self._last_expired_turn, turn)
+        return expired
+
+    def restore(self, quests):
+        """Rebuild the pool from saved offers, keeping its random stream."""
+        self.__init__(self.templates, self.capacity, self.lifetime, rng=self.rng)
+        for quest in quests:
+            quest = dict(quest)
+            self.offers[quest['id']] = quest
+            self._positions[quest['id']] = len(self._ids)
+            self._ids.append(quest['id'])
+            self._expiry.setdefault(quest['expires_turn'], []).append(quest['id'])
+            self._offered_templates[quest['template']] = quest['id']
+            self._next_id = max(self._next_id, quest['id'] + 1)
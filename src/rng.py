@@ -0,0 +1,86 @@
+import os
+import random
+import zlib
+
+import numpy as np
+
+class RandomContext:
+    """
+    Per-game source of randomness.
+
+    A game owns one context built from its seed; without a seed one is drawn
+    from the OS and kept in `seed`, so any run can be repeated. Subsystems
+    don't share a generator: each asks for its own named stream, derived from
+    the seed and the stream name through NumPy's SeedSequence. Extra draws in
+    one subsystem therefore never shift the numbers another one sees. `spawn`
+    splits off independent child contexts, e.g. one per game of a batch run.
+
+    Streams come in two flavours: `stream(name)` is a `random.Random` for
+    choices and sampling in game logic, `generator(name)` a NumPy Generator
+    for vectorised draws. Both are created on first use and cached, and
+    `state`/`set_state` capture and restore every stream's position (for save
+    games).
+    """
+
+    def __init__(self, seed=None):
+        if seed is None:
+            seed = int.from_bytes(os.urandom(8), 'little')
+        self.seed = int(seed)
+        self._streams = {}
+        self._generators = {}
+
+    def sequence(self, name):
+        """SeedSequence for the stream `name`; the same seed and name always give the same sequence."""
+        # crc32 rather than hash(): string hashes differ between processes
+        return np.random.SeedSequence(self.seed, spawn_key=(zlib.crc32(name.encode('utf-8')),))
+
+    def stream(self, name):
+        """`random.Random` for subsystem `name`."""
+        stream = self._streams.get(name)
+        if stream is None:
+            stream = random.Random(int(self.sequence(name).generate_state(1, np.uint64)[0]))
+            self._streams[name] = stream
+        return stream
+
+    def generator(self, name):
+        """NumPy Generator for subsystem `name`."""
+        generator = self._generators.get(name)
+        if generator is None:
+            generator = np.random.default_rng(self.sequence(name))
+            self._generators[name] = generator
+        return generator
+
+    def spawn(self, count):
+        """Split off `count` independent child contexts (seeds are reproducible from this one)."""
+        children = np.random.SeedSequence(self.seed).spawn(count)
+        return [RandomContext(int(child.generate_state(1, np.uint64)[0])) for child in children]
+
+    def state(self):
+        """JSON-serialisable positions of every stream created so far."""
+        return {
+            'seed': self.seed,
+            'streams': {name: stream.getstate() for name, stream in self._streams.items()},
+            'generators': {name: generator.bit_generator.state for name, generator in self._generators.items()}
+        }
+
+    def set_state(self, state):
+        """
+        Restore positions saved by `state`.
+
+        Streams are updated in place, so subsystems holding them keep working
+        with the restored positions.
+        """
+        # Streams the save didn't use start over from the saved seed
+        self.reseed(state['seed'])
+        for name, (version, internal, gauss) in state['streams'].items():
+            self.stream(name).setstate((version, tuple(internal), gauss))
+        for name, generator_state in state['generators'].items():
+            self.generator(name).bit_generator.state = generator_state
+
+    def reseed(self, seed):
+        """Restart every stream from `seed`, in place."""
+        self.seed = int(seed)
+        for name, stream in self._streams.items():
+            stream.seed(int(self.sequence(name).generate_state(1, np.uint64)[0]))
+        for name, generator in self._generators.items():
+            generator.bit_generator.state = np.random.default_rng(self.sequence(name)).bit_generator.state
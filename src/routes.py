@@ -0,0 +1,252 @@
+import heapq
+from collections import OrderedDict
+
+import numpy as np
+
+class RouteTable:
+    """
+    Shortest travel distances and routes over the trade network.
+
+    Planets are addressed by row (`index`, planet name -> row). Galaxies up to
+    `eager_limit` planets get the full all-pairs table once, via a vectorised
+    Floyd-Warshall pass. Bigger galaxies compute one Dijkstra column per
+    destination on first use and keep the most recent `cache_size` columns,
+    so repeated queries are still plain array lookups.
+
+    `edges` is any iterable of (planet, planet, distance) lanes, e.g. a
+    networkx graph's `edges(data='distance')`.
+
+    `next_hop[x, t]` is the neighbour to fly to from `x` on the way to `t`
+    (-1 when `t` is unreachable). The trade network is undirected, so a
+    column answers queries in both directions.
+    """
+
+    def __init__(self, planets, edges, eager_limit=256, cache_size=256):
+        self.planets = list(planets)
+        self.index = {planet.name: row for row, planet in enumerate(self.planets)}
+        rows = [(self.index[a.name], self.index[b.name], distance) for a, b, distance in edges]
+        sources, targets, distances = zip(*rows) if rows else ((), (), ())
+        self._setup(np.array(sources, dtype=np.int32), np.array(targets, dtype=np.int32),
+                    np.array(distances, dtype=np.float64), eager_limit, cache_size)
+
+    @classmethod
+    def from_rows(cls, planets, sources, targets, distances, eager_limit=256, cache_size=256):
+        """Build the table from lane arrays of planet rows, e.g. a generated galaxy or a save."""
+        table = cls.__new__(cls)
+        table.planets = list(planets)
+        table.index = {planet.name: row for row, planet in enumerate(table.planets)}
+        table._setup(np.asarray(sources, dtype=np.int32), np.asarray(targets, dtype=np.int32),
+                     np.asarray(distances, dtype=np.float64), eager_limit, cache_size)
+        return table
+
+    def _setup(self, sources, targets, distances, eager_limit, cache_size):
+        self.eager_limit = eager_limit
+        self.cache_size = cache_size
+        self.lanes = [(sources, targets, distances)]  # lane arrays, one chunk per addition
+        self._adjacency = None
+
+        self.eager = len(self.planets) <= eager_limit
+        self.distances = None
+        self.next_hop = None
+        self.columns = OrderedDict()  # destination row -> (distances, next_hop), lazy mode only
+        if self.eager:
+            self._build_all_pairs()
+
+    @property
+    def adjacency(self):
+        # Per-planet (neighbour, distance) lists for the path searches. Built on
+        # first use, so loading a big galaxy doesn't pay for it up front.
+        if self._adjacency is None:
+            sources, targets, distances = self.lane_arrays()
+            # Group both directions of every lane by planet with one sort
+            n = len(self.planets)
+            rows = np.concatenate([sources, targets])
+            order = np.argsort(rows, kind='stable')
+            neighbours = np.concatenate([targets, sources])[order].tolist()
+            weights = np.concatenate([distances, distances])[order].tolist()
+            bounds = np.searchsorted(rows[order], np.arange(n + 1)).tolist()
+            pairs = list(zip(neighbours, weights))
+            self._adjacency = [pairs[bounds[row]:bounds[row + 1]] for row in range(n)]
+        return self._adjacency
+
+    def _link(self, a, b, distance):
+        self.adjacency[a].append((b, distance))
+        self.adjacency[b].append((a, distance))
+
+    def _build_all_pairs(self):
+        n = len(self.planets)
+        distances = np.full((n, n), np.inf)
+        next_hop = np.full((n, n), -1, dtype=np.int32)
+        np.fill_diagonal(distances, 0.0)
+        np.fill_diagonal(next_hop, np.arange(n, dtype=np.int32))
+        for a, neighbours in enumerate(self.adjacency):
+            for b, distance in neighbours:
+                if distance < distances[a, b]:
+                    distances[a, b] = distance
+                    next_hop[a, b] = b
+
+        for k in range(n):
+            through_k = distances[:, k, None] + distances[None, k, :]
+            better = through_k < distances
+            distances[better] = through_k[better]
+            next_hop[better] = np.broadcast_to(next_hop[:, k, None], (n, n))[better]
+
+        self.distances = distances
+        self.next_hop = next_hop
+
+    def _dijkstra(self, target):
+        n = len(self.planets)
+        distances = np.full(n, np.inf)
+        next_hop = np.full(n, -1, dtype=np.int32)
+        distances[target] = 0.0
+        next_hop[target] = target
+        heap = [(0.0, target)]
+        while heap:
+            distance, node = heapq.heappop(heap)
+            if distance > distances[node]:
+                continue
+            for neighbour, weight in self.adjacency[node]:
+                candidate = distance + weight
+                if candidate < distances[neighbour]:
+                    distances[neighbour] = candidate
+                    # Walking back towards the target goes through `node`
+                    next_hop[neighbour] = node
+                    heapq.heappush(heap, (candidate, neighbour))
+        return distances, next_hop
+
+    def _column(self, target):
+        column = self.columns.get(target)
+        if column is None:
+            column = self._dijkstra(target)
+            self.columns[target] = column
+            if len(self.columns) > self.cache_size:
+                self.columns.popitem(last=False)
+        else:
+            self.columns.move_to_end(target)
+        return column
+
+    def lane_arrays(self):
+        """Every lane once, as parallel (sources, targets, distances) row arrays."""
+        return tuple(np.concatenate(column) for column in zip(*self.lanes))
+
+    def row(self, planet):
+        return self.index[planet.name]
+
+    def distance(self, start, target):
+        a, b = self.index[start.name], self.index[target.name]
+        if self.eager:
+            return float(self.distances[a, b])
+        if a in self.columns:
+            return float(self._column(a)[0][b])
+        return float(self._column(b)[0][a])
+
+    def distances_from(self, planet):
+        """Travel distance from `planet` to every planet, by row (inf when unreachable)."""
+        row = self.index[planet.name]
+        if self.eager:
+            return self.distances[row]
+        return self._column(row)[0]
+
+    def within(self, planet, radius):
+        """Rows of the planets within `radius` travel distance of `planet`, itself included."""
+        row = self.index[planet.name]
+        if self.eager:
+            return np.flatnonzero(self.distances[row] <= radius)
+        if row in self.columns:
+            return np.flatnonzero(self._column(row)[0] <= radius)
+
+        # Dijkstra cut off at the radius, so only the area itself is explored
+        distances = {row: 0.0}
+        heap = [(0.0, row)]
+        while heap:
+            distance, node = heapq.heappop(heap)
+            if distance > distances[node]:
+                continue
+            for neighbour, weight in self.adjacency[node]:
+                candidate = distance + weight
+                if candidate <= radius and candidate < distances.get(neighbour, float('inf')):
+                    distances[neighbour] = candidate
+                    heapq.heappush(heap, (candidate, neighbour))
+        return np.array(sorted(distances), dtype=np.intp)
+
+    def route(self, start, target):
+        """Planets visited from start to target, both included; [] if unreachable."""
+        a, b = self.index[start.name], self.index[target.name]
+        next_hop = self.next_hop[:, b] if self.eager else self._column(b)[1]
+        if next_hop[a] < 0:
+            return []
+        path = [a]
+        while path[-1] != b:
+            path.append(int(next_hop[path[-1]]))
+        return [self.planets[row] for row in path]
+
+    def add_planet(self, planet, links):
+        """
+        Add a planet connected to existing planets and update the table in place.
+
+        Args:
+            planet (Planet): The new planet
+            links (dict): Existing planet -> edge distance
+        """
+        new = len(self.planets)
+        self.planets.append(planet)
+        self.index[planet.name] = new
+        edges = [(self.index[other.name], distance) for other, distance in links.items()]
+        if self._adjacency is not None:
+            self._adjacency.append([])
+            for other, distance in edges:
+                self._link(new, other, distance)
+        self.lanes.append((
+            np.full(len(edges), new, dtype=np.int32),
+            np.array([other for other, _ in edges], dtype=np.int32),
+            np.array([distance for _, distance in edges], dtype=np.float64)
+        ))
+
+        if self.eager:
+            self._add_to_all_pairs(new, edges)
+        elif len(edges) == 1:
+            # A dead end can't shorten other routes: extend the cached columns
+            neighbour, weight = edges[0]
+            for target, (distances, next_hop) in self.columns.items():
+                self.columns[target] = (
+                    np.append(distances, distances[neighbour] + weight),
+                    np.append(next_hop, neighbour if next_hop[neighbour] >= 0 else -1).astype(np.int32)
+                )
+        else:
+            # The new planet may be a shortcut; columns are recomputed on demand
+            self.columns.clear()
+
+        if self.eager and len(self.planets) > self.eager_limit:
+            # Grown past the eager size: fall back to lazy columns
+            self.eager = False
+            self.distances = None
+            self.next_hop = None
+
+    def _add_to_all_pairs(self, new, edges):
+        n = new + 1
+        distances = np.full((n, n), np.inf)
+        next_hop = np.full((n, n), -1, dtype=np.int32)
+        distances[:new, :new] = self.distances
+        next_hop[:new, :new] = self.next_hop
+        distances[new, new] = 0.0
+        next_hop[new, new] = new
+
+        # Distances to and from the new planet go through one of its neighbours
+        for neighbour, weight in edges:
+            via = distances[neighbour, :new] + weight
+            better = via < distances[new, :new]
+            distances[new, :new][better] = via[better]
+            distances[:new, new][better] = via[better]
+            next_hop[new, :new][better] = neighbour
+            next_hop[:new, new][better] = next_hop[:new, neighbour][better]
+            if better[neighbour]:
+                next_hop[neighbour, new] = new
+
+        # Existing pairs may now be shorter through the new planet
+        through_new = distances[:, new, None] + distances[None, new, :]
+        better = through_new < distances
+        distances[better] = through_new[better]
+        next_hop[better] = np.broadcast_to(next_hop[:, new, None], (n, n))[better]
+
+        self.distances = distances
+        self.next_hop = next_hop
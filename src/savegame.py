@@ -0,0 +1,209 @@
+import json
+import struct
+import zlib
+
+import numpy as np
+
+from src.ledger import TradeLedger
+from src.player import Player
+from src.universe import (
+    CATEGORIES, Planet, UniverseGenerator, category_code, planets_from_table, planets_to_table
+)
+
+# File layout (all little-endian):
+#   header   MAGIC, format VERSION (uint16), flags (uint8)
+#   body     uint32 length + UTF-8 JSON metadata, then the raw bytes of every
+#            array listed in metadata['arrays'], back to back
+# With FLAG_COMPRESSED set the whole body is zlib-compressed.
+MAGIC = b'CHSAVE'
+VERSION = 1
+HEADER = struct.Struct('<6sHB')
+LENGTH = struct.Struct('<I')
+FLAG_COMPRESSED = 1
+
+# Explicit schema for the columnar sections: array name -> dtype
+ARRAY_SCHEMA = {
+    'planets': Planet.DTYPE,
+    'lane_sources': np.dtype('<i4'),
+    'lane_targets': np.dtype('<i4'),
+    'lane_distances': np.dtype('<f8'),
+    'base_prices': np.dtype('<f8'),
+    'economy_levels': np.dtype('<f8'),
+    # Multipliers come from float32 planet resources (or the 0.5 default) and
+    # stock counts are small, so the narrower types are lossless
+    'resource_multipliers': np.dtype('<f4'),
+    'prices': np.dtype('<f8'),
+    'fundamental_prices': np.dtype('<f8'),
+    'quantities': np.dtype('<i4'),
+    # Trade ledger columns
+    **{'ledger_' + name: dtype for name, dtype in TradeLedger.COLUMNS.items()}
+}
+
+class SaveFormatError(ValueError):
+    """The file is not a save game this version can read."""
+
+def player_state(player):
+    # The trade ledger is saved as columns (and journaled as new rows), not in the player state
+    state = {name: value for name, value in vars(player).items() if name not in ('console', 'rng', 'hold', 'ledger')}
+    # Planets are referenced by name
+    state['trade_route'] = [planet.name for planet in player.trade_route]
+    # The cargo hold is saved as the inventory dict (commodity -> lot)
+    state['inventory'] = player.hold.state()
+    state['cargo_capacity'] = player.hold.capacity
+    return state
+
+def apply_player_state(player, state, universe):
+    state = dict(state)
+    inventory = state.pop('inventory', None)
+    capacity = state.pop('cargo_capacity', None)
+    # Derived from the cargo itself
+    state.pop('cargo_used', None)
+    # Replaced by the trade ledger
+    state.pop('trade_history', None)
+    player.__dict__.update(state)
+    if capacity is not None:
+        player.cargo_capacity = capacity
+    if inventory is not None:
+        player.hold.restore(inventory)
+    if 'trade_route' in state:
+        player.trade_route = [universe.routes.planets[universe.routes.index[name]] for name in state['trade_route']]
+
+def encode(engine):
+    """
+    Serialise a game into the binary save format (uncompressed body).
+
+    Returns:
+        bytes: Metadata length, metadata JSON and array payload
+    """
+    universe = engine.universe
+    economy = engine.economy
+    planets = universe.routes.planets
+    lane_sources, lane_targets, lane_distances = universe.routes.lane_arrays()
+
+    arrays = {
+        'planets': planets_to_table(planets),
+        'lane_sources': lane_sources,
+        'lane_targets': lane_targets,
+        'lane_distances': lane_distances,
+        'base_prices': economy.base_prices,
+        'economy_levels': economy.economy_levels,
+        'resource_multipliers': economy.resource_multipliers,
+        'prices': economy.prices,
+        'fundamental_prices': economy.fundamental_prices,
+        'quantities': economy.quantities,
+        **{'ledger_' + name: column for name, column in engine.player.ledger.arrays().items()}
+    }
+    arrays = {name: np.ascontiguousarray(array, dtype=ARRAY_SCHEMA[name]) for name, array in arrays.items()}
+
+    metadata = {
+        'difficulty': engine.difficulty,
+        'turn': engine.turn,
+        'seed': engine.rng.seed,
+        # Positions of the game's random streams, so a loaded game carries on exactly
+        'rng': engine.rng.state(),
+        'current_planet': engine.current_planet.name,
+        'game_over': engine.game_over,
+        'player': player_state(engine.player),
+        'quests': list(universe.quests),
+        'events': engine.event_generator.active_events(),
+        'shocks': economy.shocks.state(),
+        'categories': CATEGORIES,
+        # Names are one NUL-separated column rather than a JSON list of strings
+        'planet_names': '\0'.join(planet.name for planet in planets),
+        'histories': {planet.name: planet.custom_history for planet in planets if planet.custom_history is not None},
+        'market_planets': '\0'.join(economy.planet_names),
+        'commodities': economy.commodity_names,
+        'ledger_planets': '\0'.join(engine.player.ledger.planet_names),
+        'arrays': [{'name': name, 'shape': list(array.shape)} for name, array in arrays.items()]
+    }
+    metadata = json.dumps(metadata, default=lambda value: value.item()).encode('utf-8')
+    return b''.join([LENGTH.pack(len(metadata)), metadata] + [array.tobytes() for array in arrays.values()])
+
+def decode(body):
+    """Split a save body back into its metadata and arrays."""
+    (length,) = LENGTH.unpack_from(body)
+    offset = LENGTH.size + length
+    metadata = json.loads(body[LENGTH.size:offset].decode('utf-8'))
+
+    arrays = {}
+    for entry in metadata['arrays']:
+        dtype = ARRAY_SCHEMA[entry['name']]
+        count = int(np.prod(entry['shape'], dtype=np.int64))
+        arrays[entry['name']] = np.frombuffer(body, dtype=dtype, count=count, offset=offset).reshape(entry['shape'])
+        offset += count * dtype.itemsize
+    return metadata, arrays
+
+def save_game(engine, filename, compress=False):
+    body = encode(engine)
+    flags = 0
+    if compress:
+        body = zlib.compress(body, 1)
+        flags |= FLAG_COMPRESSED
+    with open(filename, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, VERSION, flags))
+        file.write(body)
+
+def read_save(filename):
+    with open(filename, 'rb') as file:
+        data = file.read()
+    if len(data) < HEADER.size:
+        raise SaveFormatError(f"{filename} is not a Cargo Hauler save")
+    magic, version, flags = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise SaveFormatError(f"{filename} is not a Cargo Hauler save")
+    if version > VERSION:
+        raise SaveFormatError(f"{filename} was written by a newer version (format {version})")
+
+    body = data[HEADER.size:]
+    if flags & FLAG_COMPRESSED:
+        body = zlib.decompress(body)
+    return decode(body)
+
+def restore_planets(metadata, table):
+    # Category codes were written against the saver's category lists; map them
+    # onto this process's lists, which may have grown in a different order
+    table = table.copy()
+    for field, values in metadata['categories'].items():
+        codes = np.array([category_code(field, value) for value in values], dtype=np.uint8)
+        table[field] = codes[table[field]]
+
+    names = metadata['planet_names'].split('\0') if metadata['planet_names'] else []
+    return planets_from_table(names, table, metadata['histories'])
+
+def load_game(engine, filename):
+    """Replace the engine's game state with the one saved in `filename`."""
+    metadata, arrays = read_save(filename)
+
+    planets = restore_planets(metadata, arrays['planets'])
+    lanes = (arrays['lane_sources'], arrays['lane_targets'], arrays['lane_distances'])
+    universe = UniverseGenerator.restore(metadata['difficulty'], planets, lanes, engine.rng)
+    universe.quests.restore(metadata['quests'])
+    engine.event_generator.restore(metadata.get('events', []))
+
+    engine.difficulty = metadata['difficulty']
+    engine.universe = universe
+    market_planets = metadata['market_planets'].split('\0') if metadata['market_planets'] else []
+    engine.economy.restore(
+        universe.routes.planets, market_planets, metadata['commodities'], arrays['base_prices'], arrays['economy_levels'],
+        arrays['resource_multipliers'], arrays['prices'], arrays['quantities'], arrays.get('fundamental_prices'),
+        metadata.get('shocks')
+    )
+
+    engine.player = Player(engine.console, engine.rng.stream('passengers'), engine.economy.registry)
+    apply_player_state(engine.player, metadata['player'], universe)
+    if 'ledger_turns' in arrays:
+        ledger_planets = metadata['ledger_planets'].split('\0') if metadata['ledger_planets'] else []
+        engine.player.ledger.restore(
+            {name: arrays['ledger_' + name] for name in TradeLedger.COLUMNS}, ledger_planets, metadata['commodities']
+        )
+
+    # Last, since restoring the market draws stock for new commodities
+    if 'rng' in metadata:
+        engine.rng.set_state(metadata['rng'])
+    elif metadata['seed'] is not None:
+        engine.rng.reseed(metadata['seed'])
+
+    engine.current_planet = universe.routes.planets[universe.routes.index[metadata['current_planet']]]
+    engine.scheduler.turn = metadata['turn']
+    engine.game_over = metadata['game_over']
+    engine.status_changed = True
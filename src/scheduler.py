@@ -0,0 +1,90 @@
+import time
+from collections import deque
+
+class TurnScheduler:
+    """
+    Explicit turn state machine: START -> ACTION -> END -> START -> ...
+
+    Each call to `step` runs one phase and returns, so the game loop drives
+    turns iteratively and the call stack stays the same depth no matter how
+    many turns are played. Actions end the turn by calling `request_end_turn`
+    instead of calling back into the loop.
+
+    The time spent in START and END handlers (the per-turn bookkeeping, not
+    the time a player spends at the prompt) is recorded for every turn.
+    """
+
+    START = 'start'
+    ACTION = 'action'
+    END = 'end'
+
+    def __init__(self, history=1000):
+        self.turn = 0
+        self.phase = self.START
+        self.end_requested = False
+        # Bookkeeping hooks; actions themselves are passed to `step`
+        self.handlers = {self.START: [], self.END: []}
+
+        # Per-turn processing cost in seconds
+        self.turn_times = deque(maxlen=history)
+        self.total_turn_time = 0.0
+        self.max_turn_time = 0.0
+        self._current_turn_time = 0.0
+
+    def on(self, phase, handler):
+        self.handlers[phase].append(handler)
+
+    def request_end_turn(self):
+        self.end_requested = True
+
+    def step(self, action=None):
+        """Run the current phase and move to the next one."""
+        if self.phase == self.START:
+            self._current_turn_time = self._run_timed(self.START)
+            self.phase = self.ACTION
+
+        elif self.phase == self.ACTION:
+            if action is not None:
+                action()
+            if self.end_requested:
+                self.phase = self.END
+
+        elif self.phase == self.END:
+            self._current_turn_time += self._run_timed(self.END)
+            self.turn_times.append(self._current_turn_time)
+            self.total_turn_time += self._current_turn_time
+            self.max_turn_time = max(self.max_turn_time, self._current_turn_time)
+            self.turn += 1
+            self.end_requested = False
+            self.phase = self.START
+
+    def run_turn(self, action, max_actions=1):
+        """
+        Play one whole turn, calling `action` up to `max_actions` times.
+
+        Returns:
+            bool: True if the turn ended, False if no action requested it
+        """
+        if self.phase == self.START:
+            self.step()
+        for _ in range(max_actions):
+            self.step(action)
+            if self.phase == self.END:
+                self.step()
+                return True
+        return False
+
+    def _run_timed(self, phase):
+        start = time.perf_counter()
+        for handler in self.handlers[phase]:
+            handler()
+        return time.perf_counter() - start
+
+    def stats(self):
+        recent = list(self.turn_times)
+        return {
+            'turns': self.turn,
+            'mean_turn_us': self.total_turn_time / self.turn * 1e6 if self.turn else 0.0,
+            'recent_mean_turn_us': sum(recent) / len(recent) * 1e6 if recent else 0.0,
+            'max_turn_us': self.max_turn_time * 1e6
+        }
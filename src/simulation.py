@@ -0,0 +1,182 @@
+import sys
+import os
+import time
+import argparse
+
+import numpy as np
+
+# Add the project root to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from src.engine import GameEngine
+from src.rng import RandomContext
+
+class RandomPolicy:
+    """Sells or buys something at random, then travels to a random planet."""
+
+    def play_turn(self, engine):
+        player = engine.player
+        rng = engine.rng.stream('policy')
+        if player.fuel_level < player.fuel_tank_capacity / 2:
+            engine.refuel()
+        if player.inventory and rng.random() < 0.5:
+            commodity = rng.choice(list(player.inventory.keys()))
+            engine.sell(commodity, rng.randint(1, player.inventory[commodity]['quantity']))
+        else:
+            commodity = rng.choice(engine.economy.commodity_names)
+            engine.buy(commodity, rng.randint(1, 20))
+
+        # Somewhere the tank reaches, if anywhere does; otherwise the trip fails and the ship is stranded
+        destinations = ([p for p in engine.universe.planets if engine.can_reach(p)]
+                        or [p for p in engine.universe.planets if p != engine.current_planet])
+        return engine.travel(rng.choice(destinations))
+
+class GreedyTraderPolicy:
+    """
+    Sells the whole hold, buys the commodity with the best price ratio between
+    here and the galaxy's best market for it, then flies there.
+    """
+
+    def __init__(self, spend_fraction=0.5):
+        self.spend_fraction = spend_fraction
+
+    def play_turn(self, engine):
+        player = engine.player
+        economy = engine.economy
+
+        if player.inventory:
+            engine.trade_basket([(commodity, -lot['quantity']) for commodity, lot in player.inventory.items()])
+        # Top up with the sale's proceeds before spending on cargo
+        if player.fuel_level < player.fuel_tank_capacity:
+            engine.refuel()
+
+        here = economy.planet_row(engine.current_planet)
+        prices = economy.effective_prices()
+        local = prices[here]
+        # Best place to sell each commodity, ignoring the current planet
+        best_prices = prices.copy()
+        best_prices[here] = 0
+        # ... and any planet the tank does not reach, unless none is in reach
+        reachable = np.zeros(len(prices), dtype=bool)
+        for planet in engine.universe.planets:
+            reachable[economy.planet_row(planet)] = engine.can_reach(planet)
+        if reachable.any():
+            best_prices[~reachable] = 0
+        best_rows = best_prices.argmax(axis=0)
+        ratios = best_prices.max(axis=0) / local
+        column = int(ratios.argmax())
+
+        commodity = economy.commodity_names[column]
+        if ratios[column] > 1.0 and local[column] > 0:
+            budget = player.credits * self.spend_fraction
+            quantity = min(int(budget / local[column]), engine.max_buy_quantity(commodity))
+            if quantity > 0:
+                engine.buy(commodity, quantity)
+
+        destination = engine.find_planet(economy.planet_names[best_rows[column]])
+        return engine.travel(destination)
+
+class ScriptedPolicy:
+    """
+    Replays a fixed script. Each turn is a list of (action, *args) calls on the
+    engine; planet arguments may be given by name.
+    """
+
+    def __init__(self, script):
+        self.script = script
+        self.position = 0
+
+    def play_turn(self, engine):
+        if self.position >= len(self.script):
+            return False
+
+        for action, *args in self.script[self.position]:
+            resolved = []
+            for arg in args:
+                planet = engine.find_planet(arg) if isinstance(arg, str) else None
+                resolved.append(planet or arg)
+            getattr(engine, action)(*resolved)
+        self.position += 1
+        return engine.scheduler.end_requested
+
+POLICIES = {
+    'random': RandomPolicy,
+    'greedy': GreedyTraderPolicy
+}
+
+def run_game(policy, max_turns=200, difficulty=2, seed=None, on_turn=None):
+    """
+    Play one headless game.
+
+    Args:
+        policy: Object with a play_turn(engine) method
+        max_turns (int): Turn limit
+        difficulty (int): Universe difficulty
+        seed (int): Seed for a reproducible game, or None
+        on_turn (callable): Called with the engine after every completed turn
+    """
+    engine = GameEngine(difficulty, seed=seed)
+    engine.start()
+    while not engine.game_over and engine.turn < max_turns:
+        if not engine.scheduler.run_turn(lambda: policy.play_turn(engine)):
+            # The policy could not end its turn (e.g. stranded without fuel)
+            break
+        if on_turn is not None:
+            on_turn(engine)
+    return engine
+
+def run_simulations(num_games, policy_factory, max_turns=200, difficulty=2, seed=None):
+    """
+    Play `num_games` headless games back to back.
+
+    Args:
+        num_games (int): Number of games to play
+        policy_factory (callable): Returns a fresh policy for each game
+        max_turns (int): Turn limit per game
+        difficulty (int): Universe difficulty
+        seed (int): Root seed; each game gets its own seed split off from it
+
+    Returns:
+        dict: Aggregate results including turns per second
+    """
+    seeds = [context.seed for context in RandomContext(seed).spawn(num_games)]
+    total_turns = 0
+    turn_processing_time = 0.0
+    final_credits = []
+    start = time.perf_counter()
+    for game_seed in seeds:
+        engine = run_game(policy_factory(), max_turns, difficulty, game_seed)
+        total_turns += engine.turn
+        turn_processing_time += engine.scheduler.total_turn_time
+        final_credits.append(engine.player.credits)
+    elapsed = time.perf_counter() - start
+
+    return {
+        'games': num_games,
+        'turns': total_turns,
+        'elapsed': elapsed,
+        'turns_per_sec': total_turns / elapsed if elapsed > 0 else 0.0,
+        'mean_turn_us': turn_processing_time / total_turns * 1e6 if total_turns else 0.0,
+        'mean_turns': total_turns / num_games if num_games else 0.0,
+        'mean_credits': sum(final_credits) / num_games if num_games else 0.0
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Run headless Cargo Hauler games")
+    parser.add_argument('--games', type=int, default=100)
+    parser.add_argument('--turns', type=int, default=200)
+    parser.add_argument('--difficulty', type=int, default=2)
+    parser.add_argument('--policy', choices=sorted(POLICIES), default='greedy')
+    parser.add_argument('--seed', type=int, default=None, help="Seed for reproducible results")
+    args = parser.parse_args()
+
+    results = run_simulations(args.games, POLICIES[args.policy], args.turns, args.difficulty, args.seed)
+    print(f"Played {results['games']} games ({results['turns']} turns) in {results['elapsed']:.2f}s")
+    print(f"Turns/sec: {results['turns_per_sec']:.1f}")
+    print(f"Mean turn processing: {results['mean_turn_us']:.1f} us")
+    print(f"Mean turns per game: {results['mean_turns']:.1f}")
+    print(f"Mean final credits: {results['mean_credits']:.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,31 @@
+import bisect
+import json
+import os
+
+DEFAULT_STORYLINE = os.path.join(os.path.dirname(__file__), '../data/storyline.json')
+
 class Storyline:
-    def __init__(self):
-        self.story_parts = {
-            1: "You start your journey as a space trader, aiming to make a name for yourself in the cosmos.",
-            2: "After several successful trades, you hear rumors of a hidden treasure on a distant planet.",
-            3: "As you expand your trade routes, you encounter a group of pirates who challenge your dominance.",
-            4: "You discover an ancient technology that could revolutionize space travel, but it's protected by a powerful faction.",
-            5: "With your growing reputation, you are invited to join a prestigious space traders' guild.",
-            # Add more story parts for higher levels
-        }
+    """
+    Story entries unlocked by player level, read from data/storyline.json.
+
+    The file is a list of {"level", "text"} entries; a level may have any
+    number of them. Entries are kept sorted by level (in file order within
+    a level), so the story up to a level is one bisect and a slice.
+    Each file is read once per process.
+    """
+
+    _loaded = {}
+
+    def __init__(self, path=DEFAULT_STORYLINE):
+        path = os.path.abspath(path)
+        if path not in self._loaded:
+            with open(path, 'r', encoding='utf-8') as file:
+                entries = sorted(((entry['level'], entry['text']) for entry in json.load(file)), key=lambda entry: entry[0])
+            self._loaded[path] = ([level for level, _ in entries], [text for _, text in entries])
+        self.levels, self.texts = self._loaded[path]
+
+    def __len__(self):
+        return len(self.texts)
 
     def get_story_up_to_level(self, level):
-        return [self.story_parts.get(lvl, "") for lvl in range(1, level + 1) if lvl in self.story_parts]
+        return self.texts[:bisect.bisect_right(self.levels, level)]
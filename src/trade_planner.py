@@ -0,0 +1,195 @@
+import heapq
+
+import numpy as np
+
+from src.economy import stock_factor
+
+class TradeRoute:
+    """
+    A closed trade loop: fly `planets` in order and back to the first one.
+
+    Each leg buys one commodity at its source planet and sells it at the next
+    stop. Legs are dicts with 'source', 'target' (planets), 'commodity' (None
+    when nothing is worth carrying), 'units', 'profit' and 'fuel'.
+    """
+
+    def __init__(self, planets, legs):
+        self.planets = planets
+        self.legs = legs
+        self.profit = sum(leg['profit'] for leg in legs)
+        self.fuel = sum(leg['fuel'] for leg in legs)
+
+    @property
+    def profit_per_fuel(self):
+        return self.profit / self.fuel if self.fuel > 0 else 0.0
+
+    def __str__(self):
+        stops = " → ".join(planet.name for planet in self.planets + self.planets[:1])
+        return f"{stops} ({self.profit:.1f} credits, {self.profit_per_fuel:.1f} credits/fuel)"
+
+class TradeRoutePlanner:
+    """
+    Finds the most profitable trade loops through a planet.
+
+    A loop follows trade lanes (the edges of the universe's trade network) and
+    trades at every stop: it buys the commodity whose average price difference
+    to the next stop (prices move with the stock the trade takes or adds),
+    times the units that fit in the hold and are in stock, is largest. Loops
+    are ranked by profit per unit of fuel, where a leg burns its lane distance
+    times the ship's fuel efficiency.
+
+    The search is a depth-first walk over simple cycles of up to `max_hops`
+    legs with branch-and-bound pruning: the profit/fuel ratio of a whole loop
+    can't exceed the larger of its partial ratio and the best single-leg
+    ratio still reachable, so branches whose bound can't beat the current
+    k-th best loop are cut. Sub-results are memoised until the market or the
+    ship changes: the best leg from each planet to each of its neighbours
+    (one vectorised pass over all commodities per planet), and the best leg
+    ratio reachable within r hops of each planet, which also depends on the
+    longest leg allowed.
+    """
+
+    def __init__(self, routes, economy):
+        self.routes = routes
+        self.economy = economy
+        self._key = None
+        self._max_leg_fuel = None
+        self._legs = {}   # planet row -> (neighbour rows, profits, fuel, commodity columns, units)
+        self._bounds = {} # (planet row, hops) -> best leg ratio within that many hops
+
+    def _refresh(self, capacity, credits, fuel_efficiency, max_leg_fuel):
+        # Leg values depend on the market (its version changes on every tick) and the ship;
+        # bounds also skip legs longer than max_leg_fuel
+        key = (self.economy.version, len(self.routes.planets), capacity, credits, fuel_efficiency)
+        if key != self._key:
+            self._key = key
+            self._legs.clear()
+            self._bounds.clear()
+        if max_leg_fuel != self._max_leg_fuel:
+            self._max_leg_fuel = max_leg_fuel
+            self._bounds.clear()
+
+    def legs_from(self, row):
+        """Best trade from planet `row` to each of its lane neighbours (memoised)."""
+        legs = self._legs.get(row)
+        if legs is not None:
+            return legs
+
+        _, _, capacity, credits, fuel_efficiency = self._key
+        economy = self.economy
+        neighbours = self.routes.adjacency[row]
+        targets = np.array([economy.planet_row(self.routes.planets[b]) for b, _ in neighbours], dtype=np.intp)
+        fuel = np.array([distance for _, distance in neighbours], dtype=np.float64) * fuel_efficiency
+
+        source = economy.planet_row(self.routes.planets[row])
+        # Units of each commodity that fit in the hold, are in stock and are affordable at the spot price
+        units = np.minimum(np.floor(capacity / economy.registry.volumes), economy.quantities[source])
+        if credits is not None:
+            units = np.minimum(units, np.floor(credits / np.maximum(economy.row_prices(source), 0.01)))
+        units = np.maximum(units, 0)
+        # Average prices for trading that many units: buying drains the source, selling stocks the target;
+        # market shocks scale both ends
+        buy_prices = economy.fundamental_prices[source] * stock_factor(economy.quantities[source] - units / 2)
+        buy_prices *= economy.price_factors([source])[0]
+
+        if len(targets):
+            sell_prices = economy.fundamental_prices[targets] * stock_factor(economy.quantities[targets] + units / 2)
+            sell_prices *= economy.price_factors(targets)
+            gains = (sell_prices - buy_prices) * units
+            columns = gains.argmax(axis=1)
+            profits = np.maximum(gains[np.arange(len(targets)), columns], 0.0)
+        else:
+            columns = np.zeros(0, dtype=np.intp)
+            profits = np.zeros(0)
+        legs = (
+            [b for b, _ in neighbours],
+            profits.tolist(),
+            fuel.tolist(),
+            columns.tolist(),
+            units[columns].astype(np.int64).tolist()
+        )
+        self._legs[row] = legs
+        return legs
+
+    def _bound(self, row, hops, max_leg_fuel):
+        """Upper bound on the profit/fuel ratio of any leg within `hops` legs of planet `row`."""
+        key = (row, hops)
+        bound = self._bounds.get(key)
+        if bound is None:
+            bound = 0.0
+            for b, profit, fuel, _, _ in zip(*self.legs_from(row)):
+                if fuel <= max_leg_fuel:
+                    bound = max(bound, profit / fuel if fuel > 0 else float('inf'))
+                    if hops > 1:
+                        bound = max(bound, self._bound(b, hops - 1, max_leg_fuel))
+            self._bounds[key] = bound
+        return bound
+
+    def best_routes(self, start, capacity, credits=None, fuel_efficiency=1.0, max_leg_fuel=float('inf'), k=5, max_hops=4):
+        """
+        Top-k trade loops through `start`, by profit per unit of fuel.
+
+        Args:
+            start (Planet): Planet every loop starts and ends at
+            capacity (float): Cargo volume available for each leg
+            credits (float): Budget for each purchase, or None for no limit
+            fuel_efficiency (float): Fuel burnt per unit of distance
+            max_leg_fuel (float): Longest leg the ship can fly on one tank
+            k (int): Number of loops to return
+            max_hops (int): Most legs in a loop (at least 2: out and back)
+
+        Returns:
+            list: TradeRoute objects, best first; only loops that make a profit
+        """
+        self._refresh(capacity, credits, fuel_efficiency, max_leg_fuel)
+        origin = self.routes.row(start)
+        best = []  # min-heap of (ratio, profit, tiebreak, rows)
+        counter = 0
+
+        def threshold():
+            return best[0][0] if len(best) >= k else 0.0
+
+        # Iterative DFS; each frame is (row, path rows, profit so far, fuel so far)
+        stack = [(origin, [origin], 0.0, 0.0)]
+        while stack:
+            row, path, profit, fuel = stack.pop()
+            children = []
+            for b, leg_profit, leg_fuel, _, _ in zip(*self.legs_from(row)):
+                if leg_fuel > max_leg_fuel:
+                    continue
+                total_profit, total_fuel = profit + leg_profit, fuel + leg_fuel
+                ratio = total_profit / total_fuel if total_fuel > 0 else 0.0
+                if b == origin:
+                    if len(path) >= 2 and total_profit > 0 and ratio > threshold():
+                        counter += 1
+                        heapq.heappush(best, (ratio, total_profit, counter, path))
+                        if len(best) > k:
+                            heapq.heappop(best)
+                elif b not in path and len(path) < max_hops:
+                    # The loop still needs at least the legs to come back from b
+                    bound = max(ratio, self._bound(b, max_hops - len(path), max_leg_fuel))
+                    if bound > threshold():
+                        children.append((bound, b, total_profit, total_fuel))
+            # Most promising branch on top of the stack, so good loops raise the threshold early
+            for _, b, total_profit, total_fuel in sorted(children):
+                stack.append((b, path + [b], total_profit, total_fuel))
+
+        return [self._route(rows) for _, _, _, rows in sorted(best, reverse=True)]
+
+    def _route(self, rows):
+        planets = [self.routes.planets[row] for row in rows]
+        legs = []
+        for position, row in enumerate(rows):
+            target = rows[(position + 1) % len(rows)]
+            neighbours, profits, fuel, columns, units = self.legs_from(row)
+            # Parallel lanes between the same planets: take the best one
+            leg = max((i for i, b in enumerate(neighbours) if b == target), key=lambda i: profits[i] / max(fuel[i], 1e-9))
+            legs.append({
+                'source': planets[position],
+                'target': self.routes.planets[target],
+                'commodity': self.economy.commodity_names[columns[leg]] if profits[leg] > 0 else None,
+                'units': units[leg] if profits[leg] > 0 else 0,
+                'profit': profits[leg],
+                'fuel': fuel[leg]
+            })
+        return TradeRoute(planets, legs)
@@ -0,0 +1,90 @@
+import os
+import select
+import sys
+import time
+
+from rich.live import Live
+from rich.text import Text
+
+def wait_for_key(timeout):
+    """
+    Wait up to `timeout` seconds for the reader to press Enter (any key on Windows).
+
+    Returns:
+        bool: True if they did; the key press is consumed
+    """
+    if os.name == 'nt':
+        import msvcrt
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if msvcrt.kbhit():
+                msvcrt.getwch()
+                return True
+            time.sleep(0.01)
+        return False
+    ready, _, _ = select.select([sys.stdin], [], [], timeout)
+    if ready:
+        sys.stdin.readline()
+    return bool(ready)
+
+class Typewriter:
+    """
+    Types text out on the console, skippable at any time.
+
+    Text is revealed at `delay` seconds per character, but the console is
+    written once per frame (`fps` times a second) through a Rich Live
+    display, not once per character. Waiting for the next frame doubles
+    as polling for a key, so Enter (or Ctrl+C) shows the rest at once.
+
+    Typing only happens on an interactive terminal. With `delay` 0, a
+    console that is not a terminal (a headless NullConsole, output
+    captured by a test, a pipe) or stdin that is not a terminal, text is
+    printed straight away and nothing ever sleeps or waits for a key.
+
+    Args:
+        console: Rich console to print to
+        delay (float): Seconds per character; 0 turns typing off
+        fps (int): Console updates per second while typing
+    """
+
+    def __init__(self, console, delay=0.03, fps=30):
+        self.console = console
+        self.delay = delay
+        self.fps = fps
+        self.enabled = delay > 0 and getattr(console, 'is_terminal', False) and sys.stdin.isatty()
+
+    def type(self, text, style=""):
+        """
+        Type out one text.
+
+        Returns:
+            bool: True if the reader skipped to the end
+        """
+        if not self.enabled:
+            self.console.print(Text(text, style=style))
+            return False
+
+        shown = 0
+        skipped = False
+        start = time.monotonic()
+        with Live(Text("", style=style), console=self.console, auto_refresh=False) as live:
+            while shown < len(text):
+                try:
+                    skipped = wait_for_key(1 / self.fps)
+                except KeyboardInterrupt:
+                    skipped = True
+                if skipped:
+                    shown = len(text)
+                else:
+                    shown = min(len(text), int((time.monotonic() - start) / self.delay) + 1)
+                live.update(Text(text[:shown], style=style), refresh=True)
+        return skipped
+
+    def type_all(self, texts, style=""):
+        """Type out texts one after another; once the reader skips, the rest are printed at once."""
+        skipped = False
+        for text in texts:
+            if skipped:
+                self.console.print(Text(text, style=style))
+            else:
+                skipped = self.type(text, style)
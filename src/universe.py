@@ -1,22 +1,196 @@
-import random
+import math
 import json
-import networkx as nx
 import os
+import struct
+import numpy as np
+
+from src.quests import QuestPool
+from src.routes import RouteTable
+from src.rng import RandomContext
+from src.galaxy import (
+    GalaxyGenerator, PLANET_TYPES, STATUSES, CHARACTERISTICS, PLANET_CLASSES,
+    GEOLOGIES, CLIMATES, RESOURCE_TYPES
+)
+
+# Category lists per categorical planet attribute. Planets store an index into
+# these; values outside the generator's lists (e.g. "Frontier") are appended.
+CATEGORIES = {
+    'type': list(PLANET_TYPES),
+    'status': list(STATUSES),
+    'characteristics': list(CHARACTERISTICS),
+    'planet_class': list(PLANET_CLASSES),
+    'geology': list(GEOLOGIES),
+    'climate': list(CLIMATES)
+}
+CATEGORY_CODES = {field: {value: code for code, value in enumerate(values)} for field, values in CATEGORIES.items()}
+
+def category_code(field, value):
+    codes = CATEGORY_CODES[field]
+    if value not in codes:
+        codes[value] = len(CATEGORIES[field])
+        CATEGORIES[field].append(value)
+    return codes[value]
+
+# Planet history templates, picked per planet by its history seed. Only the
+# chosen template is formatted, and only when the history is actually read.
+HISTORY_TEMPLATES = [
+    "{name} was colonized by the first wave of interstellar explorers. Its {planet_type} environment made it a prime candidate for {characteristics} settlements. The planet is known for its {geology} landscapes and {climate} weather conditions. With a population of {population}, it has become a hub for {planet_class} activities.",
+    "{name} has a rich history of {status} conflicts. Its {planet_type} terrain and {geology} features have made it a strategic location for various factions. The planet's {climate} climate and {moons} moons add to its unique charm. With a population of {population}, it continues to be a center of {characteristics} interactions.",
+    "{name} was discovered during the great expansion era. Its {planet_type} resources and {geology} formations attracted early settlers. The planet's {climate} environment and {moons} moons have shaped its cultural identity. With a population of {population}, it remains a key player in interstellar {planet_class} trade.",
+    "{name} has always been a {characteristics} planet, known for its {planet_type} exports and {geology} landscapes. Its {climate} weather and {moons} moons have influenced its development. With a population of {population}, it continues to thrive as a {planet_class} colony.",
+    "{name} was once a {status} outpost, but its {planet_type} resources and {geology} features have transformed it into a bustling metropolis. The planet's {climate} climate and {moons} moons have contributed to its growth. With a population of {population}, it is now a major {planet_class} hub."
+]
+
+def render_history(seed, **fields):
+    """Render the history template selected by `seed` with the given planet fields."""
+    return HISTORY_TEMPLATES[seed % len(HISTORY_TEMPLATES)].format_map(fields)
 
 class Planet:
-    def __init__(self, name, planet_type, economy_level, resources, status, characteristics, demographics, planet_class, moons, geology, climate, history):
+    """
+    Compact planet record.
+
+    Everything except the name is packed into a single bytes field laid out by
+    `LAYOUT` (and the matching NumPy `DTYPE`, so whole galaxies can be packed
+    in one go). Categorical attributes are stored as codes into CATEGORIES,
+    `resources` and `demographics` are rebuilt as dicts when read, and
+    `history` is rendered from `history_seed` on demand unless explicit text
+    was given. Attribute access works as before; planets are read-only.
+    """
+
+    __slots__ = ('name', '_packed', '_history')
+
+    # economy_level, x, y, 6 category codes, moons, population, cyborgs,
+    # androids, robots, history_seed, one value per RESOURCE_TYPES (NaN = none)
+    LAYOUT = struct.Struct('<3d7BI3BI5f')
+    DTYPE = np.dtype([
+        ('economy_level', '<f8'), ('x', '<f8'), ('y', '<f8'),
+        ('type', 'u1'), ('status', 'u1'), ('characteristics', 'u1'),
+        ('planet_class', 'u1'), ('geology', 'u1'), ('climate', 'u1'), ('moons', 'u1'),
+        ('population', '<u4'), ('cyborgs', 'u1'), ('androids', 'u1'), ('robots', 'u1'),
+        ('history_seed', '<u4'), ('resources', '<f4', (len(RESOURCE_TYPES),))
+    ])
+
+    def __init__(self, name, planet_type, economy_level, resources, status, characteristics, demographics, planet_class, moons, geology, climate, history=None, coordinates=None, history_seed=0):
+        x, y = coordinates if coordinates is not None else (math.nan, math.nan)
         self.name = name
-        self.type = planet_type
-        self.economy_level = economy_level
-        self.resources = resources
-        self.status = status
-        self.characteristics = characteristics
-        self.demographics = demographics
-        self.planet_class = planet_class
-        self.moons = moons
-        self.geology = geology
-        self.climate = climate
-        self.history = history
+        self._packed = self.LAYOUT.pack(
+            economy_level, x, y,
+            category_code('type', planet_type),
+            category_code('status', status),
+            category_code('characteristics', characteristics),
+            category_code('planet_class', planet_class),
+            category_code('geology', geology),
+            category_code('climate', climate),
+            moons,
+            demographics['Population'], demographics['Cyborgs'], demographics['Androids'], demographics['Robots'],
+            history_seed,
+            *[resources.get(resource, math.nan) for resource in RESOURCE_TYPES]
+        )
+        self._history = history
+
+    @classmethod
+    def from_packed(cls, name, packed):
+        planet = cls.__new__(cls)
+        planet.name = name
+        planet._packed = packed
+        planet._history = None
+        return planet
+
+    def _fields(self):
+        return self.LAYOUT.unpack(self._packed)
+
+    @property
+    def economy_level(self):
+        return self._fields()[0]
+
+    @property
+    def coordinates(self):
+        x, y = self._fields()[1:3]
+        return None if math.isnan(x) else (x, y)
+
+    @property
+    def type(self):
+        return CATEGORIES['type'][self._fields()[3]]
+
+    @property
+    def status(self):
+        return CATEGORIES['status'][self._fields()[4]]
+
+    @property
+    def characteristics(self):
+        return CATEGORIES['characteristics'][self._fields()[5]]
+
+    @property
+    def planet_class(self):
+        return CATEGORIES['planet_class'][self._fields()[6]]
+
+    @property
+    def geology(self):
+        return CATEGORIES['geology'][self._fields()[7]]
+
+    @property
+    def climate(self):
+        return CATEGORIES['climate'][self._fields()[8]]
+
+    @property
+    def moons(self):
+        return self._fields()[9]
+
+    @property
+    def demographics(self):
+        population, cyborgs, androids, robots = self._fields()[10:14]
+        return {"Population": population, "Cyborgs": cyborgs, "Androids": androids, "Robots": robots}
+
+    @property
+    def history_seed(self):
+        return self._fields()[14]
+
+    @property
+    def resources(self):
+        values = self._fields()[15:]
+        return {resource: value for resource, value in zip(RESOURCE_TYPES, values) if not math.isnan(value)}
+
+    @property
+    def history(self):
+        if self._history is not None:
+            return self._history
+        fields = self._fields()
+        return render_history(
+            fields[14],
+            name=self.name,
+            planet_type=CATEGORIES['type'][fields[3]],
+            status=CATEGORIES['status'][fields[4]],
+            characteristics=CATEGORIES['characteristics'][fields[5]],
+            planet_class=CATEGORIES['planet_class'][fields[6]],
+            geology=CATEGORIES['geology'][fields[7]],
+            climate=CATEGORIES['climate'][fields[8]],
+            moons=fields[9],
+            population=fields[10]
+        )
+
+    @property
+    def custom_history(self):
+        # Explicit history text, or None when it is rendered from the seed
+        return self._history
+
+    def to_dict(self):
+        # Constructor arguments, e.g. for saving
+        return {
+            'name': self.name,
+            'planet_type': self.type,
+            'economy_level': self.economy_level,
+            'resources': self.resources,
+            'status': self.status,
+            'characteristics': self.characteristics,
+            'demographics': self.demographics,
+            'planet_class': self.planet_class,
+            'moons': self.moons,
+            'geology': self.geology,
+            'climate': self.climate,
+            'history': self._history,
+            'coordinates': self.coordinates,
+            'history_seed': self.history_seed
+        }
 
     def __repr__(self):
         return f"Planet({self.name})"
@@ -29,131 +203,191 @@ class Planet:
     def __hash__(self):
         return hash(self.name)
 
+def planets_from_table(names, table, histories=None):
+    """
+    Planet records for the rows of a `Planet.DTYPE` array.
+
+    Args:
+        names (list): Planet names, one per row
+        table (np.ndarray): Packed planet rows
+        histories (dict): Planet name -> explicit history text, if any
+    """
+    packed = table.tobytes()
+    size = Planet.DTYPE.itemsize
+    planets = [Planet.from_packed(name, packed[row * size:(row + 1) * size]) for row, name in enumerate(names)]
+    for planet in planets:
+        if histories and planet.name in histories:
+            planet._history = histories[planet.name]
+    return planets
+
+def planets_to_table(planets):
+    return np.frombuffer(b''.join(planet._packed for planet in planets), dtype=Planet.DTYPE)
+
+def planets_from_galaxy(galaxy):
+    """Pack a generated galaxy's columns into Planet records in one pass."""
+    table = np.zeros(len(galaxy), dtype=Planet.DTYPE)
+    for field, column in galaxy.columns.items():
+        table[field] = column
+    table['x'] = galaxy.coordinates[:, 0]
+    table['y'] = galaxy.coordinates[:, 1]
+    table['resources'] = galaxy.resources
+    return planets_from_table(galaxy.names, table)
+
 class UniverseGenerator:
-    def __init__(self, difficulty=2):
+    def __init__(self, difficulty=2, num_planets=None, seed=None, context=None):
         self.difficulty = difficulty
+        # Default galaxy size grows with difficulty; any size can be requested explicitly
+        self.num_planets = num_planets if num_planets is not None else 5 + (difficulty * 2)
+        # The game's RandomContext (a standalone one if generated on its own)
+        self.context = context if context is not None else RandomContext(seed)
+        self.seed = self.context.seed
+        self.rng = self.context.stream('universe')
         self.planets = []
-        self.trade_network = nx.Graph()
+        self._trade_network = None
         self.quests = []
         self.generate_universe()
         self.load_quests()
 
+    @classmethod
+    def restore(cls, difficulty, planets, lanes, context):
+        """
+        Rebuild a universe from saved planets and lanes without generating anything.
+
+        Args:
+            difficulty (int): Game difficulty
+            planets (list): Planet records, in route table order
+            lanes (tuple): Trade lanes as (sources, targets, distances) planet row arrays
+            context (RandomContext): The game's random streams, already restored
+        """
+        universe = cls.__new__(cls)
+        universe.difficulty = difficulty
+        universe.num_planets = len(planets)
+        universe.context = context
+        universe.seed = context.seed
+        universe.rng = context.stream('universe')
+        universe.planets = list(planets)
+        universe._trade_network = None
+        universe.galaxy = None
+        universe.routes = RouteTable.from_rows(universe.planets, *lanes)
+        universe.load_quests()
+        return universe
+
     def generate_universe(self):
-        planet_names = [
-            "New Terra", "Proxima", "Arcturus", "Orion Prime",
-            "Sigma Outpost", "Epsilon Station", "Nova Haven",
-            "Quantum Nexus", "Helios Prime", "Crimson Horizon"
-        ]
-        planet_types = [
-            "Desert", "Oceanic", "Industrial", "Agricultural",
-            "High-Tech", "Mining", "Trading Hub", "Research Colony"
-        ]
+        # Procedural, seeded galaxy: attributes, coordinates and lanes come as columns
+        self.galaxy = GalaxyGenerator(self.context.sequence('galaxy')).generate(self.num_planets)
+        self.planets.extend(planets_from_galaxy(self.galaxy))
 
-        # Generate planets based on difficulty
-        num_planets = 5 + (self.difficulty * 2)
-        for _ in range(num_planets):
-            # Ensure unique planet names
-            planet_name = random.choice(planet_names)
-            planet_names.remove(planet_name)
-
-            # Generate random status and characteristics
-            status = random.choice(["Stable", "Unstable", "War-torn"])
-            characteristics = random.choice(["Friendly", "Hostile", "Neutral"])
-
-            # Generate random demographics
-            demographics = {
-                "Population": random.randint(1000, 10000),
-                "Cyborgs": random.randint(1, 100),
-                "Androids": random.randint(1, 100),
-                "Robots": random.randint(1, 100)
-            }
-
-            # Generate additional attributes
-            planet_class = random.choice(["Terrestrial", "Gas Giant", "Ice World", "Asteroid Belt"])
-            moons = random.randint(0, 5)
-            geology = random.choice(["Rocky", "Volcanic", "Mountainous", "Flat"])
-            climate = random.choice(["Temperate", "Arid", "Frozen", "Harsh"])
-
-            # Generate planet type
-            planet_type = random.choice(planet_types)
-
-            # Generate history
-            history = self.generate_history(planet_name, planet_type, status, characteristics, demographics, planet_class, moons, geology, climate)
-
-            planet = Planet(
-                name=planet_name,
-                planet_type=planet_type,
-                economy_level=random.uniform(0.3, 1.0),
-                resources=self.generate_resources(),
-                status=status,
-                characteristics=characteristics,
-                demographics=demographics,
-                planet_class=planet_class,
-                moons=moons,
-                geology=geology,
-                climate=climate,
-                history=history
+        # Trade network lanes straight from the galaxy generator's spatial grid,
+        # with their shortest-path table
+        self.routes = RouteTable.from_rows(
+            self.planets, self.galaxy.lane_sources, self.galaxy.lane_targets, self.galaxy.lane_distances
+        )
+
+    @property
+    def trade_network(self):
+        # networkx view of the lanes, for analysis and plotting; the game itself
+        # only needs the route table, so networkx is imported on first use
+        if self._trade_network is None:
+            import networkx as nx
+            self._trade_network = nx.Graph()
+            self._trade_network.add_nodes_from(self.routes.planets)
+            self._trade_network.add_edges_from(
+                (self.routes.planets[a], self.routes.planets[b], {'distance': distance})
+                for a, neighbours in enumerate(self.routes.adjacency)
+                for b, distance in neighbours
+                if a < b
             )
-            self.planets.append(planet)
-
-        # Create trade network
-        self.create_trade_network()
-
-    def create_trade_network(self):
-        # Fully connect planets for simplicity
-        for planet in self.planets:
-            self.trade_network.add_node(planet)
-
-        for i in range(len(self.planets)):
-            for j in range(i+1, len(self.planets)):
-                # Add some randomness to connections
-                if random.random() > 0.3:
-                    self.trade_network.add_edge(
-                        self.planets[i],
-                        self.planets[j],
-                        distance=random.uniform(1, 10)
-                    )
+        return self._trade_network
 
-    def generate_resources(self):
-        # Align resource types with commodity types
-        resource_types = [
-            "raw_materials",
-            "agricultural_goods",
-            "technological_goods",
-            "luxury_goods",
-            "industrial_goods"
+    def unique_name(self, name):
+        if name not in self.routes.index:
+            return name
+        number = 2
+        while f"{name} {number}" in self.routes.index:
+            number += 1
+        return f"{name} {number}"
+
+    def create_frontier_planet(self, origin):
+        """Discover a new frontier planet within jump range of `origin` and link it in."""
+        frontier_planet_names = [
+            "Frontier Asteroid Belt",
+            "Frontier Base",
+            "Frontier Outpost",
+            "Frontier Colony"
         ]
+        frontier_planet_name = self.unique_name(self.rng.choice(frontier_planet_names))
+        demographics = {
+            "Population": self.rng.randint(1000, 10000),
+            "Cyborgs": self.rng.randint(1, 100),
+            "Androids": self.rng.randint(1, 100),
+            "Robots": self.rng.randint(1, 100)
+        }
+
+        # Place it a jump away from where the ship is
+        jump_distance = self.rng.uniform(1, 10)
+        angle = self.rng.uniform(0, 2 * math.pi)
+        coordinates = None
+        if origin.coordinates is not None:
+            coordinates = (origin.coordinates[0] + jump_distance * math.cos(angle),
+                           origin.coordinates[1] + jump_distance * math.sin(angle))
+
+        frontier_planet = Planet(
+            name=frontier_planet_name,
+            planet_type="Frontier",
+            economy_level=self.rng.uniform(0.3, 1.0),
+            resources=self.generate_resources(),
+            status="Stable",
+            characteristics="Neutral",
+            demographics=demographics,
+            planet_class="Asteroid Belt",
+            moons=0,
+            geology="Rocky",
+            climate="Harsh",
+            coordinates=coordinates,
+            # History text is rendered from the seed when the spaceport is scanned
+            history_seed=self.rng.randrange(2 ** 32)
+        )
+        return self.add_planet(frontier_planet, {origin: jump_distance})
 
-        # Randomly select 3-4 resources and assign them a value
-        selected_resources = random.sample(resource_types, random.randint(3, 4))
+    def add_planet(self, planet, links):
+        """
+        Add a planet to the universe, linked into the trade network.
+
+        Args:
+            planet (Planet): The new planet
+            links (dict): Existing planet -> travel distance
+
+        Returns:
+            Planet: The planet now in the universe (an existing one if the name is taken)
+        """
+        if planet.name in self.routes.index:
+            return self.routes.planets[self.routes.index[planet.name]]
+
+        self.planets.append(planet)
+        if self._trade_network is not None:
+            self._trade_network.add_node(planet)
+            for other, distance in links.items():
+                self._trade_network.add_edge(planet, other, distance=distance)
+        self.routes.add_planet(planet, links)
+        return planet
+
+    def generate_resources(self):
+        # Randomly select 3-4 resources (aligned with commodity types) and assign them a value
+        selected_resources = self.rng.sample(RESOURCE_TYPES, self.rng.randint(3, 4))
         return {
-            resource: random.uniform(0.1, 1.0)
+            resource: self.rng.uniform(0.1, 1.0)
             for resource in selected_resources
         }
 
-    def generate_history(self, name, planet_type, status, characteristics, demographics, planet_class, moons, geology, climate):
-        # Generate a creative and interesting history for the planet
-        history_templates = [
-            f"{name} was colonized by the first wave of interstellar explorers. Its {planet_type} environment made it a prime candidate for {characteristics} settlements. The planet is known for its {geology} landscapes and {climate} weather conditions. With a population of {demographics['Population']}, it has become a hub for {planet_class} activities.",
-            f"{name} has a rich history of {status} conflicts. Its {planet_type} terrain and {geology} features have made it a strategic location for various factions. The planet's {climate} climate and {moons} moons add to its unique charm. With a population of {demographics['Population']}, it continues to be a center of {characteristics} interactions.",
-            f"{name} was discovered during the great expansion era. Its {planet_type} resources and {geology} formations attracted early settlers. The planet's {climate} environment and {moons} moons have shaped its cultural identity. With a population of {demographics['Population']}, it remains a key player in interstellar {planet_class} trade.",
-            f"{name} has always been a {characteristics} planet, known for its {planet_type} exports and {geology} landscapes. Its {climate} weather and {moons} moons have influenced its development. With a population of {demographics['Population']}, it continues to thrive as a {planet_class} colony.",
-            f"{name} was once a {status} outpost, but its {planet_type} resources and {geology} features have transformed it into a bustling metropolis. The planet's {climate} climate and {moons} moons have contributed to its growth. With a population of {demographics['Population']}, it is now a major {planet_class} hub."
-        ]
-        return random.choice(history_templates)
+    def generate_history(self, name, planet_type, status, characteristics, demographics, planet_class, moons, geology, climate, seed=None):
+        if seed is None:
+            seed = self.rng.randrange(2 ** 32)
+        return render_history(seed, name=name, planet_type=planet_type, status=status, characteristics=characteristics,
+                              planet_class=planet_class, moons=moons, geology=geology, climate=climate,
+                              population=demographics['Population'])
 
     def load_quests(self):
-        # Load quests from the external JSON file
+        # Load quest templates from the external JSON file into a bounded offer pool
         with open(os.path.join(os.path.dirname(__file__), '../data/quests.json'), 'r') as file:
             quest_data = json.load(file)
-            self.quests = quest_data['quests']
-
-    def generate_random_quest(self):
-        # Generate a random quest at the start of each player turn
-        num_quests = max(1, min(4, self.player.level // 3))  # Adjust the number of quests based on the player's level
-        random_quests = random.sample(self.quests, min(num_quests, len(self.quests)))
-        for quest in random_quests:
-            self.console.print(f"\n[bold yellow]New Quest Available:[/bold yellow]")
-            self.console.print(f"{quest['description']}")
-            self.console.print(f"Backstory: {quest['backstory']}")
-            self.quests.append(quest)
+            self.quests = QuestPool(quest_data['quests'], rng=self.context.stream('quests'))
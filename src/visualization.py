@@ -1,5 +1,5 @@
-import plotly.express as px
-
 def visualize_market_trends(data):
+    # plotly is slow to import and only needed when a chart is shown
+    import plotly.express as px
     fig = px.line(data, x='time', y='price', color='commodity')
     fig.show()
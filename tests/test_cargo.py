@@ -0,0 +1,73 @@
+import pytest
+
+from src.cargo import CargoHold
+
+def test_restore_keeps_saved_costs_exact():
+    hold = CargoHold(capacity=1000)
+    saved = {
+        'Minerals': {'quantity': 3, 'buy_price': 497.87, 'volume_per_unit': 2.5},
+        'Rare Metals': {'quantity': 7, 'buy_price': 0.1, 'volume_per_unit': 1.0}
+    }
+    hold.restore(saved)
+    assert hold.state() == saved
+
+def check_invariants(hold):
+    """slot_of and the lot arrays agree, and `used` is the volume of what is held."""
+    ids = hold.ids[:hold.count].tolist()
+    assert len(set(ids)) == hold.count
+    for slot, commodity_id in enumerate(ids):
+        assert hold.slot_of[commodity_id] == slot
+        assert hold.quantities[slot] > 0
+    assert (hold.slot_of >= 0).sum() == hold.count
+    expected = sum(hold.quantities[slot] * hold.registry.volumes[commodity_id] for slot, commodity_id in enumerate(ids))
+    assert abs(hold.used - expected) < 1e-6
+    assert hold.used <= hold.capacity + 1e-9
+
+def test_remove_moves_the_last_lot_into_the_gap():
+    hold = CargoHold(capacity=1000)
+    names = hold.registry.names[:4]
+    hold.add_many([(name, 2, 10.0 * (i + 1)) for i, name in enumerate(names)])
+
+    assert hold.remove(names[0], 2) == 10.0
+    assert hold.keys() == [names[3], names[1], names[2]]
+    assert hold[names[3]]['buy_price'] == 40.0
+    assert names[0] not in hold
+    check_invariants(hold)
+
+    # Emptying several lots at once, including the last slot
+    hold.remove_many([(names[2], 2), (names[3], 1), (names[3], 1)])
+    assert hold.keys() == [names[1]]
+    check_invariants(hold)
+
+    hold.remove(names[1], 2)
+    assert len(hold) == 0 and hold.used == 0.0
+    check_invariants(hold)
+
+def test_add_averages_cost_and_grows_past_initial_size():
+    hold = CargoHold(capacity=10000, size=2)
+    names = hold.registry.names[:5]
+    for name in names:
+        hold.add(name, 1, 100.0)
+    hold.add(names[0], 3, 200.0)
+
+    assert len(hold) == 5
+    assert hold[names[0]] == {'quantity': 4, 'buy_price': 175.0, 'volume_per_unit': float(hold.registry.volumes[0])}
+    check_invariants(hold)
+
+def test_failed_operations_leave_the_hold_unchanged():
+    hold = CargoHold(capacity=10)
+    name = hold.registry.names[0]
+    volume = float(hold.registry.volumes[0])
+    fits = int(10 // volume)
+    hold.add(name, fits, 50.0)
+    before = hold.state()
+
+    for operation in (lambda: hold.add(name, 1, 50.0),
+                      lambda: hold.add_many([(hold.registry.names[1], 1, 1.0), (name, fits, 1.0)]),
+                      lambda: hold.remove(name, fits + 1),
+                      lambda: hold.remove_many([(name, 1), ('Unobtainium', 1)]),
+                      lambda: hold.add(name, 0, 1.0)):
+        with pytest.raises(ValueError):
+            operation()
+        assert hold.state() == before
+        check_invariants(hold)
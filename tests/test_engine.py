@@ -0,0 +1,50 @@
+import pytest
+
+from src.engine import GameEngine
+
+# The player attribute each ship component improves
+EFFECTS = {
+    "Cargo Capacity": 'cargo_capacity',
+    "Fuel Efficiency": 'ship_fuel_efficiency',
+    "Ship Speed": 'ship_speed',
+    "Life Support": 'life_support_expansion',
+    "Radiation Shield": 'radiation_shield',
+    "Business Class Module": 'business_class_module'
+}
+
+def new_game():
+    engine = GameEngine(seed=1)
+    engine.start()
+    return engine
+
+@pytest.mark.parametrize('component, price', GameEngine.SHIP_COMPONENTS)
+def test_install_component(component, price):
+    engine = new_game()
+    engine.player.credits = 10000
+    before = getattr(engine.player, EFFECTS[component])
+
+    assert engine.install_component(component)
+    assert engine.player.credits == 10000 - price
+    assert getattr(engine.player, EFFECTS[component]) > before
+
+def test_install_component_needs_credits():
+    engine = new_game()
+    engine.player.credits = 100
+    assert not engine.install_component("Ship Speed")
+    assert engine.player.credits == 100
+    assert engine.player.ship_speed == 1.0
+
+def test_refuel_fills_the_tank():
+    engine = new_game()
+    engine.player.fuel_level = 40
+    credits = engine.player.credits
+
+    assert engine.refuel()
+    assert engine.player.fuel_level == engine.player.fuel_tank_capacity
+    assert engine.player.credits < credits
+    assert 'Fuel' not in engine.player.inventory
+
+def test_refuel_needs_room_in_the_tank():
+    engine = new_game()
+    engine.player.fuel_level = engine.player.fuel_tank_capacity
+    assert not engine.refuel()
@@ -0,0 +1,79 @@
+import os
+
+from src import savegame
+from src.engine import GameEngine
+from src.journal import ActionJournal
+from src.simulation import GreedyTraderPolicy
+
+def end_turn(engine):
+    engine.scheduler.run_turn(engine.scheduler.request_end_turn)
+
+def journaled_game(path, turns=10, snapshot_interval=20):
+    engine = GameEngine(seed=3)
+    engine.start()
+    engine.player.fuel_level = 10000
+    journal = ActionJournal(str(path), snapshot_interval=snapshot_interval)
+    journal.attach(engine)
+    policy = GreedyTraderPolicy()
+    for _ in range(turns):
+        engine.scheduler.run_turn(lambda: policy.play_turn(engine), max_actions=5)
+    return engine, journal
+
+def recovered(path):
+    engine = GameEngine(seed=99)
+    savegame.load_game(engine, str(path))
+    ActionJournal.replay(engine, str(path))
+    return engine
+
+def assert_same_game(recovered_engine, engine):
+    assert recovered_engine.turn == engine.turn
+    assert recovered_engine.current_planet.name == engine.current_planet.name
+    assert savegame.player_state(recovered_engine.player) == savegame.player_state(engine.player)
+    assert recovered_engine.player.ledger.rows() == engine.player.ledger.rows()
+    assert [planet.name for planet in recovered_engine.universe.planets] == [planet.name for planet in engine.universe.planets]
+    assert list(recovered_engine.universe.quests) == list(engine.universe.quests)
+
+def test_recovers_actions_since_the_snapshot(tmp_path):
+    path = tmp_path / 'autosave.sav'
+    engine, journal = journaled_game(path)
+    engine.scheduler.step()  # start of the next turn
+    engine.frontier_jump()
+    quests = engine.available_quests()
+    if quests:
+        engine.accept_quest(quests[0])
+    engine.set_trade_route([engine.universe.planets[0], engine.universe.planets[2]])
+
+    assert ActionJournal.pending(str(path))
+    assert_same_game(recovered(path), engine)
+
+def test_recovers_the_turn_after_turns_without_actions(tmp_path):
+    path = tmp_path / 'autosave.sav'
+    engine, journal = journaled_game(path)
+    for _ in range(2):
+        end_turn(engine)
+    assert recovered(path).turn == engine.turn
+
+def test_replaying_twice_is_harmless(tmp_path):
+    path = tmp_path / 'autosave.sav'
+    engine, journal = journaled_game(path)
+    twice = recovered(path)
+    ActionJournal.replay(twice, str(path))
+    assert_same_game(twice, engine)
+
+def test_snapshots_start_the_journal_over(tmp_path):
+    path = tmp_path / 'autosave.sav'
+    engine, journal = journaled_game(path, turns=0, snapshot_interval=3)
+    for _ in range(4):
+        end_turn(engine)
+    engine.scheduler.step()  # turn 4 starts after the snapshot at turn 3
+    with open(journal.journal_path) as file:
+        entries = file.read().splitlines()
+    assert journal.entries == len(entries) == 2
+    assert_same_game(recovered(path), engine)
+
+def test_clean_exit_removes_the_autosave(tmp_path):
+    path = tmp_path / 'autosave.sav'
+    engine, journal = journaled_game(path, turns=1)
+    journal.close(remove=True)
+    assert not os.path.exists(path)
+    assert not ActionJournal.pending(str(path))
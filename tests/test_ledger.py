@@ -0,0 +1,69 @@
+import numpy as np
+
+from src.commodities import CommodityRegistry
+from src.ledger import BUY, SELL, RunningTotals, TradeLedger
+
+def test_running_totals_rescan_when_leader_drops():
+    totals = RunningTotals()
+    totals.add('a', 10.0)
+    totals.add('b', 6.0)
+    assert totals.best() == ('a', 10.0)
+    totals.add('a', -8.0)
+    assert totals.best() == ('b', 6.0)
+
+def test_running_totals_empty():
+    assert RunningTotals().best() is None
+
+def test_aggregates_follow_fills():
+    registry = CommodityRegistry.load()
+    grain, ore = registry.names[0], registry.names[1]
+    ledger = TradeLedger(registry)
+
+    ledger.record(1, 'Alpha', grain, 10, 5.0, BUY)
+    ledger.record(2, 'Beta', grain, 10, 8.0, SELL, pnl=30.0)
+    ledger.record(3, 'Beta', ore, 4, 10.0, BUY)
+    ledger.record(4, 'Gamma', ore, 4, 9.0, SELL, pnl=-4.0)
+
+    assert len(ledger) == 4
+    assert ledger.spent == 90.0
+    assert ledger.earned == 116.0
+    assert ledger.realized == 26.0
+    assert ledger.best_good() == (grain, 30.0)
+    assert ledger.best_planet() == ('Beta', 30.0)
+    assert ledger.best_route() == ('Alpha → Beta', 30.0)
+
+def test_columns_grow_and_rows_read_back():
+    registry = CommodityRegistry.load()
+    ledger = TradeLedger(registry, size=2)
+    for turn in range(5):
+        ledger.record(turn, 'Alpha', registry.names[0], turn + 1, 2.0, BUY)
+
+    assert len(ledger) == 5
+    assert [row['quantity'] for row in ledger.rows()] == [1, 2, 3, 4, 5]
+    assert [row['turn'] for row in ledger.recent(2)] == [3, 4]
+    assert ledger.rows(4)[0] == {
+        'id': 5, 'turn': 4, 'planet': 'Alpha', 'good': registry.names[0], 'side': 'buy',
+        'quantity': 5, 'price_per_unit': 2.0, 'total': 10.0, 'pnl': 0.0
+    }
+
+def test_restore_rebuilds_aggregates_and_drops_unknown_commodities():
+    registry = CommodityRegistry.load()
+    grain = registry.names[0]
+    ledger = TradeLedger(registry)
+    ledger.record(1, 'Alpha', grain, 10, 5.0, BUY)
+    ledger.record(2, 'Beta', grain, 10, 8.0, SELL, pnl=30.0)
+
+    # The save's catalogue had an extra commodity in front, since removed
+    arrays = {name: column.copy() for name, column in ledger.arrays().items()}
+    arrays['commodities'] += 1
+    arrays = {name: np.concatenate([column, column[:1]]) for name, column in arrays.items()}
+    arrays['commodities'][-1] = 0
+    commodity_names = ['Retired Good'] + list(registry.names)
+
+    restored = TradeLedger(registry)
+    restored.restore(arrays, ledger.planet_names, commodity_names)
+
+    assert len(restored) == 2
+    assert restored.rows() == ledger.rows()
+    assert restored.realized == ledger.realized
+    assert restored.best_route() == ('Alpha → Beta', 30.0)
@@ -0,0 +1,60 @@
+import random
+
+from src.quests import QuestPool
+
+def new_pool(templates=10, capacity=4, lifetime=3):
+    return QuestPool([{'name': f"Quest {i}"} for i in range(templates)], capacity, lifetime, rng=random.Random(1))
+
+def check_indexes(pool):
+    """The dense id list, its positions and the template index all describe the offers."""
+    assert sorted(pool._ids) == sorted(pool.offers)
+    for position, quest_id in enumerate(pool._ids):
+        assert pool._positions[quest_id] == position
+    assert pool._offered_templates == {quest['template']: quest_id for quest_id, quest in pool.offers.items()}
+
+def test_capacity_drops_the_oldest_offer():
+    pool = new_pool()
+    first = [pool.add(template, turn=0) for template in range(4)]
+    newest = pool.add(4, turn=1)
+
+    assert len(pool) == 4
+    assert first[0]['id'] not in pool
+    assert [quest['id'] for quest in pool] == [quest['id'] for quest in first[1:]] + [newest['id']]
+    # The dropped quest's template can be offered again
+    assert pool.add(0, turn=1) is not None
+    check_indexes(pool)
+
+def test_template_is_never_offered_twice():
+    pool = new_pool(templates=3)
+    assert pool.add(1, turn=0) is not None
+    assert pool.add(1, turn=0) is None
+    offered = pool.generate(5, turn=0)
+    assert sorted(quest['template'] for quest in offered) == [0, 2]
+    assert pool.generate(5, turn=0) == []
+
+def test_expire_empties_each_turns_bucket():
+    pool = new_pool(capacity=10)
+    early = pool.add(0, turn=0)   # expires on turn 3
+    later = pool.add(1, turn=2)   # expires on turn 5
+    accepted = pool.add(2, turn=0)
+    assert pool.accept(accepted['id']) == accepted
+
+    assert pool.expire(2) == []
+    # The accepted quest's stale bucket entry is skipped
+    assert pool.expire(3) == [early]
+    assert list(pool) == [later]
+    check_indexes(pool)
+
+    # Skipping turns still expires every bucket in between, once
+    assert pool.expire(10) == [later]
+    assert pool.expire(10) == []
+    assert not pool._expiry and len(pool) == 0
+
+def test_removal_keeps_sampling_dense():
+    pool = new_pool(capacity=10)
+    quests = [pool.add(template, turn=0) for template in range(6)]
+    pool.remove(quests[0]['id'])
+    pool.remove(quests[3]['id'])
+    check_indexes(pool)
+
+    assert {quest['id'] for quest in pool.sample(10)} == set(pool.offers)
@@ -0,0 +1,56 @@
+import random
+from collections import namedtuple
+
+import numpy as np
+import pytest
+
+from src.routes import RouteTable
+
+Stop = namedtuple('Stop', 'name')
+
+def galaxy(size, seed):
+    """Random connected lanes: a spanning tree plus a few shortcuts."""
+    rng = random.Random(seed)
+    planets = [Stop(f"P{i}") for i in range(size)]
+    edges = [(planets[i], planets[rng.randrange(i)], rng.uniform(1, 20)) for i in range(1, size)]
+    edges += [(planets[rng.randrange(size)], planets[rng.randrange(size)], rng.uniform(1, 20)) for _ in range(size // 3)]
+    return planets, [(a, b, distance) for a, b, distance in edges if a is not b]
+
+def all_distances(table):
+    return np.array([[table.distance(a, b) for b in table.planets] for a in table.planets])
+
+def route_length(table, start, target):
+    route = table.route(start, target)
+    return sum(table.distance(a, b) for a, b in zip(route, route[1:]))
+
+@pytest.mark.parametrize('eager_limit', [256, 0])
+@pytest.mark.parametrize('shortcut', [False, True])
+def test_add_planet_matches_full_recompute(eager_limit, shortcut):
+    planets, edges = galaxy(30, seed=7)
+    table = RouteTable(planets, edges, eager_limit=eager_limit)
+    # Warm the lazy column cache so the in-place update has something to keep or drop
+    for planet in planets[:5]:
+        table.distances_from(planet)
+
+    new = Stop("New")
+    links = {planets[3]: 1.5, planets[20]: 2.0} if shortcut else {planets[12]: 4.0}
+    table.add_planet(new, links)
+
+    full = RouteTable(planets + [new], edges + [(new, other, distance) for other, distance in links.items()],
+                      eager_limit=eager_limit)
+    assert table.index == full.index
+    np.testing.assert_allclose(all_distances(table), all_distances(full))
+    for start in (new, planets[0], planets[3]):
+        for target in table.planets:
+            assert route_length(table, start, target) == pytest.approx(table.distance(start, target))
+
+def test_add_planet_past_eager_limit_switches_to_lazy():
+    planets, edges = galaxy(8, seed=3)
+    table = RouteTable(planets, edges, eager_limit=8)
+    assert table.eager
+
+    new = Stop("New")
+    table.add_planet(new, {planets[0]: 3.0, planets[5]: 1.0})
+    full = RouteTable(planets + [new], edges + [(new, planets[0], 3.0), (new, planets[5], 1.0)])
+    assert not table.eager
+    np.testing.assert_allclose(all_distances(table), all_distances(full))
@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+from src import savegame
+from src.engine import GameEngine
+from src.simulation import GreedyTraderPolicy
+from src.universe import CATEGORIES, planets_to_table
+
+def end_turn(engine):
+    engine.scheduler.run_turn(engine.scheduler.request_end_turn)
+
+def played_game(seed=7, turns=6):
+    engine = GameEngine(seed=seed)
+    engine.start()
+    engine.player.fuel_level = 10000
+    policy = GreedyTraderPolicy()
+    for _ in range(turns):
+        engine.scheduler.run_turn(lambda: policy.play_turn(engine), max_actions=5)
+    engine.frontier_jump()
+    end_turn(engine)
+    return engine
+
+def quest_board(engine):
+    return [(quest['id'], quest['template'], quest['expires_turn']) for quest in engine.universe.quests]
+
+@pytest.mark.parametrize('compress', [False, True])
+def test_round_trip(tmp_path, compress):
+    engine = played_game()
+    filename = tmp_path / 'game.sav'
+    savegame.save_game(engine, filename, compress=compress)
+
+    loaded = GameEngine(seed=99)
+    savegame.load_game(loaded, filename)
+
+    assert loaded.turn == engine.turn
+    assert loaded.current_planet.name == engine.current_planet.name
+    assert savegame.player_state(loaded.player) == savegame.player_state(engine.player)
+    assert [planet.to_dict() for planet in loaded.universe.planets] == [planet.to_dict() for planet in engine.universe.planets]
+    assert loaded.economy.planet_names == engine.economy.planet_names
+    for name in ('prices', 'fundamental_prices', 'quantities', 'resource_multipliers', 'supply'):
+        np.testing.assert_array_equal(getattr(loaded.economy, name), getattr(engine.economy, name))
+    assert loaded.player.ledger.rows() == engine.player.ledger.rows()
+    assert quest_board(loaded) == quest_board(engine)
+    assert loaded.event_generator.active_events() == engine.event_generator.active_events()
+
+def test_loaded_game_carries_on_like_the_original(tmp_path):
+    engine = played_game()
+    filename = tmp_path / 'game.sav'
+    savegame.save_game(engine, filename)
+    loaded = GameEngine(seed=99)
+    savegame.load_game(loaded, filename)
+
+    # Quest offers, events and the market all draw from the restored random streams
+    for _ in range(12):
+        end_turn(engine)
+        end_turn(loaded)
+    assert quest_board(loaded) == quest_board(engine)
+    np.testing.assert_array_equal(loaded.economy.prices, engine.economy.prices)
+
+def test_category_codes_are_remapped(tmp_path):
+    engine = played_game()
+    metadata, arrays = savegame.decode(savegame.encode(engine))
+    table = planets_to_table(engine.universe.routes.planets)
+
+    # A saver whose planet type list was in the reverse order
+    saved_types = list(reversed(CATEGORIES['type']))
+    metadata['categories'] = dict(metadata['categories'], type=saved_types)
+    saved_codes = np.array([saved_types.index(value) for value in CATEGORIES['type']], dtype=np.uint8)
+    table = table.copy()
+    table['type'] = saved_codes[table['type']]
+
+    planets = savegame.restore_planets(metadata, table)
+    assert [planet.type for planet in planets] == [planet.type for planet in engine.universe.routes.planets]
+
+def test_rejects_other_files(tmp_path):
+    filename = tmp_path / 'not_a_save.sav'
+    filename.write_bytes(b'hello world')
+    with pytest.raises(savegame.SaveFormatError):
+        savegame.load_game(GameEngine(), filename)
+
+def test_rejects_newer_versions(tmp_path):
+    filename = tmp_path / 'future.sav'
+    savegame.save_game(played_game(turns=1), filename)
+    data = bytearray(filename.read_bytes())
+    savegame.HEADER.pack_into(data, 0, savegame.MAGIC, savegame.VERSION + 1, 0)
+    filename.write_bytes(bytes(data))
+    with pytest.raises(savegame.SaveFormatError):
+        savegame.load_game(GameEngine(), filename)
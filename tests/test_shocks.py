@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from src.economy import MarketShocks
+
+def test_shock_fades_linearly_and_expires():
+    shocks = MarketShocks()
+    shock_id = shocks.add(0.5, 4, rows=[2], columns=[1])
+
+    factors = []
+    for _ in range(4):
+        factors.append(shocks.factor(2, 1))
+        shocks.advance()
+    assert factors == pytest.approx([0.5, 0.625, 0.75, 0.875])
+    # Faded out on its last tick and gone from every index
+    assert len(shocks) == 0
+    assert shock_id not in shocks.active and 2 not in shocks.by_planet
+    assert shocks.factor(2, 1) == 1.0
+
+def test_shock_only_covers_its_cells():
+    shocks = MarketShocks()
+    shocks.add(2.0, 10, rows=[0, 3], columns=[1, 2])
+    shocks.add(1.5, 10)
+
+    assert shocks.factor(0, 1) == pytest.approx(3.0)
+    assert shocks.factor(0, 0) == pytest.approx(1.5)
+    assert shocks.factor(1, 1) == pytest.approx(1.5)
+    np.testing.assert_allclose(shocks.row_factors(3, 4), [1.5, 3.0, 3.0, 1.5])
+
+    prices = shocks.apply(np.ones((4, 4)))
+    for row in range(4):
+        np.testing.assert_allclose(prices[row], [shocks.factor(row, column) for column in range(4)])
+
+def test_shocks_expire_in_end_tick_order():
+    shocks = MarketShocks()
+    shocks.add(2.0, 5, rows=[0])   # ends at tick 5
+    shocks.advance()
+    shocks.add(2.0, 2, rows=[0])   # ends at tick 3
+    shocks.add(0.8, 3)             # ends at tick 4
+
+    assert [shocks.advance() for _ in range(5)] == [0, 1, 1, 1, 0]
+    assert not shocks.active and not shocks.by_planet and not shocks.everywhere
+
+def test_removed_shock_is_skipped_at_expiry():
+    shocks = MarketShocks()
+    shock_id = shocks.add(2.0, 2, rows=[1])
+    shocks.remove(shock_id)
+    assert shocks.row_factors(1, 3) is None
+    assert shocks.advance() == 0 and shocks.advance() == 0
+
+def test_restore_resumes_the_fade():
+    shocks = MarketShocks()
+    shocks.add(0.5, 4, rows=[2], columns=[1])
+    shocks.advance()
+    restored = MarketShocks()
+    restored.restore(shocks.state())
+
+    assert restored.factor(2, 1) == pytest.approx(shocks.factor(2, 1))
+    assert [restored.advance() for _ in range(3)] == [0, 0, 1]